@@ -0,0 +1,281 @@
+"""
+Alcanzabilidad.py
+
+Índice de alcanzabilidad para grafos demasiado grandes para guardar el
+cierre transitivo completo de Warshall.py (n^2 bits).
+
+1) Las componentes fuertemente conexas se condensan con
+   Warshall.componentes_fuertes: dentro de una componente todo se alcanza.
+2) Sobre el DAG de componentes se hacen varios recorridos en profundidad
+   con el orden de los hijos al azar. El primero define un árbol de
+   expansión con intervalos [pre, post]: si el intervalo de v cae dentro del
+   de u, u alcanza v (respuesta positiva inmediata). Cada recorrido da además
+   una etiqueta [lo, hi] que contiene las etiquetas de todos los
+   descendientes: si la de v no cabe en la de u, u no alcanza v (respuesta
+   negativa inmediata). El orden topológico de Tarjan descarta más casos.
+3) Lo que no deciden las etiquetas se resuelve con una búsqueda en
+   profundidad que poda con las mismas etiquetas.
+
+La semántica es la de Warshall.warshall: alcanzable(u, u) solo es True si u
+está en un ciclo. Las etiquetas ocupan O(n) y admiten inserción de aristas;
+una arista que cierra un ciclo reconstruye el índice.
+"""
+
+import random
+
+import numpy as np
+
+from Warshall import componentes_fuertes, sucesores_desde_matriz
+
+ETIQUETADOS = 2
+
+class IndiceAlcanzabilidad:
+    def __init__(self, sucesores, etiquetados=ETIQUETADOS, semilla=0):
+        """sucesores: lista con los sucesores (índices 0..n-1) de cada nodo."""
+        self.sucesores = [list(s) for s in sucesores]
+        self.etiquetados = etiquetados
+        self.semilla = semilla
+        self.reconstruir()
+
+    @classmethod
+    def desde_matriz(cls, A, **opciones):
+        """Índice a partir de una matriz de adyacencia 0/1 como la de Warshall.warshall."""
+        return cls(sucesores_desde_matriz(A), **opciones)
+
+    # -------------------------
+    # Construcción
+    # -------------------------
+    def reconstruir(self):
+        comp, componentes = componentes_fuertes(self.sucesores)
+        nc = len(componentes)
+        dag = [set() for _ in range(nc)]
+        ciclico = [len(m) > 1 for m in componentes]
+        for v, sucs in enumerate(self.sucesores):
+            cv = comp[v]
+            for w in sucs:
+                cw = comp[w]
+                if cw != cv:
+                    dag[cv].add(cw)
+                elif v == w:
+                    ciclico[cv] = True
+        self.comp = comp
+        self.n_componentes = nc
+        self.dag = [list(h) for h in dag]
+        self.padres = [[] for _ in range(nc)]
+        for c, hijos in enumerate(self.dag):
+            for h in hijos:
+                self.padres[h].append(c)
+        self.ciclico = ciclico
+        # Tarjan numera en orden topológico inverso: c solo alcanza componentes < c
+        self.orden_valido = True
+
+        rnd = random.Random(self.semilla)
+        self.pre, self.post, lo, hi = self._recorrido(rnd, con_arbol=True)
+        self.etiquetas = [(lo, hi)]
+        for _ in range(self.etiquetados - 1):
+            _, _, lo, hi = self._recorrido(rnd)
+            self.etiquetas.append((lo, hi))
+        self._arrays = None
+
+    def _recorrido(self, rnd, con_arbol=False):
+        """DFS con hijos en orden aleatorio; devuelve (pre, post, lo, hi)."""
+        nc = self.n_componentes
+        pre = [-1] * nc if con_arbol else None
+        post = [-1] * nc
+        lo = [0] * nc
+        raices = list(range(nc))
+        rnd.shuffle(raices)
+        reloj_pre = reloj_post = 0
+        for r in raices:
+            if post[r] != -1:
+                continue
+            if con_arbol:
+                pre[r] = reloj_pre
+                reloj_pre += 1
+            post[r] = -2  # en curso
+            hijos = self.dag[r][:]
+            rnd.shuffle(hijos)
+            pila = [(r, iter(hijos))]
+            while pila:
+                x, it = pila[-1]
+                for h in it:
+                    if post[h] == -1:
+                        if con_arbol:
+                            pre[h] = reloj_pre
+                            reloj_pre += 1
+                        post[h] = -2
+                        nietos = self.dag[h][:]
+                        rnd.shuffle(nietos)
+                        pila.append((h, iter(nietos)))
+                        break
+                else:
+                    pila.pop()
+                    post[x] = reloj_post
+                    # en un DAG todos los hijos ya terminaron
+                    lo[x] = min([reloj_post] + [lo[h] for h in self.dag[x]])
+                    reloj_post += 1
+        return pre, post, lo, list(post)
+
+    # -------------------------
+    # Consultas
+    # -------------------------
+    def _descartado(self, cu, cv):
+        """True si las etiquetas garantizan que cu no alcanza cv."""
+        if self.orden_valido and cv > cu:
+            return True
+        for lo, hi in self.etiquetas:
+            if lo[cv] < lo[cu] or hi[cv] > hi[cu]:
+                return True
+        return False
+
+    def _en_arbol(self, cu, cv):
+        return self.pre[cu] <= self.pre[cv] and self.post[cv] <= self.post[cu]
+
+    def _alcanza_componente(self, cu, cv):
+        """cu != cv: ¿hay camino en el DAG de componentes?"""
+        if self._descartado(cu, cv):
+            return False
+        if self._en_arbol(cu, cv):
+            return True
+        visto = {cu}
+        pila = [cu]
+        while pila:
+            x = pila.pop()
+            for h in self.dag[x]:
+                if h == cv:
+                    return True
+                if h in visto or self._descartado(h, cv):
+                    continue
+                if self._en_arbol(h, cv):
+                    return True
+                visto.add(h)
+                pila.append(h)
+        return False
+
+    def alcanzable(self, u, v):
+        """True si hay un camino de al menos una arista de u a v (como R[u][v] en Warshall)."""
+        cu, cv = self.comp[u], self.comp[v]
+        if cu == cv:
+            return u != v or self.ciclico[cu]
+        return self._alcanza_componente(cu, cv)
+
+    def _como_arrays(self):
+        if self._arrays is None:
+            self._arrays = {
+                "comp": np.asarray(self.comp, dtype=np.int64),
+                "pre": np.asarray(self.pre, dtype=np.int64),
+                "post": np.asarray(self.post, dtype=np.int64),
+                "etiquetas": [(np.asarray(lo, dtype=np.int64), np.asarray(hi, dtype=np.int64))
+                              for lo, hi in self.etiquetas],
+                "ciclico": np.asarray(self.ciclico, dtype=bool),
+            }
+        return self._arrays
+
+    def alcanzables(self, origenes, destinos):
+        """Consulta en lote: np.ndarray de bool con alcanzable(origenes[i], destinos[i])."""
+        a = self._como_arrays()
+        u = np.asarray(origenes, dtype=np.int64)
+        v = np.asarray(destinos, dtype=np.int64)
+        cu, cv = a["comp"][u], a["comp"][v]
+        resultado = np.zeros(u.shape, dtype=bool)
+        misma = cu == cv
+        resultado[misma] = (u[misma] != v[misma]) | a["ciclico"][cu[misma]]
+
+        # positivos por el árbol y negativos por las etiquetas, vectorizados
+        positivo = ~misma & (a["pre"][cu] <= a["pre"][cv]) & (a["post"][cv] <= a["post"][cu])
+        negativo = ~misma & ~positivo & (cv > cu) if self.orden_valido else np.zeros(u.shape, dtype=bool)
+        for lo, hi in a["etiquetas"]:
+            negativo |= ~misma & ~positivo & ((lo[cv] < lo[cu]) | (hi[cv] > hi[cu]))
+        resultado[positivo] = True
+        for i in np.flatnonzero(~misma & ~positivo & ~negativo).tolist():
+            resultado[i] = self._alcanza_componente(int(cu[i]), int(cv[i]))
+        return resultado
+
+    # -------------------------
+    # Actualización
+    # -------------------------
+    def agregar_arista(self, u, v):
+        """Añade la arista u -> v manteniendo el índice válido."""
+        self.sucesores[u].append(v)
+        cu, cv = self.comp[u], self.comp[v]
+        if cu == cv:
+            if u == v and not self.ciclico[cu]:
+                self.ciclico[cu] = True
+                self._arrays = None
+            return
+        if self._alcanza_componente(cv, cu):
+            # la arista cierra un ciclo: cambian las componentes
+            self.reconstruir()
+            return
+        if cv in self.dag[cu]:
+            return
+        self.dag[cu].append(cv)
+        self.padres[cv].append(cu)
+        if cv > cu:
+            self.orden_valido = False
+        # las etiquetas de cu y sus ancestros deben seguir conteniendo la de cv
+        for lo, hi in self.etiquetas:
+            pila = [cu]
+            while pila:
+                x = pila.pop()
+                if lo[x] <= lo[cv] and hi[x] >= hi[cv]:
+                    continue
+                lo[x] = min(lo[x], lo[cv])
+                hi[x] = max(hi[x], hi[cv])
+                pila.extend(self.padres[x])
+        self._arrays = None
+
+    def memoria_bytes(self):
+        """Tamaño aproximado de las etiquetas (8 bytes por entero, como en los arrays del lote)."""
+        return 8 * (len(self.comp) + self.n_componentes * (2 + 2 * len(self.etiquetas)))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from Warshall import cierre_por_componentes, warshall
+
+    matriz = [
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 1, 0, 0],
+        [0, 0, 0, 0]
+    ]
+    indice = IndiceAlcanzabilidad.desde_matriz(matriz)
+    print("Índice == Warshall:",
+          [[int(indice.alcanzable(i, j)) for j in range(4)] for i in range(4)] == warshall(matriz))
+
+    # grafo de dependencias grande: índice frente al cierre completo
+    n = 50_000
+    rnd = random.Random(0)
+    sucesores = [[rnd.randrange(v + 1, n) for _ in range(2)] if v < n - 1 else [] for v in range(n)]
+    for _ in range(100):
+        sucesores[rnd.randrange(n)].append(rnd.randrange(n))
+    consultas = 20_000
+    origenes = [rnd.randrange(n) for _ in range(consultas)]
+    destinos = [rnd.randrange(n) for _ in range(consultas)]
+
+    inicio = time.perf_counter()
+    cierre = cierre_por_componentes(sucesores)
+    t_cierre = time.perf_counter() - inicio
+    memoria_cierre = sum(sys.getsizeof(b) for b in {id(b): b for b in cierre}.values())
+    inicio = time.perf_counter()
+    esperado = [bool((cierre[u] >> v) & 1) for u, v in zip(origenes, destinos)]
+    q_cierre = (time.perf_counter() - inicio) / consultas
+
+    inicio = time.perf_counter()
+    indice = IndiceAlcanzabilidad(sucesores)
+    t_indice = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    individuales = [indice.alcanzable(u, v) for u, v in zip(origenes, destinos)]
+    q_indice = (time.perf_counter() - inicio) / consultas
+    inicio = time.perf_counter()
+    lote = indice.alcanzables(origenes, destinos)
+    q_lote = (time.perf_counter() - inicio) / consultas
+
+    print(f"{'':<22}{'construcción (s)':>18}{'memoria (MiB)':>16}{'consulta (us)':>16}")
+    print(f"{'cierre completo':<22}{t_cierre:>18.2f}{memoria_cierre / 2**20:>16.1f}{q_cierre * 1e6:>16.2f}")
+    print(f"{'índice':<22}{t_indice:>18.2f}{indice.memoria_bytes() / 2**20:>16.1f}{q_indice * 1e6:>16.2f}")
+    print(f"{'índice (lote)':<22}{'':>18}{'':>16}{q_lote * 1e6:>16.2f}")
+    print("Respuestas iguales:", individuales == esperado and lote.tolist() == esperado)
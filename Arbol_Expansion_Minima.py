@@ -0,0 +1,286 @@
+"""
+Arbol_Expansion_Minima.py
+
+Árbol (o bosque) de expansión mínima para grafos no dirigidos grandes, con
+las aristas en arrays NumPy paralelos (origen, destino, peso) o en un
+Grafo_CSR.GrafoCSR:
+
+1) kruskal_arrays: ordena los pesos con np.argsort y une por bloques con el
+   UnionFind de Kruskal.py; termina en cuanto acepta n - 1 aristas.
+2) boruvka: en cada ronda cada componente elige su arista más barata hacia
+   otra componente (np.minimum.at sobre todas las aristas a la vez) y las
+   componentes elegidas se fusionan saltando punteros. Con procesos > 1 esa
+   búsqueda se reparte por tramos de aristas entre procesos que leen las
+   aristas de memoria compartida, como en Ordenamiento_Paralelo.
+3) prim_csr: Prim O(n^2) vectorizado sobre la adyacencia CSR, para grafos
+   densos.
+
+Las tres devuelven un np.ndarray con los índices de las aristas elegidas:
+posiciones en los arrays de entrada (kruskal_arrays, boruvka) o en
+indices/pesos del CSR (prim_csr). Los empates de peso se deshacen por el
+índice de la arista, así las tres dan el mismo árbol cuando no hay empates.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from Kruskal import UnionFind
+
+# aristas que se pasan de golpe al UnionFind en kruskal_arrays
+BLOQUE_KRUSKAL = 1 << 16
+
+# -------------------------
+# Kruskal
+# -------------------------
+def kruskal_arrays(n, origen, destino, pesos, bloque=BLOQUE_KRUSKAL):
+    origen = np.asarray(origen)
+    destino = np.asarray(destino)
+    orden = np.argsort(pesos, kind="stable")
+    uf = UnionFind(n)
+    elegidas = []
+    for inicio in range(0, orden.size, bloque):
+        if uf.componentes <= 1:
+            break  # ya hay n - 1 aristas aceptadas
+        idx = orden[inicio:inicio + bloque]
+        unidas = uf.union_many(zip(origen[idx].tolist(), destino[idx].tolist()))
+        aceptadas = np.frombuffer(bytes(unidas), dtype=np.uint8).astype(bool)
+        elegidas.append(idx[:aceptadas.size][aceptadas])
+    return np.concatenate(elegidas) if elegidas else np.empty(0, dtype=np.int64)
+
+# -------------------------
+# Borůvka
+# -------------------------
+def _mas_baratas(cu, cv, rangos, nc, sin_arista):
+    """Para cada componente, el menor rango de arista que la conecta con otra (sin_arista si no hay)."""
+    mejor = np.full(nc, sin_arista, dtype=np.int64)
+    distinta = cu != cv
+    r = rangos[distinta]
+    np.minimum.at(mejor, cu[distinta], r)
+    np.minimum.at(mejor, cv[distinta], r)
+    return mejor
+
+def _mas_baratas_tramo(nombres, n, m, inicio, fin, nc):
+    """Trabajo de cada proceso: _mas_baratas sobre las aristas [inicio, fin) del bloque compartido."""
+    bloques = [shared_memory.SharedMemory(name=nombre) for nombre in nombres]
+    try:
+        su = np.ndarray((m,), dtype=np.int64, buffer=bloques[0].buf)
+        sv = np.ndarray((m,), dtype=np.int64, buffer=bloques[1].buf)
+        comp = np.ndarray((n,), dtype=np.int64, buffer=bloques[2].buf)
+        mejor = _mas_baratas(comp[su[inicio:fin]], comp[sv[inicio:fin]],
+                             np.arange(inicio, fin, dtype=np.int64), nc, m)
+        # las vistas deben soltarse antes de cerrar los bloques
+        del su, sv, comp
+        return mejor
+    finally:
+        for b in bloques:
+            b.close()
+
+def _fusionar(comp, nc, mejor, su, sv, sin_arista):
+    """Une cada componente con la del otro extremo de su arista elegida; devuelve (comp, nc, rangos elegidos)."""
+    c = np.flatnonzero(mejor < sin_arista)
+    r = mejor[c]
+    a, b = comp[su[r]], comp[sv[r]]
+    padre = np.arange(nc, dtype=np.int64)
+    padre[c] = np.where(a == c, b, a)
+    # dos componentes que eligen la misma arista forman un 2-ciclo: la menor queda de raíz
+    ids = np.arange(nc, dtype=np.int64)
+    raiz = (padre[padre] == ids) & (ids < padre)
+    padre[raiz] = ids[raiz]
+    while True:
+        abuelo = padre[padre]
+        if np.array_equal(abuelo, padre):
+            break
+        padre = abuelo
+    raices, nuevas = np.unique(padre, return_inverse=True)
+    return nuevas[comp], raices.size, np.unique(r)
+
+def _limites(n, partes):
+    paso = -(-n // partes)
+    return [(i, min(i + paso, n)) for i in range(0, n, paso)]
+
+def boruvka(n, origen, destino, pesos, procesos=1):
+    """
+    Borůvka vectorizado. procesos > 1 reparte la búsqueda de la arista más
+    barata de cada componente entre procesos (por defecto, en este proceso).
+    """
+    orden = np.argsort(pesos, kind="stable")
+    m = orden.size
+    # las aristas se ordenan por peso: el rango (posición) desempata y es único
+    su = np.asarray(origen, dtype=np.int64)[orden]
+    sv = np.asarray(destino, dtype=np.int64)[orden]
+    comp = np.arange(n, dtype=np.int64)
+    nc = n
+    elegidas = []
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1:
+        vivas_u, vivas_v, rangos = su, sv, np.arange(m, dtype=np.int64)
+        while True:
+            cu, cv = comp[vivas_u], comp[vivas_v]
+            # las aristas internas a una componente ya no sirven nunca
+            util = cu != cv
+            if not util.any():
+                break
+            vivas_u, vivas_v, rangos = vivas_u[util], vivas_v[util], rangos[util]
+            mejor = _mas_baratas(cu[util], cv[util], rangos, nc, m)
+            comp, nc, r = _fusionar(comp, nc, mejor, su, sv, m)
+            elegidas.append(r)
+        return orden[np.concatenate(elegidas)] if elegidas else np.empty(0, dtype=np.int64)
+
+    bloques = [shared_memory.SharedMemory(create=True, size=max(1, x.nbytes)) for x in (su, sv, comp)]
+    try:
+        np.ndarray((m,), dtype=np.int64, buffer=bloques[0].buf)[:] = su
+        np.ndarray((m,), dtype=np.int64, buffer=bloques[1].buf)[:] = sv
+        comp_compartido = np.ndarray((n,), dtype=np.int64, buffer=bloques[2].buf)
+        nombres = [b.name for b in bloques]
+        tramos = _limites(m, procesos) if m else []
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            while tramos:
+                comp_compartido[:] = comp
+                parciales = list(ejecutor.map(_mas_baratas_tramo, *zip(*[(nombres, n, m, a, b, nc)
+                                                                         for a, b in tramos])))
+                mejor = np.minimum.reduce(parciales)
+                if not (mejor < m).any():
+                    break
+                comp, nc, r = _fusionar(comp, nc, mejor, su, sv, m)
+                elegidas.append(r)
+        del comp_compartido
+    finally:
+        for b in bloques:
+            b.close()
+            b.unlink()
+    return orden[np.concatenate(elegidas)] if elegidas else np.empty(0, dtype=np.int64)
+
+# -------------------------
+# Prim sobre CSR
+# -------------------------
+def prim_csr(grafo):
+    """
+    Prim O(n^2) para grafos densos. grafo es un GrafoCSR no dirigido (cada
+    arista en los dos sentidos); devuelve posiciones en grafo.indices.
+    """
+    indptr, indices, pesos = grafo.indptr, grafo.indices, grafo.pesos
+    n = grafo.n
+    clave = np.full(n, np.inf)
+    arista = np.full(n, -1, dtype=np.int64)
+    en_arbol = np.zeros(n, dtype=bool)
+    elegidas = []
+    for _ in range(n):
+        candidatos = np.where(en_arbol, np.inf, clave)
+        u = int(candidatos.argmin())
+        if candidatos[u] == np.inf:
+            # componente nueva (o primer nodo): empieza otro árbol del bosque
+            u = int(np.flatnonzero(~en_arbol)[0])
+        else:
+            elegidas.append(arista[u])
+        en_arbol[u] = True
+        a, b = int(indptr[u]), int(indptr[u + 1])
+        vecinos, w = indices[a:b], pesos[a:b]
+        mejora = (w < clave[vecinos]) & ~en_arbol[vecinos]
+        if mejora.any():
+            posiciones = np.flatnonzero(mejora)
+            # con aristas repetidas hacia el mismo vecino gana la más barata
+            np.minimum.at(clave, vecinos[posiciones], w[posiciones])
+            ganadoras = posiciones[w[posiciones] == clave[vecinos[posiciones]]]
+            arista[vecinos[ganadoras]] = ganadoras + a
+    return np.asarray(elegidas, dtype=np.int64)
+
+# -------------------------
+# Grafo geométrico aleatorio
+# -------------------------
+def grafo_geometrico(n, grado_medio=8.0, semilla=0, bloque=1 << 18):
+    """
+    n puntos al azar en el cuadrado unidad, unidos si están a distancia <= r
+    (r elegido para el grado medio pedido); peso = distancia euclídea.
+    Devuelve (origen, destino, pesos) con cada arista una sola vez.
+    """
+    rng = np.random.default_rng(semilla)
+    puntos = rng.random((n, 2))
+    r = np.sqrt(grado_medio / (np.pi * n))
+    celdas_lado = max(1, int(1 / r))
+    celda = np.minimum((puntos / (1 / celdas_lado)).astype(np.int64), celdas_lado - 1)
+    ids_celda = celda[:, 0] * celdas_lado + celda[:, 1]
+    orden = np.argsort(ids_celda, kind="stable")
+    puntos, celda, ids_celda = puntos[orden], celda[orden], ids_celda[orden]
+    inicio_celda = np.searchsorted(ids_celda, np.arange(celdas_lado * celdas_lado + 1))
+
+    origenes, destinos, pesos = [], [], []
+    # la mitad de las celdas vecinas basta: cada par se ve una sola vez
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        for a in range(0, n, bloque):
+            i = np.arange(a, min(a + bloque, n))
+            cx, cy = celda[i, 0] + dx, celda[i, 1] + dy
+            valida = (cx < celdas_lado) & (cy >= 0) & (cy < celdas_lado)
+            i, objetivo = i[valida], cx[valida] * celdas_lado + cy[valida]
+            desde, hasta = inicio_celda[objetivo], inicio_celda[objetivo + 1]
+            cuantos = hasta - desde
+            ii = np.repeat(i, cuantos)
+            desplaz = np.arange(cuantos.sum()) - np.repeat(np.cumsum(cuantos) - cuantos, cuantos)
+            jj = np.repeat(desde, cuantos) + desplaz
+            if dx == 0 and dy == 0:
+                mantener = jj > ii
+                ii, jj = ii[mantener], jj[mantener]
+            d = np.hypot(*(puntos[ii] - puntos[jj]).T)
+            cerca = d <= r
+            origenes.append(orden[ii[cerca]])
+            destinos.append(orden[jj[cerca]])
+            pesos.append(d[cerca])
+    return np.concatenate(origenes), np.concatenate(destinos), np.concatenate(pesos)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from Grafo_CSR import GrafoCSR
+    from Kruskal import kruskal
+
+    parser = argparse.ArgumentParser(description="Benchmark de árbol de expansión mínima.")
+    parser.add_argument("--nodos", type=int, default=1_000_000)
+    parser.add_argument("--grado", type=float, default=8.0)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count())
+    parser.add_argument("--densos", type=int, default=2_000, help="nodos del grafo completo para Prim")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    u, v, w = grafo_geometrico(args.nodos, args.grado)
+    print(f"Grafo geométrico: {args.nodos} nodos, {u.size} aristas ({time.perf_counter() - inicio:.1f} s)")
+
+    totales = {}
+    for nombre, fn in [("kruskal_arrays", lambda: kruskal_arrays(args.nodos, u, v, w)),
+                       ("boruvka (1 proceso)", lambda: boruvka(args.nodos, u, v, w)),
+                       (f"boruvka ({args.procesos} procesos)",
+                        lambda: boruvka(args.nodos, u, v, w, procesos=args.procesos))]:
+        inicio = time.perf_counter()
+        elegidas = fn()
+        totales[nombre] = w[elegidas].sum()
+        print(f"  {nombre:<24} {time.perf_counter() - inicio:7.2f} s  {elegidas.size} aristas  peso {totales[nombre]:.4f}")
+
+    # comparación con Kruskal.kruskal (lista de tuplas) en un grafo más pequeño
+    n = 100_000
+    u2, v2, w2 = grafo_geometrico(n, args.grado, semilla=1)
+    lista = list(zip(u2.tolist(), v2.tolist(), w2.tolist()))
+    inicio = time.perf_counter()
+    peso_lista = sum(x[2] for x in kruskal(n, lista))
+    t_lista = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    peso_arrays = w2[kruskal_arrays(n, u2, v2, w2)].sum()
+    print(f"{n} nodos: Kruskal.kruskal {t_lista:.2f} s, kruskal_arrays {time.perf_counter() - inicio:.2f} s, "
+          f"mismo peso: {np.isclose(peso_lista, peso_arrays)}")
+
+    # grafo denso completo para Prim
+    n = args.densos
+    rng = np.random.default_rng(2)
+    iu, ju = np.triu_indices(n, k=1)
+    wd = rng.random(iu.size)
+    g = GrafoCSR.desde_arrays(n, iu, ju, wd, dirigido=False)
+    inicio = time.perf_counter()
+    peso_prim = g.pesos[prim_csr(g)].sum()
+    t_prim = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    peso_kruskal = wd[kruskal_arrays(n, iu, ju, wd)].sum()
+    print(f"Completo de {n} nodos: prim_csr {t_prim:.2f} s, kruskal_arrays {time.perf_counter() - inicio:.2f} s, "
+          f"mismo peso: {np.isclose(peso_prim, peso_kruskal)}")
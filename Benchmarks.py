@@ -0,0 +1,360 @@
+"""
+Benchmarks.py
+
+Banco de pruebas de rendimiento de las búsquedas y ordenamientos del repo.
+
+Cada caso se mide con timeit sobre varios tamaños de entrada y varias
+distribuciones (aleatoria, ordenada, inversa, pocos_distintos,
+casi_ordenada). Los resultados se pueden guardar en JSON y compararse con
+un JSON anterior (baseline) para detectar regresiones.
+
+Los algoritmos cuadráticos tienen un tamaño máximo propio: por encima de
+él el caso se omite en lugar de tardar horas. Las versiones *_verbose de
+ED5_Ordenamiento imprimen la lista en cada paso (salida O(n^3) en bytes),
+por eso se limitan a 200 elementos y su salida se descarta.
+
+Uso:
+    python Benchmarks.py                          # tamaños 10..10^5
+    python Benchmarks.py --completo               # tamaños 10..10^7
+    python Benchmarks.py --casos hash,binaria --distribuciones aleatoria
+    python Benchmarks.py --json actual.json --baseline base.json
+    python Benchmarks.py --traza [n] [repeticiones]   # sobrecarga de la traza
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+from ED5_ADA4 import busqueda_secuencial, busqueda_binaria, busqueda_hash, HashIndex
+from ED5_Ordenamiento import burbuja_verbose, insercion_verbose, seleccion_verbose
+import Motor_Ordenamiento
+from Ordenamiento_Enteros import ordenar_enteros
+
+TAMANOS_RAPIDOS = [10, 100, 1_000, 10_000, 100_000]
+TAMANOS_COMPLETOS = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# número de consultas por medición en los casos de búsqueda
+CONSULTAS = 100
+
+# -------------------------
+# Distribuciones de entrada
+# -------------------------
+def _aleatoria(n, rnd):
+    return [rnd.randrange(n * 10) for _ in range(n)]
+
+def _ordenada(n, rnd):
+    return sorted(_aleatoria(n, rnd))
+
+def _inversa(n, rnd):
+    return sorted(_aleatoria(n, rnd), reverse=True)
+
+def _pocos_distintos(n, rnd):
+    return [rnd.randrange(8) for _ in range(n)]
+
+def _casi_ordenada(n, rnd):
+    datos = _ordenada(n, rnd)
+    for _ in range(max(1, n // 100)):
+        i, j = rnd.randrange(n), rnd.randrange(n)
+        datos[i], datos[j] = datos[j], datos[i]
+    return datos
+
+DISTRIBUCIONES = {
+    "aleatoria": _aleatoria,
+    "ordenada": _ordenada,
+    "inversa": _inversa,
+    "pocos_distintos": _pocos_distintos,
+    "casi_ordenada": _casi_ordenada,
+}
+
+# -------------------------
+# Registro de casos
+# -------------------------
+# nombre -> (preparar, tamaño máximo). preparar(datos, rnd) hace todo el
+# trabajo previo (copias, ordenar para Binaria, elegir consultas) y devuelve
+# la función sin argumentos que se cronometra.
+CASOS = {}
+
+def registrar(nombre, tam_max=None):
+    def decorador(preparar):
+        CASOS[nombre] = (preparar, tam_max)
+        return preparar
+    return decorador
+
+def _consultas(datos, rnd, k=CONSULTAS):
+    """k objetivos: la mitad presentes en datos y la otra mitad ausentes."""
+    presentes = [rnd.choice(datos) for _ in range(k // 2)]
+    ausentes = [-1 - i for i in range(k - k // 2)]
+    return presentes + ausentes
+
+@registrar("busqueda_secuencial", tam_max=1_000_000)
+def _caso_secuencial(datos, rnd):
+    objetivos = _consultas(datos, rnd, 10)
+    return lambda: [busqueda_secuencial(datos, t) for t in objetivos]
+
+@registrar("busqueda_binaria")
+def _caso_binaria(datos, rnd):
+    ordenada = sorted(datos)
+    objetivos = _consultas(datos, rnd)
+    return lambda: [busqueda_binaria(ordenada, t) for t in objetivos]
+
+@registrar("busqueda_hash", tam_max=1_000_000)
+def _caso_hash(datos, rnd):
+    objetivos = _consultas(datos, rnd, 10)
+    return lambda: [busqueda_hash(datos, t) for t in objetivos]
+
+@registrar("busqueda_hash (HashIndex, incluye construcción)")
+def _caso_hash_indice(datos, rnd):
+    objetivos = _consultas(datos, rnd)
+
+    def medir():
+        indice = HashIndex(datos)
+        return indice.buscar_muchos(objetivos)
+    return medir
+
+def _silencioso(fn):
+    """Ejecuta una función que imprime, descartando la salida."""
+    def envoltura(datos):
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            return fn(datos)
+    return envoltura
+
+for _nombre, _fn in (("burbuja_verbose", burbuja_verbose),
+                     ("insercion_verbose", insercion_verbose),
+                     ("seleccion_verbose", seleccion_verbose)):
+    registrar(_nombre, tam_max=200)(
+        lambda datos, rnd, fn=_silencioso(_fn): (lambda: fn(datos)))
+
+_MAXIMOS_MOTOR = {
+    "Bubble Sort": 5_000,
+    "Merge Sort": 1_000_000,
+    "Heap Sort": 1_000_000,
+    "Quicksort (introsort)": 1_000_000,
+    "Timsort (sorted)": None,
+}
+for _nombre, (_ordenar, _) in Motor_Ordenamiento.ALGORITMOS.items():
+    registrar(f"Motor_Ordenamiento: {_nombre}", tam_max=_MAXIMOS_MOTOR.get(_nombre))(
+        lambda datos, rnd, fn=_ordenar: (lambda: fn(datos)))
+
+@registrar("Ordenamiento_Enteros: conteo/radix")
+def _caso_enteros(datos, rnd):
+    return lambda: ordenar_enteros(datos)
+
+try:
+    import numpy as np
+    from Busquedas_Lote import busqueda_secuencial_lote, busqueda_binaria_lote, busqueda_hash_lote
+except ImportError:
+    np = None
+
+if np is not None:
+    @registrar("Busquedas_Lote: secuencial", tam_max=1_000_000)
+    def _caso_lote_secuencial(datos, rnd):
+        arr = np.asarray(datos)
+        objetivos = np.asarray(_consultas(datos, rnd))
+        return lambda: busqueda_secuencial_lote(arr, objetivos)
+
+    @registrar("Busquedas_Lote: binaria")
+    def _caso_lote_binaria(datos, rnd):
+        arr = np.sort(np.asarray(datos))
+        objetivos = np.asarray(_consultas(datos, rnd))
+        return lambda: busqueda_binaria_lote(arr, objetivos)
+
+    @registrar("Busquedas_Lote: hash")
+    def _caso_lote_hash(datos, rnd):
+        arr = np.asarray(datos)
+        objetivos = np.asarray(_consultas(datos, rnd))
+        return lambda: busqueda_hash_lote(arr, objetivos)
+
+    from Ordenamiento_Paralelo import ordenar_paralelo
+
+    # referencias para el merge sort paralelo
+    @registrar("sorted() (1 núcleo)")
+    def _caso_sorted(datos, rnd):
+        return lambda: sorted(datos)
+
+    @registrar("np.sort (1 núcleo)")
+    def _caso_np_sort(datos, rnd):
+        arr = np.asarray(datos, dtype=np.int64)
+        return lambda: np.sort(arr)
+
+    @registrar("Ordenamiento_Paralelo: ordenar_paralelo")
+    def _caso_paralelo(datos, rnd):
+        # umbral 0 y al menos 2 procesos: si no, por debajo de UMBRAL_PARALELO
+        # (o con un solo núcleo) se mediría np.sort y no el camino paralelo
+        arr = np.asarray(datos, dtype=np.int64)
+        procesos = max(2, os.cpu_count() or 1)
+        return lambda: ordenar_paralelo(arr, procesos=procesos, umbral_paralelo=0)
+
+# -------------------------
+# Ejecución
+# -------------------------
+def ejecutar(casos=None, distribuciones=None, tamanos=None, repeticiones=3, semilla=0, progreso=None):
+    """Devuelve una lista de resultados {caso, distribucion, n, segundos} (mejor de 'repeticiones')."""
+    if casos is None:
+        casos = list(CASOS)
+    if distribuciones is None:
+        distribuciones = list(DISTRIBUCIONES)
+    if tamanos is None:
+        tamanos = TAMANOS_RAPIDOS
+    desconocidos = [c for c in casos if c not in CASOS] + [d for d in distribuciones if d not in DISTRIBUCIONES]
+    if desconocidos:
+        raise ValueError("Casos o distribuciones desconocidos: " + ", ".join(desconocidos))
+    resultados = []
+    for dist in distribuciones:
+        for n in tamanos:
+            rnd = random.Random(semilla)
+            datos = DISTRIBUCIONES[dist](n, rnd)
+            for caso in casos:
+                preparar, tam_max = CASOS[caso]
+                if tam_max is not None and n > tam_max:
+                    continue
+                fn = preparar(datos, random.Random(semilla))
+                segundos = min(timeit.repeat(fn, number=1, repeat=repeticiones))
+                fila = {"caso": caso, "distribucion": dist, "n": n, "segundos": segundos}
+                resultados.append(fila)
+                if progreso:
+                    progreso(fila)
+    return resultados
+
+def guardar_json(resultados, ruta):
+    documento = {
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(documento, f, indent=2, ensure_ascii=False)
+
+def cargar_json(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)["resultados"]
+
+def comparar(resultados, baseline, umbral=1.25):
+    """
+    Imprime una tabla actual vs baseline y devuelve las filas en las que el
+    tiempo actual supera umbral veces al de la baseline.
+    """
+    base = {(r["caso"], r["distribucion"], r["n"]): r["segundos"] for r in baseline}
+    regresiones = []
+    print(f"{'Caso':<50}{'Distribución':<17}{'n':>10}{'base (s)':>13}{'actual (s)':>13}{'ratio':>8}")
+    for r in resultados:
+        clave = (r["caso"], r["distribucion"], r["n"])
+        if clave not in base:
+            continue
+        ratio = r["segundos"] / base[clave] if base[clave] > 0 else float("inf")
+        marca = "  REGRESIÓN" if ratio > umbral else ""
+        if marca:
+            regresiones.append(r)
+        print(f"{r['caso']:<50}{r['distribucion']:<17}{r['n']:>10}{base[clave]:>13.6f}{r['segundos']:>13.6f}{ratio:>8.2f}{marca}")
+    return regresiones
+
+def _imprimir_fila(fila):
+    print(f"{fila['caso']:<50}{fila['distribucion']:<17}{fila['n']:>10}{fila['segundos']:>13.6f}", flush=True)
+
+# -------------------------
+# Sobrecarga de la traza
+# -------------------------
+def medir_sobrecarga_traza(n=10_000, repeticiones=20, semilla=0):
+    """
+    Devuelve una lista de filas (método, modo, segundos por llamada) midiendo
+    el peor caso (valor ausente) de cada búsqueda en los tres modos de traza.
+    """
+    rnd = random.Random(semilla)
+    lista = [rnd.randint(0, n) for _ in range(n)]
+    ordenada = sorted(lista)
+    ausente = -1
+    indice = HashIndex(lista)
+
+    casos = [
+        ("Secuencial", lambda **kw: busqueda_secuencial(lista, ausente, **kw)),
+        ("Binaria", lambda **kw: busqueda_binaria(ordenada, ausente, **kw)),
+        ("Hash", lambda **kw: busqueda_hash(lista, ausente, **kw)),
+        ("Hash (índice)", lambda **kw: busqueda_hash(lista, ausente, indice=indice, **kw)),
+    ]
+
+    filas = []
+    for nombre, llamada in casos:
+        modos = [
+            ("sin traza", lambda: llamada()),
+            ("eventos", lambda: llamada(eventos=[].append)),
+            ("texto", lambda: llamada(verbose_callback=[].append)),
+        ]
+        for modo, fn in modos:
+            t = min(timeit.repeat(fn, number=1, repeat=repeticiones))
+            filas.append((nombre, modo, t))
+    return filas
+
+
+def imprimir_tabla(filas):
+    base = {}
+    print(f"{'Método':<16}{'Modo':<12}{'s/llamada':>14}{'x sin traza':>14}")
+    for metodo, modo, t in filas:
+        base.setdefault(metodo, t)
+        relativo = t / base[metodo] if base[metodo] > 0 else float("inf")
+        print(f"{metodo:<16}{modo:<12}{t:>14.8f}{relativo:>14.1f}")
+
+
+def _lista_argumento(texto, convertir=str):
+    return [convertir(x) for x in texto.split(",") if x.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de búsquedas y ordenamientos.")
+    parser.add_argument("--traza", nargs="*", type=int, metavar="N",
+                        help="medir solo la sobrecarga de la traza: [n] [repeticiones]")
+    parser.add_argument("--completo", action="store_true", help="tamaños de 10 a 10^7")
+    parser.add_argument("--tamanos", help="lista de tamaños separados por comas")
+    parser.add_argument("--casos", help="filtra casos cuyo nombre contenga alguno de estos textos, sin distinguir "
+                             "mayúsculas (separados por comas)")
+    parser.add_argument("--distribuciones", help="distribuciones separadas por comas: " + ", ".join(DISTRIBUCIONES))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--json", help="guardar los resultados en este archivo")
+    parser.add_argument("--baseline", help="comparar con los resultados guardados en este archivo")
+    parser.add_argument("--umbral", type=float, default=1.25, help="ratio actual/baseline que cuenta como regresión")
+    args = parser.parse_args(argv)
+
+    if args.traza is not None:
+        n = args.traza[0] if len(args.traza) > 0 else 10_000
+        repeticiones = args.traza[1] if len(args.traza) > 1 else 20
+        print(f"Sobrecarga de la traza (n={n}, valor ausente, mejor de {repeticiones}):")
+        imprimir_tabla(medir_sobrecarga_traza(n, repeticiones))
+        return 0
+
+    if args.tamanos:
+        tamanos = _lista_argumento(args.tamanos, int)
+    else:
+        tamanos = TAMANOS_COMPLETOS if args.completo else TAMANOS_RAPIDOS
+    casos = list(CASOS)
+    if args.casos:
+        filtros = _lista_argumento(args.casos.lower())
+        casos = [c for c in casos if any(f in c.lower() for f in filtros)]
+        if not casos:
+            parser.error(f"ningún caso coincide con '{args.casos}'. Casos: " + ", ".join(CASOS))
+    distribuciones = _lista_argumento(args.distribuciones) if args.distribuciones else None
+    desconocidas = [d for d in distribuciones or [] if d not in DISTRIBUCIONES]
+    if desconocidas:
+        parser.error("distribución(es) desconocida(s): " + ", ".join(desconocidas)
+                     + ". Disponibles: " + ", ".join(DISTRIBUCIONES))
+
+    print(f"{'Caso':<50}{'Distribución':<17}{'n':>10}{'segundos':>13}")
+    resultados = ejecutar(casos, distribuciones, tamanos, args.repeticiones, args.semilla, _imprimir_fila)
+
+    if args.json:
+        guardar_json(resultados, args.json)
+        print(f"\nResultados guardados en {args.json}")
+    if args.baseline:
+        print(f"\nComparación con {args.baseline} (umbral x{args.umbral}):")
+        regresiones = comparar(resultados, cargar_json(args.baseline), args.umbral)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresión(es) detectada(s).")
+            return 1
+        print("\nSin regresiones.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
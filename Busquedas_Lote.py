@@ -0,0 +1,122 @@
+"""
+Busquedas_Lote.py
+
+Versión por lotes (vectorizada con NumPy) de los 3 métodos de búsqueda de
+ED5_ADA4.py. Cada función recibe el arreglo donde buscar y un arreglo con
+muchos valores objetivo, y resuelve todas las consultas de una sola vez:
+
+1) Secuencial -> barrido por bloques con igualdad vectorizada (primer índice o -1).
+2) Binaria    -> np.searchsorted sobre el arreglo ordenado (índice o -1).
+3) Hash       -> mapa valor -> índices construido con sort + unique.
+"""
+
+import numpy as np
+
+# -------------------------
+# Secuencial
+# -------------------------
+def busqueda_secuencial_lote(arr, targets, bloque=1 << 20):
+    """
+    Devuelve, para cada objetivo, el primer índice donde aparece en arr (o -1),
+    igual que busqueda_secuencial. El arreglo se recorre por bloques y el
+    barrido termina en cuanto todos los objetivos han sido encontrados.
+    """
+    arr = np.asarray(arr)
+    targets = np.asarray(targets)
+    resultado = np.full(targets.shape, -1, dtype=np.int64)
+    if arr.size == 0 or targets.size == 0:
+        return resultado
+
+    # trabajamos con los objetivos distintos y al final repartimos el resultado
+    unicos, inversa = np.unique(targets, return_inverse=True)
+    primero = np.full(unicos.shape, -1, dtype=np.int64)
+    pendientes = np.ones(unicos.shape, dtype=bool)
+
+    for inicio in range(0, arr.size, bloque):
+        trozo = arr[inicio:inicio + bloque]
+        buscados = unicos[pendientes]
+        coincide = np.isin(trozo, buscados)
+        if not coincide.any():
+            continue
+        posiciones = np.flatnonzero(coincide)
+        valores, primeras = np.unique(trozo[posiciones], return_index=True)
+        donde = np.searchsorted(unicos, valores)
+        primero[donde] = inicio + posiciones[primeras]
+        pendientes[donde] = False
+        if not pendientes.any():
+            break
+
+    resultado[...] = primero[inversa.reshape(targets.shape)]
+    return resultado
+
+# -------------------------
+# Binaria
+# -------------------------
+def busqueda_binaria_lote(arr_ordenado, targets):
+    """
+    Devuelve, para cada objetivo, un índice de arr_ordenado donde aparece (o -1).
+    arr_ordenado debe estar en orden ascendente. Con valores repetidos se
+    devuelve la primera aparición.
+    """
+    arr = np.asarray(arr_ordenado)
+    targets = np.asarray(targets)
+    if arr.size == 0:
+        return np.full(targets.shape, -1, dtype=np.int64)
+    pos = np.searchsorted(arr, targets, side="left")
+    dentro = pos < arr.size
+    encontrado = np.zeros(targets.shape, dtype=bool)
+    encontrado[dentro] = arr[pos[dentro]] == targets[dentro]
+    return np.where(encontrado, pos, -1).astype(np.int64)
+
+# -------------------------
+# Hash (mapa multi-índice)
+# -------------------------
+class IndiceHashLote:
+    """
+    Mapa valor -> índices construido una sola vez con sort + unique.
+    orden contiene los índices de arr agrupados por valor (y en orden
+    creciente dentro de cada grupo); inicios/conteos delimitan cada grupo.
+    """
+
+    def __init__(self, arr):
+        arr = np.asarray(arr)
+        self.orden = np.argsort(arr, kind="stable")
+        self.valores, self.inicios, self.conteos = np.unique(
+            arr[self.orden], return_index=True, return_counts=True)
+
+    def rangos(self, targets):
+        """Devuelve (inicios, conteos) dentro de self.orden para cada objetivo; conteo 0 = no encontrado."""
+        targets = np.asarray(targets)
+        inicios = np.zeros(targets.shape, dtype=np.int64)
+        conteos = np.zeros(targets.shape, dtype=np.int64)
+        if self.valores.size == 0:
+            return inicios, conteos
+        pos = np.searchsorted(self.valores, targets)
+        dentro = pos < self.valores.size
+        hit = np.zeros(targets.shape, dtype=bool)
+        hit[dentro] = self.valores[pos[dentro]] == targets[dentro]
+        inicios[hit] = self.inicios[pos[hit]]
+        conteos[hit] = self.conteos[pos[hit]]
+        return inicios, conteos
+
+    def buscar_muchos(self, targets):
+        """Devuelve una lista de arreglos de índices, uno por objetivo (vacío si no aparece)."""
+        inicios, conteos = self.rangos(targets)
+        return [self.orden[i:i + c] for i, c in zip(inicios.ravel().tolist(), conteos.ravel().tolist())]
+
+
+def busqueda_hash_lote(arr, targets):
+    """Equivalente por lotes de busqueda_hash: todos los índices de cada objetivo."""
+    return IndiceHashLote(arr).buscar_muchos(targets)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    datos = rng.integers(0, 100, size=20)
+    consultas = np.array([datos[3], datos[7], 1000])
+    print("Lista:", datos.tolist())
+    print("Consultas:", consultas.tolist())
+    print("Secuencial:", busqueda_secuencial_lote(datos, consultas).tolist())
+    ordenados = np.sort(datos)
+    print("Binaria (sobre lista ordenada):", busqueda_binaria_lote(ordenados, consultas).tolist())
+    print("Hash:", [r.tolist() for r in busqueda_hash_lote(datos, consultas)])
@@ -0,0 +1,183 @@
+"""
+Cargador_Numeros.py
+
+Carga masiva de enteros desde texto o archivos, por bloques y sin crear una
+lista intermedia de tokens. Formatos admitidos:
+- texto: números separados por comas, espacios, tabuladores o saltos de línea
+  (sirve para CSV de una columna o de varias);
+- binario little-endian de enteros de 32 bits ("int32") o 64 bits ("int64").
+
+El resultado es un array('q') (8 bytes por entero); con NumPy instalado
+como_numpy lo convierte en un np.ndarray sin copiar los datos.
+Si aparece un token no numérico, o un entero que no cabe en 64 bits con
+signo, se lanza ValueError indicando el token y su posición en bytes dentro
+de la entrada.
+"""
+
+import os
+import re
+import sys
+from array import array
+
+# tamaño de bloque por defecto para la lectura de archivos (4 MiB)
+TAM_BLOQUE = 1 << 22
+
+# un solo patrón compilado localiza cualquier cosa que no forme parte de un
+# entero válido: caracteres ajenos, signos sueltos y signos pegados a dígitos
+_INVALIDO = re.compile(rb'[^\s,0-9+\-]|[+\-](?![0-9])|[0-9][+\-]')
+_SEPARADOR = re.compile(rb'[\s,]')
+_TOKEN = re.compile(rb'[^\s,]+')
+
+# rango de array('q')
+_MIN_Q, _MAX_Q = -(1 << 63), (1 << 63) - 1
+
+_FORMATOS_BINARIOS = {"int32": ("i", 4), "int64": ("q", 8)}
+_EXTENSIONES = {".i32": "int32", ".i64": "int64", ".bin": "int64"}
+
+# -------------------------
+# Texto
+# -------------------------
+def _token_en(datos, pos):
+    """Devuelve (token, inicio) del token de datos que contiene la posición pos."""
+    inicio = pos
+    while inicio > 0 and not _SEPARADOR.match(datos, inicio - 1):
+        inicio -= 1
+    fin = pos
+    while fin < len(datos) and not _SEPARADOR.match(datos, fin):
+        fin += 1
+    return datos[inicio:fin], inicio
+
+def _error_token(datos, pos, desplazamiento):
+    token, inicio = _token_en(datos, pos)
+    texto = token.decode("utf-8", errors="replace")
+    raise ValueError(f"Token inválido encontrado: '{texto}' (byte {desplazamiento + inicio}). "
+                     "Usa solo números separados por comas, espacios o saltos de línea.")
+
+def _parsear_bloque(datos, destino, desplazamiento):
+    m = _INVALIDO.search(datos)
+    if m is not None:
+        _error_token(datos, m.start(), desplazamiento)
+    # int() acepta bytes directamente: split y conversión corren en C
+    try:
+        destino.extend(map(int, datos.replace(b",", b" ").split()))
+    except OverflowError:
+        # solo en el caso raro se busca qué token se sale del rango
+        for m in _TOKEN.finditer(datos):
+            if not _MIN_Q <= int(m.group()) <= _MAX_Q:
+                texto = m.group().decode("utf-8", errors="replace")
+                raise ValueError(f"Número fuera de rango: '{texto}' (byte {desplazamiento + m.start()}). "
+                                 "Solo se admiten enteros de 64 bits con signo.") from None
+        raise
+
+def parsear_texto(texto):
+    """Convierte un str/bytes con números separados en un array('q')."""
+    if isinstance(texto, str):
+        texto = texto.encode("utf-8")
+    nums = array("q")
+    _parsear_bloque(texto, nums, 0)
+    return nums
+
+def iterar_enteros_texto(ruta, tam_bloque=TAM_BLOQUE):
+    """
+    Recorre un archivo de texto por bloques y produce un array('q') por
+    bloque; un token partido entre dos bloques se completa con el siguiente.
+    """
+    pendiente = b""
+    desplazamiento = 0  # posición en el archivo del primer byte de 'pendiente'
+    with open(ruta, "rb") as f:
+        while True:
+            bloque = f.read(tam_bloque)
+            if not bloque:
+                break
+            datos = pendiente + bloque
+            # el último token puede continuar en el siguiente bloque
+            corte = len(datos)
+            while corte > 0 and not _SEPARADOR.match(datos, corte - 1):
+                corte -= 1
+            nums = array("q")
+            _parsear_bloque(datos[:corte], nums, desplazamiento)
+            pendiente = datos[corte:]
+            desplazamiento += corte
+            if nums:
+                yield nums
+    if pendiente:
+        nums = array("q")
+        _parsear_bloque(pendiente, nums, desplazamiento)
+        yield nums
+
+def leer_enteros_texto(ruta, tam_bloque=TAM_BLOQUE):
+    """Lee todos los enteros de un archivo de texto en un array('q')."""
+    nums = array("q")
+    for bloque in iterar_enteros_texto(ruta, tam_bloque):
+        nums.extend(bloque)
+    return nums
+
+# -------------------------
+# Binario
+# -------------------------
+def iterar_enteros_binario(ruta, formato="int64", tam_bloque=TAM_BLOQUE):
+    """Recorre enteros little-endian de 32 o 64 bits por bloques, como array('q')."""
+    if formato not in _FORMATOS_BINARIOS:
+        raise ValueError(f"Formato binario desconocido: '{formato}'. Usa 'int32' o 'int64'.")
+    codigo, ancho = _FORMATOS_BINARIOS[formato]
+    tam = os.path.getsize(ruta)
+    if tam % ancho:
+        raise ValueError(f"El archivo tiene {tam} bytes, que no es múltiplo de {ancho}: "
+                         f"sobran {tam % ancho} bytes a partir del byte {tam - tam % ancho}.")
+    tam_bloque = max(ancho, tam_bloque - tam_bloque % ancho)
+    with open(ruta, "rb") as f:
+        while True:
+            bloque = f.read(tam_bloque)
+            if not bloque:
+                break
+            trozo = array(codigo)
+            trozo.frombytes(bloque)
+            if sys.byteorder == "big":
+                trozo.byteswap()
+            yield trozo if codigo == "q" else array("q", trozo)
+
+def leer_enteros_binario(ruta, formato="int64", tam_bloque=TAM_BLOQUE):
+    """Lee enteros little-endian de 32 o 64 bits y los devuelve en un array('q')."""
+    nums = array("q")
+    for bloque in iterar_enteros_binario(ruta, formato, tam_bloque):
+        nums.extend(bloque)
+    return nums
+
+# -------------------------
+# Entrada general
+# -------------------------
+def _deducir_formato(ruta, formato):
+    if formato is None:
+        formato = _EXTENSIONES.get(os.path.splitext(ruta)[1].lower(), "texto")
+    return formato
+
+def iterar_numeros(ruta, formato=None, tam_bloque=TAM_BLOQUE):
+    """Como cargar_numeros, pero produce los enteros por bloques (array('q')) sin cargarlos todos."""
+    formato = _deducir_formato(ruta, formato)
+    if formato == "texto":
+        return iterar_enteros_texto(ruta, tam_bloque)
+    return iterar_enteros_binario(ruta, formato, tam_bloque)
+
+def cargar_numeros(ruta, formato=None, tam_bloque=TAM_BLOQUE):
+    """
+    Carga enteros desde un archivo. formato puede ser "texto", "int32" o
+    "int64"; si no se indica se deduce de la extensión (.i32, .i64, .bin)
+    y en otro caso se asume texto.
+    """
+    formato = _deducir_formato(ruta, formato)
+    if formato == "texto":
+        return leer_enteros_texto(ruta, tam_bloque)
+    return leer_enteros_binario(ruta, formato, tam_bloque)
+
+def como_numpy(nums):
+    """Vista NumPy (int64) de un array('q') sin copiar los datos."""
+    import numpy as np
+    return np.frombuffer(nums, dtype=np.int64)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python Cargador_Numeros.py <archivo> [texto|int32|int64]")
+        sys.exit(1)
+    datos = cargar_numeros(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"{len(datos)} enteros cargados. Primeros: {datos[:10].tolist()}")
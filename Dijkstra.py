@@ -1,20 +1,372 @@
+"""
+Dijkstra.py
+
+Caminos mínimos desde un origen (pesos no negativos).
+
+- dijkstra: grafo en diccionario {nodo: [(vecino, peso), ...]}. Descarta las
+  entradas obsoletas del montículo (las que ya tienen una distancia mejor),
+  así cada nodo relaja sus aristas una sola vez; con 'destino' se detiene en
+  cuanto lo fija y con con_predecesores devuelve también el árbol de caminos.
+- dijkstra_csr: nodos enteros 0..n-1 y aristas en arrays CSR (indptr,
+  indices, pesos), que pueden ser listas, array.array o np.ndarray (se leen
+  con memoryview, sin copiarlas). Admite dos colas de prioridad:
+  "heapq" (perezosa, con la comprobación de entradas obsoletas) y
+  "indexado" (montículo d-ario con disminución de clave: nunca guarda más de
+  una entrada por nodo).
+- dijkstra_bidireccional y a_estrella: consultas origen -> destino que
+  devuelven (distancia, camino, fijados), donde fijados es el número de
+  nodos extraídos de la cola; ruta_dijkstra da lo mismo con Dijkstra simple
+  para comparar. heuristica_haversine construye una heurística admisible a
+  partir de coordenadas (latitud, longitud).
+"""
+
 import heapq
+import math
+from array import array
+
+INF = float('inf')
+
+# -------------------------
+# Montículo d-ario indexado
+# -------------------------
+class MonticuloIndexado:
+    """Cola de prioridad de nodos 0..n-1 con disminución de clave en O(log_d n)."""
+
+    def __init__(self, n, d=4):
+        self.d = d
+        self.claves = []
+        self.nodos = []
+        self.posicion = array('l', [-1]) * n
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def disminuir(self, nodo, clave):
+        """Inserta el nodo o baja su clave; devuelve False si la clave no mejora."""
+        i = self.posicion[nodo]
+        if i < 0:
+            i = len(self.nodos)
+            self.claves.append(clave)
+            self.nodos.append(nodo)
+        elif clave >= self.claves[i]:
+            return False
+        self._subir(i, nodo, clave)
+        return True
 
-def dijkstra(grafo, origen):
-    dist = {n: float('inf') for n in grafo}
+    def extraer(self):
+        """Saca el nodo de clave mínima; devuelve (clave, nodo)."""
+        claves, nodos = self.claves, self.nodos
+        clave, nodo = claves[0], nodos[0]
+        self.posicion[nodo] = -1
+        ultima, ultimo = claves.pop(), nodos.pop()
+        if nodos:
+            self._bajar(0, ultimo, ultima)
+        return clave, nodo
+
+    def _subir(self, i, nodo, clave):
+        claves, nodos, posicion, d = self.claves, self.nodos, self.posicion, self.d
+        while i > 0:
+            p = (i - 1) // d
+            if claves[p] <= clave:
+                break
+            claves[i] = claves[p]
+            nodos[i] = nodos[p]
+            posicion[nodos[i]] = i
+            i = p
+        claves[i] = clave
+        nodos[i] = nodo
+        posicion[nodo] = i
+
+    def _bajar(self, i, nodo, clave):
+        claves, nodos, posicion, d = self.claves, self.nodos, self.posicion, self.d
+        n = len(nodos)
+        while True:
+            primero = d * i + 1
+            if primero >= n:
+                break
+            ultimo = min(primero + d, n)
+            hijo = primero
+            clave_hijo = claves[primero]
+            for h in range(primero + 1, ultimo):
+                if claves[h] < clave_hijo:
+                    hijo, clave_hijo = h, claves[h]
+            if clave_hijo >= clave:
+                break
+            claves[i] = clave_hijo
+            nodos[i] = nodos[hijo]
+            posicion[nodos[i]] = i
+            i = hijo
+        claves[i] = clave
+        nodos[i] = nodo
+        posicion[nodo] = i
+
+# -------------------------
+# Grafo en diccionario
+# -------------------------
+def dijkstra(grafo, origen, destino=None, con_predecesores=False):
+    """
+    Devuelve dist (diccionario nodo -> distancia, inf si no se alcanza), o
+    (dist, pred) si con_predecesores. Con destino, la búsqueda se detiene al
+    fijarlo y las distancias de los nodos aún no fijados son cotas superiores.
+    """
+    dist = {n: INF for n in grafo}
+    pred = {origen: None}
     dist[origen] = 0
     cola = [(0, origen)]
 
     while cola:
         dist_actual, nodo = heapq.heappop(cola)
+        if dist_actual > dist[nodo]:
+            continue  # entrada obsoleta: el nodo ya se fijó con una distancia menor
+        if nodo == destino:
+            break
 
-        for vecino, peso in grafo[nodo]:
+        for vecino, peso in grafo.get(nodo, ()):
             nueva = dist_actual + peso
-            if nueva < dist[vecino]:
+            if nueva < dist.get(vecino, INF):
                 dist[vecino] = nueva
+                pred[vecino] = nodo
                 heapq.heappush(cola, (nueva, vecino))
 
-    return dist
+    return (dist, pred) if con_predecesores else dist
+
+def reconstruir_camino(pred, destino):
+    """Camino desde el origen hasta destino a partir de los predecesores, o None si no se alcanzó."""
+    if isinstance(pred, dict):
+        if destino not in pred:
+            return None
+        sin_pred = None
+    else:
+        if pred[destino] == -2:
+            return None
+        sin_pred = -1
+    camino = [destino]
+    while pred[camino[-1]] != sin_pred:
+        camino.append(pred[camino[-1]])
+    camino.reverse()
+    return camino
+
+# -------------------------
+# Consultas origen -> destino
+# -------------------------
+# Estas funciones aceptan también grafos {nodo: {vecino: peso}} como ORBEABSD.GRAPH.
+def _vecinos(grafo, nodo):
+    ady = grafo.get(nodo, ())
+    return ady.items() if isinstance(ady, dict) else ady
+
+def invertir(grafo):
+    """Grafo con las aristas invertidas, en formato {nodo: [(vecino, peso), ...]}."""
+    inverso = {n: [] for n in grafo}
+    for u in grafo:
+        for v, w in _vecinos(grafo, u):
+            inverso.setdefault(v, []).append((u, w))
+    return inverso
+
+def ruta_dijkstra(grafo, origen, destino):
+    """Dijkstra con parada en el destino; devuelve (distancia, camino, fijados)."""
+    dist = {origen: 0}
+    pred = {origen: None}
+    cola = [(0, origen)]
+    fijados = 0
+    while cola:
+        d, u = heapq.heappop(cola)
+        if d > dist[u]:
+            continue
+        fijados += 1
+        if u == destino:
+            return d, reconstruir_camino(pred, destino), fijados
+        for v, w in _vecinos(grafo, u):
+            nueva = d + w
+            if nueva < dist.get(v, INF):
+                dist[v] = nueva
+                pred[v] = u
+                heapq.heappush(cola, (nueva, v))
+    return INF, None, fijados
+
+def dijkstra_bidireccional(grafo, origen, destino, grafo_inverso=None):
+    """
+    Dijkstra simultáneo desde el origen (hacia delante) y desde el destino
+    (sobre el grafo inverso); se detiene cuando la suma de los mínimos de
+    ambas colas alcanza el mejor camino encontrado.
+    Devuelve (distancia, camino, fijados).
+    """
+    if origen == destino:
+        return 0, [origen], 1
+    if grafo_inverso is None:
+        grafo_inverso = invertir(grafo)
+    lados = [
+        (grafo, {origen: 0}, {origen: None}, [(0, origen)], set()),
+        (grafo_inverso, {destino: 0}, {destino: None}, [(0, destino)], set()),
+    ]
+    mejor, encuentro = INF, None
+    fijados = 0
+    while lados[0][3] and lados[1][3]:
+        if lados[0][3][0][0] + lados[1][3][0][0] >= mejor:
+            break
+        # se avanza por el lado con la cola más corta
+        i = 0 if len(lados[0][3]) <= len(lados[1][3]) else 1
+        g, dist, pred, cola, cerrados = lados[i]
+        _, dist_otro, _, _, _ = lados[1 - i]
+        d, u = heapq.heappop(cola)
+        if d > dist[u] or u in cerrados:
+            continue
+        cerrados.add(u)
+        fijados += 1
+        for v, w in _vecinos(g, u):
+            nueva = d + w
+            if nueva < dist.get(v, INF):
+                dist[v] = nueva
+                pred[v] = u
+                heapq.heappush(cola, (nueva, v))
+            if v in dist_otro and nueva + dist_otro[v] < mejor:
+                mejor, encuentro = nueva + dist_otro[v], v
+    if encuentro is None:
+        return INF, None, fijados
+    ida = reconstruir_camino(lados[0][2], encuentro)
+    vuelta = reconstruir_camino(lados[1][2], encuentro)
+    return mejor, ida + vuelta[::-1][1:], fijados
+
+def a_estrella(grafo, origen, destino, heuristica):
+    """
+    A*: Dijkstra ordenado por g + heuristica(nodo). Con una heurística
+    consistente (como heuristica_haversine) cada nodo se fija una sola vez.
+    Devuelve (distancia, camino, fijados).
+    """
+    g = {origen: 0}
+    pred = {origen: None}
+    cola = [(heuristica(origen), 0, origen)]
+    fijados = 0
+    while cola:
+        _, d, u = heapq.heappop(cola)
+        if d > g[u]:
+            continue
+        fijados += 1
+        if u == destino:
+            return d, reconstruir_camino(pred, destino), fijados
+        for v, w in _vecinos(grafo, u):
+            nueva = d + w
+            if nueva < g.get(v, INF):
+                g[v] = nueva
+                pred[v] = u
+                heapq.heappush(cola, (nueva + heuristica(v), nueva, v))
+    return INF, None, fijados
+
+RADIO_TIERRA_KM = 6371.0
+
+def haversine_km(a, b):
+    """Distancia de círculo máximo en km entre dos puntos (latitud, longitud) en grados."""
+    lat1, lon1 = map(math.radians, a)
+    lat2, lon2 = map(math.radians, b)
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RADIO_TIERRA_KM * math.asin(min(1.0, math.sqrt(h)))
+
+def escala_admisible(grafo, coords):
+    """
+    Mayor factor e tal que e * haversine_km(u, v) <= peso(u, v) en toda arista:
+    los pesos pueden no ser km en línea recta (o las coordenadas ser
+    aproximadas), y así la heurística nunca sobreestima.
+    """
+    escala = INF
+    for u in grafo:
+        for v, w in _vecinos(grafo, u):
+            recta = haversine_km(coords[u], coords[v])
+            if recta > 0:
+                escala = min(escala, w / recta)
+    return 0.0 if escala == INF else escala
+
+def heuristica_haversine(coords, destino, escala=1.0):
+    """h(nodo) = escala * distancia en línea recta hasta destino (usa escala_admisible)."""
+    objetivo = coords[destino]
+    return lambda nodo: escala * haversine_km(coords[nodo], objetivo)
+
+# -------------------------
+# Grafo en CSR
+# -------------------------
+def a_csr(grafo):
+    """
+    Convierte {nodo: [(vecino, peso), ...]} a (nombres, indptr, indices, pesos)
+    con los nodos numerados en el orden de 'nombres'.
+    """
+    nombres = list(grafo)
+    ids = {n: i for i, n in enumerate(nombres)}
+    for vecinos in grafo.values():
+        for v, _ in vecinos:
+            if v not in ids:
+                ids[v] = len(nombres)
+                nombres.append(v)
+    indptr = array('q', [0])
+    indices = array('q')
+    pesos = array('d')
+    for n in nombres:
+        for v, w in grafo.get(n, ()):
+            indices.append(ids[v])
+            pesos.append(w)
+        indptr.append(len(indices))
+    return nombres, indptr, indices, pesos
+
+def _vista(a):
+    """memoryview del array (sin copia); las listas, o los formatos que memoryview no lee, como lista."""
+    if isinstance(a, list):
+        return a
+    try:
+        vista = memoryview(a)
+        vista[:1].tolist()
+        return vista
+    except (TypeError, ValueError, NotImplementedError):
+        return list(a)
+
+def dijkstra_csr(indptr, indices, pesos, origen, destino=None, monticulo="heapq", d=4):
+    """
+    Dijkstra sobre CSR: los vecinos de u son indices[indptr[u]:indptr[u+1]]
+    con pesos pesos[indptr[u]:indptr[u+1]].
+    Devuelve (dist, pred): listas con la distancia (inf si no se alcanza) y
+    el predecesor de cada nodo (-1 en el origen, -2 si no se alcanzó).
+    Con destino se detiene al fijarlo.
+    """
+    indptr, indices, pesos = _vista(indptr), _vista(indices), _vista(pesos)
+    n = len(indptr) - 1
+    dist = [INF] * n
+    pred = [-2] * n
+    fijado = bytearray(n)
+    dist[origen] = 0
+    pred[origen] = -1
+
+    if monticulo == "heapq":
+        cola = [(0, origen)]
+        pop, push = heapq.heappop, heapq.heappush
+        while cola:
+            du, u = pop(cola)
+            if fijado[u]:
+                continue  # entrada obsoleta
+            fijado[u] = 1
+            if u == destino:
+                break
+            a, b = indptr[u], indptr[u + 1]
+            for v, w in zip(indices[a:b], pesos[a:b]):
+                nueva = du + w
+                if nueva < dist[v]:
+                    dist[v] = nueva
+                    pred[v] = u
+                    push(cola, (nueva, v))
+    elif monticulo == "indexado":
+        cola = MonticuloIndexado(n, d)
+        cola.disminuir(origen, 0)
+        while cola:
+            du, u = cola.extraer()
+            fijado[u] = 1
+            if u == destino:
+                break
+            a, b = indptr[u], indptr[u + 1]
+            for v, w in zip(indices[a:b], pesos[a:b]):
+                nueva = du + w
+                if nueva < dist[v] and not fijado[v]:
+                    dist[v] = nueva
+                    pred[v] = u
+                    cola.disminuir(v, nueva)
+    else:
+        raise ValueError(f"Montículo desconocido: '{monticulo}'. Usa 'heapq' o 'indexado'.")
+
+    return dist, pred
 
 # Ejemplo de uso
 grafo = {
@@ -24,4 +376,12 @@ grafo = {
     'D': []
 }
 
-print(dijkstra(grafo, 'A'))
+if __name__ == "__main__":
+    print(dijkstra(grafo, 'A'))
+
+    dist, pred = dijkstra(grafo, 'A', destino='D', con_predecesores=True)
+    print("A -> D:", dist['D'], reconstruir_camino(pred, 'D'))
+
+    nombres, indptr, indices, pesos = a_csr(grafo)
+    dist, pred = dijkstra_csr(indptr, indices, pesos, 0, monticulo="indexado")
+    print({nombres[i]: d for i, d in enumerate(dist)})
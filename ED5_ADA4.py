@@ -9,85 +9,391 @@ Programa con GUI (tkinter) que permite ejecutar 3 métodos de búsqueda:
 
 Características principales:
 - Impresión automática de elementos al seleccionar el método.
-- Ordenación paso a paso (Bubble Sort) con impresión de comparaciones e intercambios.
+- Ordenación con algoritmo a elegir (Bubble, Merge, Heap, Quicksort, Timsort), paso a paso
+  con impresión de comparaciones e intercambios o directa sin traza.
 - Permite cargar una lista personalizada (pegar números separados por comas/espacios/enter).
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import random
-import re
+import bisect
+import itertools
+from collections import deque
+
+from Motor_Ordenamiento import ALGORITMOS, esta_ordenada
+from Cargador_Numeros import parsear_texto, cargar_numeros
+
+# -------------------------
+# Eventos de traza
+# -------------------------
+# Las búsquedas trazadas emiten tuplas (tipo, datos...) en lugar de texto.
+# El texto solo se genera cuando el consumidor lo pide con formatear_evento,
+# de modo que un consumidor puede acumular eventos y dibujarlos por lotes.
+_FORMATOS_EVENTO = {
+    "comprobar": "Comprobando índice {0}: valor {1}",
+    "paso": "Paso {0}: lo={1}, hi={2}, mid={3}, arr[mid]={4}",
+    "encontrado": "Encontrado en índice {0}.",
+    "no_encontrado": "No encontrado.",
+    "insertar_hash": "Insertando en hash: valor {0} -> índice {1}",
+    "indice_hash": "Usando índice hash precalculado ({0} valores distintos).",
+    "encontrado_hash": "Encontrado en índice(s): {0}",
+    "no_encontrado_hash": "No encontrado en la tabla hash.",
+}
+
+def formatear_evento(evento):
+    """Convierte un evento (tipo, datos...) en la línea de texto que se muestra al usuario."""
+    return _FORMATOS_EVENTO[evento[0]].format(*evento[1:])
+
+def _resolver_traza(verbose_callback, eventos):
+    """
+    Devuelve la función que recibirá los eventos, o None si nadie escucha.
+    verbose_callback recibe texto ya formateado; eventos recibe las tuplas tal cual.
+    """
+    if eventos is not None:
+        return eventos
+    if verbose_callback:
+        return lambda evento: verbose_callback(formatear_evento(evento))
+    return None
 
 # -------------------------
 # Algoritmos de búsqueda
 # -------------------------
-def busqueda_secuencial(arr, target, verbose_callback=None):
+# Cada búsqueda tiene dos versiones: una sin traza (sin comprobaciones ni
+# cadenas en el bucle) y otra que emite eventos. La función pública elige
+# la versión según haya o no un consumidor.
+def _busqueda_secuencial_rapida(arr, target):
+    if isinstance(arr, (list, tuple)):
+        try:
+            return arr.index(target)
+        except ValueError:
+            return -1
     for i, val in enumerate(arr):
-        if verbose_callback:
-            verbose_callback(f"Comprobando índice {i}: valor {val}")
         if val == target:
-            if verbose_callback:
-                verbose_callback(f"Encontrado en índice {i}.")
             return i
-    if verbose_callback:
-        verbose_callback("No encontrado.")
     return -1
 
-def busqueda_binaria(arr, target, verbose_callback=None):
+def _busqueda_secuencial_traza(arr, target, emitir):
+    for i, val in enumerate(arr):
+        emitir(("comprobar", i, val))
+        if val == target:
+            emitir(("encontrado", i))
+            return i
+    emitir(("no_encontrado",))
+    return -1
+
+def busqueda_secuencial(arr, target, verbose_callback=None, eventos=None):
+    emitir = _resolver_traza(verbose_callback, eventos)
+    if emitir is None:
+        return _busqueda_secuencial_rapida(arr, target)
+    return _busqueda_secuencial_traza(arr, target, emitir)
+
+def _busqueda_binaria_rapida(arr, target):
+    lo = 0
+    hi = len(arr) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        v = arr[mid]
+        if v == target:
+            return mid
+        elif v < target:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return -1
+
+def _busqueda_binaria_traza(arr, target, emitir):
     lo = 0
     hi = len(arr) - 1
     pasos = 0
     while lo <= hi:
         mid = (lo + hi) // 2
         pasos += 1
-        if verbose_callback:
-            verbose_callback(f"Paso {pasos}: lo={lo}, hi={hi}, mid={mid}, arr[mid]={arr[mid]}")
+        emitir(("paso", pasos, lo, hi, mid, arr[mid]))
         if arr[mid] == target:
-            if verbose_callback:
-                verbose_callback(f"Encontrado en índice {mid}.")
+            emitir(("encontrado", mid))
             return mid
         elif arr[mid] < target:
             lo = mid + 1
         else:
             hi = mid - 1
-    if verbose_callback:
-        verbose_callback("No encontrado.")
+    emitir(("no_encontrado",))
     return -1
 
-def busqueda_hash(arr, target, verbose_callback=None):
-    tabla = {}
-    for i, v in enumerate(arr):
-        tabla.setdefault(v, []).append(i)
-        if verbose_callback:
-            verbose_callback(f"Insertando en hash: valor {v} -> índice {i}")
-    if target in tabla:
-        indices = tabla[target]
-        if verbose_callback:
-            verbose_callback(f"Encontrado en índice(s): {indices}")
-        return indices
+def busqueda_binaria(arr, target, verbose_callback=None, eventos=None):
+    emitir = _resolver_traza(verbose_callback, eventos)
+    if emitir is None:
+        return _busqueda_binaria_rapida(arr, target)
+    return _busqueda_binaria_traza(arr, target, emitir)
+
+class HashIndex:
+    """
+    Índice hash reutilizable {valor: [índices]} asociado a una lista.
+    La tabla se construye una sola vez (de forma perezosa, en la primera
+    consulta) y después cada búsqueda cuesta O(1). Las modificaciones hechas
+    a través del índice (agregar, asignar, intercambiar) actualizan la lista
+    y la tabla de forma incremental, sin reconstruirla.
+    """
+
+    def __init__(self, arr=None):
+        self.arr = arr if arr is not None else []
+        self._tabla = None
+
+    def reconstruir(self, arr=None):
+        """Asocia el índice a una lista nueva (o la misma) y descarta la tabla anterior."""
+        if arr is not None:
+            self.arr = arr
+        self._tabla = None
+
+    def _asegurar_tabla(self):
+        if self._tabla is None:
+            tabla = {}
+            for i, v in enumerate(self.arr):
+                indices = tabla.get(v)
+                if indices is None:
+                    tabla[v] = [i]
+                else:
+                    indices.append(i)
+            self._tabla = tabla
+        return self._tabla
+
+    def __len__(self):
+        return len(self.arr)
+
+    def __contains__(self, valor):
+        return valor in self._asegurar_tabla()
+
+    def valores_distintos(self):
+        return len(self._asegurar_tabla())
+
+    def buscar(self, valor):
+        """Devuelve la lista (ordenada) de índices donde aparece valor, o [] si no está."""
+        return list(self._asegurar_tabla().get(valor, ()))
+
+    def buscar_muchos(self, valores):
+        """Búsqueda por lotes: devuelve una lista de resultados alineada con valores."""
+        tabla = self._asegurar_tabla()
+        return [list(tabla.get(v, ())) for v in valores]
+
+    # -------------------------
+    # Actualizaciones incrementales
+    # -------------------------
+    def _quitar(self, valor, i):
+        indices = self._tabla[valor]
+        del indices[bisect.bisect_left(indices, i)]
+        if not indices:
+            del self._tabla[valor]
+
+    def _poner(self, valor, i):
+        indices = self._tabla.get(valor)
+        if indices is None:
+            self._tabla[valor] = [i]
+        else:
+            bisect.insort(indices, i)
+
+    def agregar(self, valor):
+        """Añade valor al final de la lista y devuelve su índice."""
+        i = len(self.arr)
+        self.arr.append(valor)
+        if self._tabla is not None:
+            self._poner(valor, i)
+        return i
+
+    def asignar(self, i, valor):
+        """Equivale a arr[i] = valor manteniendo la tabla al día."""
+        anterior = self.arr[i]
+        self.arr[i] = valor
+        if self._tabla is not None and anterior != valor:
+            self._quitar(anterior, i)
+            self._poner(valor, i)
+
+    def intercambiar(self, i, j):
+        """Equivale a arr[i], arr[j] = arr[j], arr[i] manteniendo la tabla al día."""
+        arr = self.arr
+        vi, vj = arr[i], arr[j]
+        arr[i], arr[j] = vj, vi
+        if self._tabla is not None and vi != vj:
+            self._quitar(vi, i)
+            self._quitar(vj, j)
+            self._poner(vi, j)
+            self._poner(vj, i)
+
+
+def _busqueda_hash_rapida(arr, target, indice=None):
+    if indice is not None:
+        return indice.buscar(target)
+    # sin índice previo, construir la tabla completa no aporta nada a una sola consulta
+    return [i for i, v in enumerate(arr) if v == target]
+
+def _busqueda_hash_traza(arr, target, emitir, indice=None):
+    if indice is not None:
+        emitir(("indice_hash", indice.valores_distintos()))
+        indices = indice.buscar(target)
+    else:
+        tabla = {}
+        for i, v in enumerate(arr):
+            tabla.setdefault(v, []).append(i)
+            emitir(("insertar_hash", v, i))
+        indices = tabla.get(target, [])
+    if indices:
+        emitir(("encontrado_hash", indices))
     else:
-        if verbose_callback:
-            verbose_callback("No encontrado en la tabla hash.")
-        return []
+        emitir(("no_encontrado_hash",))
+    return indices
+
+def busqueda_hash(arr, target, verbose_callback=None, indice=None, eventos=None):
+    emitir = _resolver_traza(verbose_callback, eventos)
+    if emitir is None:
+        return _busqueda_hash_rapida(arr, target, indice)
+    return _busqueda_hash_traza(arr, target, emitir, indice)
+
+
+# -------------------------
+# Visor de lista virtualizado
+# -------------------------
+class VistaListaVirtual(ttk.Frame):
+    """
+    Muestra una lista larga dibujando solo las filas que caben en pantalla.
+    El desplazamiento lo controla una barra propia: al moverla se vuelven a
+    escribir únicamente las filas visibles, así el coste de cada refresco no
+    depende del tamaño de la lista.
+    """
+
+    def __init__(self, master, width=30, height=24):
+        super().__init__(master)
+        self.lista = []
+        self.inicio = 0
+        self.filas = height
+        self.resaltados = ()
+        self.text = tk.Text(self, width=width, height=height, state="disabled", wrap="none")
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.scroll.pack(side="right", fill="y")
+        self.text.pack(side="left", fill="both", expand=True)
+        self._alto_linea = tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+
+        self.text.bind("<Configure>", self._al_redimensionar)
+        self.text.bind("<MouseWheel>", lambda e: self._desplazar(-3 if e.delta > 0 else 3))
+        self.text.bind("<Button-4>", lambda e: self._desplazar(-3))
+        self.text.bind("<Button-5>", lambda e: self._desplazar(3))
+
+    # ---- dibujo ----
+    def _linea(self, i):
+        marker = "  <--" if self.resaltados and i in self.resaltados else ""
+        return f"{i:02d}: {self.lista[i]}{marker}"
+
+    def _limitar_inicio(self):
+        self.inicio = max(0, min(self.inicio, len(self.lista) - self.filas))
+
+    def _redibujar(self):
+        fin = min(self.inicio + self.filas, len(self.lista))
+        texto = "\n".join(self._linea(i) for i in range(self.inicio, fin))
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", texto)
+        self.text.config(state="disabled")
+        n = len(self.lista)
+        if n:
+            self.scroll.set(self.inicio / n, fin / n)
+        else:
+            self.scroll.set(0.0, 1.0)
+
+    def _redibujar_fila(self, i):
+        linea = i - self.inicio + 1
+        self.text.config(state="normal")
+        self.text.delete(f"{linea}.0", f"{linea}.end")
+        self.text.insert(f"{linea}.0", self._linea(i))
+        self.text.config(state="disabled")
+
+    # ---- API ----
+    def mostrar(self, lista, resaltados=None):
+        """Sustituye la lista (o la misma con valores cambiados) y redibuja la ventana visible."""
+        self.lista = lista
+        self.resaltados = resaltados or ()
+        self._limitar_inicio()
+        self._redibujar()
+
+    def resaltar(self, resaltados):
+        """
+        Cambia las filas resaltadas y redibuja solo las que cambian (las antiguas
+        y las nuevas). Si la primera fila resaltada queda fuera de la ventana se
+        desplaza la vista hasta ella.
+        """
+        anteriores = self.resaltados
+        self.resaltados = resaltados or ()
+        if self.resaltados:
+            primera = self.resaltados[0]
+            if not self.inicio <= primera < self.inicio + self.filas:
+                self.inicio = primera - self.filas // 2
+                self._limitar_inicio()
+                self._redibujar()
+                return
+        fin = min(self.inicio + self.filas, len(self.lista))
+        for i in range(self.inicio, fin):
+            if i in anteriores or i in self.resaltados:
+                self._redibujar_fila(i)
+
+    # ---- desplazamiento ----
+    def _desplazar(self, filas):
+        self.inicio += filas
+        self._limitar_inicio()
+        self._redibujar()
+        return "break"
+
+    def _yview(self, *args):
+        if args[0] == "moveto":
+            self.inicio = int(float(args[1]) * len(self.lista))
+        elif args[0] == "scroll":
+            paso = self.filas if args[2] == "pages" else 1
+            self.inicio += int(args[1]) * paso
+        self._limitar_inicio()
+        self._redibujar()
+
+    def _al_redimensionar(self, event):
+        filas = max(1, event.height // self._alto_linea)
+        if filas != self.filas:
+            self.filas = filas
+            self._limitar_inicio()
+            self._redibujar()
 
 
 # -------------------------
 # Interfaz gráfica (tkinter)
 # -------------------------
 class BusquedasApp(tk.Tk):
+    # número de pasos que se piden de golpe al generador de la ordenación
+    SORT_BATCH = 64
+    # máximo de líneas que se vuelcan al mostrar la lista en la salida
+    MAX_FILAS_SALIDA = 5000
+    # elementos que se muestran al resumir la lista en una sola línea
+    MAX_ELEMENTOS_RESUMEN = 50
+
     def __init__(self):
         super().__init__()
         self.title("Busquedas - Secuencial | Binaria | Hash")
-        self.geometry("820x540")
+        self.geometry("820x580")
         self.resizable(False, False)
 
         # lista inicial aleatoria
         self.lista = [random.randint(0, 99) for _ in range(20)]
         self.metodos = ["Secuencial", "Binaria", "Hash"]
+        # índice hash reutilizable para la búsqueda Hash (se construye en la primera consulta)
+        self._indice_hash = HashIndex(self.lista)
 
         # estado de ordenación animada
         self._sorting = False
-        self._sort_actions = []
+        self._sort_stepper = None
+        self._sort_actions = deque()
+        self._sort_nombre = None
+
+        # versión de la lista: cambia con cada modificación; si coincide con
+        # _version_ordenada se sabe que la lista está ordenada sin recorrerla
+        self._version_lista = 0
+        self._version_ordenada = None
+
+        # líneas de salida pendientes; se escriben juntas en el siguiente momento ocioso de Tk
+        self._salida_pendiente = []
+        self._volcado_programado = False
 
         self._create_widgets()
         self._update_lista_display()
@@ -123,7 +429,7 @@ class BusquedasApp(tk.Tk):
         btn_gen.pack(side="left", padx=6)
 
         # Botón de ordenar ahora lanza la ordenación paso a paso
-        btn_ordenar = ttk.Button(toolbar, text="Ordenar lista (para Binaria)", command=self.iniciar_ordenacion_paso)
+        btn_ordenar = ttk.Button(toolbar, text="Ordenar lista (para Binaria)", command=self.ordenar_lista)
         btn_ordenar.pack(side="left", padx=6)
 
         btn_cargar = ttk.Button(toolbar, text="Cargar lista personalizada", command=self.abrir_dialogo_cargar)
@@ -132,6 +438,19 @@ class BusquedasApp(tk.Tk):
         btn_limpiar = ttk.Button(toolbar, text="Limpiar salida", command=self.limpiar_salida)
         btn_limpiar.pack(side="left", padx=6)
 
+        # segunda fila: algoritmo de ordenación y modo de traza
+        toolbar_orden = ttk.Frame(self, padding=(6,0,6,6))
+        toolbar_orden.pack(fill="x")
+
+        ttk.Label(toolbar_orden, text="Algoritmo de ordenación:").pack(side="left", padx=(0,6))
+        self.orden_combo = ttk.Combobox(toolbar_orden, values=list(ALGORITMOS), state="readonly", width=22)
+        self.orden_combo.current(0)
+        self.orden_combo.pack(side="left")
+
+        self.traza_var = tk.BooleanVar(value=True)
+        self._chk_traza = ttk.Checkbutton(toolbar_orden, text="Paso a paso", variable=self.traza_var)
+        self._chk_traza.pack(side="left", padx=(10,0))
+
         # guardamos referencias a algunos botones para habilitar/deshabilitar
         self._btn_ordenar = btn_ordenar
         self._btn_gen = btn_gen
@@ -146,8 +465,8 @@ class BusquedasApp(tk.Tk):
         left.pack_propagate(False)
 
         ttk.Label(left, text="Lista actual (elementos):").pack(anchor="w")
-        self.lista_text = tk.Text(left, width=30, height=24, state="disabled", wrap="none")
-        self.lista_text.pack(fill="y", expand=True, pady=(6,0))
+        self.vista_lista = VistaListaVirtual(left, width=30, height=24)
+        self.vista_lista.pack(fill="both", expand=True, pady=(6,0))
 
         right = ttk.Frame(main)
         right.pack(side="left", fill="both", expand=True, padx=(12,0))
@@ -170,8 +489,11 @@ class BusquedasApp(tk.Tk):
         self._append_salida("Mostrando lista elemento por elemento:")
         self._append_salida("-" * 40)
 
-        for i, v in enumerate(self.lista):
-            self._append_salida(f"Índice {i:02d} → Valor: {v}")
+        limite = self.MAX_FILAS_SALIDA
+        self._append_salida_lote(f"Índice {i:02d} → Valor: {v}"
+                                 for i, v in enumerate(itertools.islice(self.lista, limite)))
+        if len(self.lista) > limite:
+            self._append_salida(f"... ({len(self.lista) - limite} elementos más; usa la lista de la izquierda para verlos)")
 
         self.status_var.set("Elementos mostrados en la salida.")
 
@@ -179,26 +501,48 @@ class BusquedasApp(tk.Tk):
     # Funciones UI existentes
     # -------------------------
     def _append_salida(self, texto):
+        self._salida_pendiente.append(texto)
+        self._programar_volcado()
+
+    def _append_salida_lote(self, textos):
+        self._salida_pendiente.extend(textos)
+        self._programar_volcado()
+
+    def _programar_volcado(self):
+        if not self._volcado_programado:
+            self._volcado_programado = True
+            self.after_idle(self._volcar_salida)
+
+    def _volcar_salida(self):
+        """Escribe de una vez todas las líneas acumuladas (un solo insert/see/config)."""
+        self._volcado_programado = False
+        if not self._salida_pendiente:
+            return
+        bloque = "\n".join(self._salida_pendiente) + "\n"
+        self._salida_pendiente.clear()
         self.salida_text.config(state="normal")
-        self.salida_text.insert("end", texto + "\n")
+        self.salida_text.insert("end", bloque)
         self.salida_text.see("end")
         self.salida_text.config(state="disabled")
 
+    def _resumen_lista(self):
+        """La lista en una línea, recortada si es muy larga."""
+        limite = self.MAX_ELEMENTOS_RESUMEN
+        texto = ", ".join(str(x) for x in itertools.islice(self.lista, limite))
+        if len(self.lista) > limite:
+            texto += f", ... ({len(self.lista)} elementos)"
+        return texto
+
     def _update_lista_display(self, highlight_indices=None):
         """
-        Actualiza la visualización textual de la lista en la columna izquierda.
+        Actualiza la visualización de la lista en la columna izquierda.
         Si highlight_indices es una tupla/lista, marca esos índices con un marcador.
+        Solo se dibujan las filas visibles.
         """
-        self.lista_text.config(state="normal")
-        self.lista_text.delete("1.0", "end")
-        for i, v in enumerate(self.lista):
-            marker = ""
-            if highlight_indices and i in highlight_indices:
-                marker = "  <--"
-            self.lista_text.insert("end", f"{i:02d}: {v}{marker}\n")
-        self.lista_text.config(state="disabled")
+        self.vista_lista.mostrar(self.lista, highlight_indices)
 
     def limpiar_salida(self):
+        self._salida_pendiente.clear()
         self.salida_text.config(state="normal")
         self.salida_text.delete("1.0", "end")
         self.salida_text.config(state="disabled")
@@ -209,6 +553,8 @@ class BusquedasApp(tk.Tk):
             messagebox.showinfo("Ordenación en progreso", "Espera a que termine la ordenación antes de generar nueva lista.")
             return
         self.lista = [random.randint(0, 99) for _ in range(20)]
+        self._indice_hash.reconstruir(self.lista)
+        self._version_lista += 1
         self._update_lista_display()
         self.status_var.set("Lista generada aleatoriamente.")
         self._append_salida("Nueva lista generada.")
@@ -242,26 +588,45 @@ class BusquedasApp(tk.Tk):
                 messagebox.showerror("Error al parsear", str(e), parent=dialog)
                 return
 
-            if len(nueva_lista) == 0:
-                messagebox.showwarning("Lista vacía", "No se detectaron números válidos.", parent=dialog)
-                return
-
-            # limitar tamaño razonable para interfaz
-            if len(nueva_lista) > 200:
-                if not messagebox.askyesno("Lista grande", f"La lista tiene {len(nueva_lista)} elementos. ¿Deseas continuar?"):
-                    return
+            if self._aplicar_lista_cargada(nueva_lista, dialog):
+                dialog.destroy()
 
-            self.lista = nueva_lista
-            self._update_lista_display()
-            self.status_var.set(f"Lista personalizada cargada ({len(self.lista)} elementos).")
-            self._append_salida(f"Lista personalizada cargada ({len(self.lista)} elementos).")
-            dialog.destroy()
+        def cargar_archivo():
+            ruta = filedialog.askopenfilename(
+                parent=dialog, title="Archivo de enteros",
+                filetypes=[("Texto / CSV", "*.txt *.csv"), ("Binario int32", "*.i32"),
+                           ("Binario int64", "*.i64 *.bin"), ("Todos", "*")])
+            if not ruta:
+                return
+            try:
+                nueva_lista = cargar_numeros(ruta).tolist()
+            except (ValueError, OSError) as e:
+                messagebox.showerror("Error al cargar archivo", str(e), parent=dialog)
+                return
+            if self._aplicar_lista_cargada(nueva_lista, dialog):
+                dialog.destroy()
 
         btn_frame = ttk.Frame(dialog)
         btn_frame.pack(fill="x", pady=8, padx=8)
+        ttk.Button(btn_frame, text="Desde archivo...", command=cargar_archivo).pack(side="left")
         ttk.Button(btn_frame, text="Cargar y cerrar", command=cargar_y_cerrar).pack(side="right", padx=(6,0))
         ttk.Button(btn_frame, text="Cancelar", command=dialog.destroy).pack(side="right")
 
+    def _aplicar_lista_cargada(self, nueva_lista, parent):
+        """Sustituye la lista actual por nueva_lista tras validarla; devuelve True si se cargó."""
+        if len(nueva_lista) == 0:
+            messagebox.showwarning("Lista vacía", "No se detectaron números válidos.", parent=parent)
+            return False
+
+        # la carga es por bloques y la vista está virtualizada: las listas grandes no necesitan confirmación
+        self.lista = nueva_lista
+        self._indice_hash.reconstruir(self.lista)
+        self._version_lista += 1
+        self._update_lista_display()
+        self.status_var.set(f"Lista personalizada cargada ({len(self.lista)} elementos).")
+        self._append_salida(f"Lista personalizada cargada ({len(self.lista)} elementos).")
+        return True
+
     def _parsear_numeros(self, texto: str):
         """
         Recibe un texto con números separados por comas, espacios, saltos de línea u otros separadores simples.
@@ -269,74 +634,95 @@ class BusquedasApp(tk.Tk):
         """
         if not texto:
             return []
-        # dividir por comas o espacios o saltos de línea
-        tokens = re.split(r'[,\s]+', texto.strip())
-        nums = []
-        for t in tokens:
-            if t == '':
-                continue
-            # permitir signo negativo
-            if re.fullmatch(r'[+-]?\d+', t):
-                nums.append(int(t))
-            else:
-                # token inválido: lanzar error con detalle
-                raise ValueError(f"Token inválido encontrado: '{t}'. Usa solo números separados por comas, espacios o saltos de línea.")
-        return nums
+        return parsear_texto(texto).tolist()
 
     # -------------------------
-    # Ordenación paso a paso (Bubble Sort)
+    # Ordenación (algoritmo elegido, con o sin traza)
     # -------------------------
+    def _lista_ordenada(self):
+        """Indica si la lista está ordenada; solo la recorre si cambió desde la última comprobación."""
+        if self._version_ordenada == self._version_lista:
+            return True
+        if esta_ordenada(self.lista):
+            self._version_ordenada = self._version_lista
+            return True
+        return False
+
+    def ordenar_lista(self):
+        if self._sorting:
+            return
+        if self.traza_var.get():
+            self.iniciar_ordenacion_paso()
+        else:
+            self.ordenar_sin_traza()
+
+    def ordenar_sin_traza(self):
+        nombre = self.orden_combo.get()
+        ordenar, _ = ALGORITMOS[nombre]
+        # se ordena en sitio para que el índice hash siga apuntando a la misma lista
+        self.lista[:] = ordenar(self.lista)
+        self._indice_hash.reconstruir()
+        self._version_lista += 1
+        self._version_ordenada = self._version_lista
+        self._update_lista_display()
+        self._append_salida(f"Lista ordenada con {nombre} (sin traza).")
+        self.status_var.set(f"Lista ordenada ({nombre}).")
+
     def iniciar_ordenacion_paso(self):
         if self._sorting:
             return
-        n = len(self.lista)
-        actions = []
-        arr_copy = list(self.lista)
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                actions.append(('compare', j, j+1, list(arr_copy)))
-                if arr_copy[j] > arr_copy[j+1]:
-                    arr_copy[j], arr_copy[j+1] = arr_copy[j+1], arr_copy[j]
-                    actions.append(('swap', j, j+1, list(arr_copy)))
-            actions.append(('pass_complete', n - i - 1, None, list(arr_copy)))
-
-        self._sort_actions = actions
-        if not actions:
+        if len(self.lista) < 2:
             self._append_salida("La lista está vacía o no requiere ordenación.")
             return
+        self._sort_nombre = self.orden_combo.get()
+        _, pasos = ALGORITMOS[self._sort_nombre]
+        # los pasos se generan bajo demanda; solo se guarda un pequeño lote pendiente
+        self._sort_stepper = pasos(self.lista)
+        self._sort_actions = deque()
         self._sorting = True
+        self._version_lista += 1
         self._set_controls_enabled(False)
         self.limpiar_salida()
-        self._append_salida("Iniciando ordenación paso a paso (Bubble Sort)...")
+        self._append_salida(f"Iniciando ordenación paso a paso ({self._sort_nombre})...")
         self._append_salida("-" * 40)
         self.after(200, self._perform_next_sort_action)
 
-    def _perform_next_sort_action(self):
+    def _next_sort_action(self):
         if not self._sort_actions:
+            self._sort_actions.extend(itertools.islice(self._sort_stepper, self.SORT_BATCH))
+        return self._sort_actions.popleft() if self._sort_actions else None
+
+    def _perform_next_sort_action(self):
+        action = self._next_sort_action()
+        if action is None:
             self._sorting = False
+            self._sort_stepper = None
+            self._version_ordenada = self._version_lista
             self._update_lista_display()
             self._append_salida("-" * 40)
             self._append_salida("Ordenación finalizada.")
-            self.status_var.set("Lista ordenada (Bubble Sort).")
+            self.status_var.set(f"Lista ordenada ({self._sort_nombre}).")
             self._set_controls_enabled(True)
             return
 
-        action = self._sort_actions.pop(0)
-        kind = action[0]
+        kind, j, k = action
         if kind == 'compare':
-            j, k, state = action[1], action[2], action[3]
-            self._append_salida(f"Comparando índices {j} (val={state[j]}) y {k} (val={state[k]})")
-            self._update_lista_display(highlight_indices=(j, k))
+            self._append_salida(f"Comparando índices {j} (val={self.lista[j]}) y {k} (val={self.lista[k]})")
+            self.vista_lista.resaltar((j, k))
         elif kind == 'swap':
-            j, k, state = action[1], action[2], action[3]
-            self.lista = state
-            self._append_salida(f"Intercambio: índice {j} <-> índice {k} -> nueva sublista: {self.lista}")
-            self._update_lista_display(highlight_indices=(j, k))
+            # el intercambio se aplica sobre la lista actual para que el índice hash siga válido
+            self._indice_hash.intercambiar(j, k)
+            self._append_salida(f"Intercambio: índice {j} <-> índice {k} -> nueva sublista: {self._resumen_lista()}")
+            self.vista_lista.resaltar((j, k))
+        elif kind == 'set':
+            self._indice_hash.asignar(j, k)
+            self._append_salida(f"Escritura: índice {j} <- valor {k}")
+            self.vista_lista.resaltar((j,))
+        elif kind == 'range':
+            self._append_salida(f"Trabajando el tramo de índices {j}..{k}")
+            self.vista_lista.resaltar(range(j, k + 1))
         elif kind == 'pass_complete':
-            idx = action[1]
-            state = action[3]
-            self.lista = state
-            self._append_salida(f"Finalizado paso: posición {idx} fijada con valor {self.lista[idx]}")
+            self._append_salida(f"Finalizado paso: posición {j} fijada con valor {self.lista[j]}")
             self._update_lista_display()
         else:
             self._append_salida(f"Acción desconocida: {action}")
@@ -352,6 +738,8 @@ class BusquedasApp(tk.Tk):
         self._btn_gen.config(state=state)
         self._btn_buscar.config(state=state)
         self._btn_cargar.config(state=state)
+        self.orden_combo.config(state='readonly' if enabled else 'disabled')
+        self._chk_traza.config(state=state)
 
     # -------------------------
     # Búsquedas
@@ -377,14 +765,23 @@ class BusquedasApp(tk.Tk):
         self.limpiar_salida()
         self._append_salida(f"Método seleccionado: {metodo}")
         self._append_salida(f"Valor buscado: {valor}")
-        self._append_salida("Lista: " + ", ".join(str(x) for x in self.lista))
+        self._append_salida("Lista: " + self._resumen_lista())
         self._append_salida("-" * 40)
 
-        def paso_cb(texto):
-            self._append_salida(texto)
+        # los pasos se acumulan como eventos y se dibujan de una sola vez al terminar;
+        # con listas grandes la traza no cabría en la salida y se busca sin ella
+        eventos = []
+        registrar = eventos.append
+        if len(self.lista) > self.MAX_FILAS_SALIDA:
+            registrar = None
+            self._append_salida(f"Lista de {len(self.lista)} elementos: búsqueda sin traza.")
+
+        def volcar_pasos():
+            self._append_salida_lote(formatear_evento(e) for e in eventos)
 
         if metodo == "Secuencial":
-            idx = busqueda_secuencial(self.lista, valor, paso_cb)
+            idx = busqueda_secuencial(self.lista, valor, eventos=registrar)
+            volcar_pasos()
             if idx != -1:
                 self._append_salida(f"Resultado: encontrado en índice {idx}.")
                 self.status_var.set(f"Encontrado en índice {idx}.")
@@ -393,15 +790,17 @@ class BusquedasApp(tk.Tk):
                 self.status_var.set("Valor no encontrado.")
 
         elif metodo == "Binaria":
-            if any(self.lista[i] > self.lista[i+1] for i in range(len(self.lista)-1)):
+            if not self._lista_ordenada():
                 respuesta = messagebox.askyesno("La lista no está ordenada",
                                                 "La búsqueda binaria necesita lista ordenada. ¿Deseas ordenarla ahora?")
                 if respuesta:
-                    self.iniciar_ordenacion_paso()
-                    return
+                    self.ordenar_lista()
+                    if self._sorting:
+                        return
                 else:
                     self._append_salida("Aviso: la lista no está ordenada. Resultado puede ser incorrecto.")
-            idx = busqueda_binaria(self.lista, valor, verbose_callback=paso_cb)
+            idx = busqueda_binaria(self.lista, valor, eventos=registrar)
+            volcar_pasos()
             if idx != -1:
                 self._append_salida(f"Resultado: encontrado en índice {idx}.")
                 self.status_var.set(f"Encontrado en índice {idx}.")
@@ -410,7 +809,8 @@ class BusquedasApp(tk.Tk):
                 self.status_var.set("Valor no encontrado.")
 
         elif metodo == "Hash":
-            indices = busqueda_hash(self.lista, valor, verbose_callback=paso_cb)
+            indices = busqueda_hash(self.lista, valor, indice=self._indice_hash, eventos=registrar)
+            volcar_pasos()
             if indices:
                 self._append_salida(f"Resultado: encontrado en índice(s) {indices}.")
                 self.status_var.set(f"Encontrado {len(indices)} ocurrencia(s).")
@@ -1,119 +1,198 @@
 
+import bisect
+import time
 from typing import List
 
 # -----------------------------
-# Ordenamiento Burbuja (Bubble)
+# Ordenamientos con key= / reverse= y observador opcional
 # -----------------------------
+#
+# Cada función devuelve una lista nueva ordenada, sin modificar la original.
+# Si se pasa un observador, se le llama como observador(evento, lista) en
+# cada paso, donde evento es una tupla (tipo, datos...) y lista es el estado
+# actual. Sin observador no se genera ninguna salida; con imprimir_paso se
+# obtiene la salida paso a paso del menú.
+#
+# key= se resuelve decorando cada elemento como (clave, posición, valor), de
+# modo que nunca se comparan los valores originales y la posición desempata.
+# reverse=True invierte la entrada, ordena ascendente y vuelve a invertir,
+# lo que da el mismo orden que sorted(..., reverse=True) en los algoritmos
+# estables (burbuja, inserción y sacudida). Con key= el observador recibe
+# los valores originales, no las tuplas decoradas.
+
+def _preparar(arr, key, reverse):
+    lista = list(arr)
+    if reverse:
+        lista.reverse()
+    if key is not None:
+        lista = [(key(v), i, v) for i, v in enumerate(lista)]
+    return lista
 
-def burbuja_verbose(arr: List[int]) -> List[int]:
-    """Ordenamiento burbuja con salida paso a paso.
+def _observador(observador, key):
+    """Con key= quita la decoración de la lista y de los valores de cada evento antes de avisar."""
+    if observador is None or key is None:
+        return observador
+
+    def obs(evento, lista):
+        evento = tuple(x[2] if isinstance(x, tuple) else x for x in evento)
+        observador(evento, [t[2] for t in lista])
+    return obs
+
+def _terminar(lista, key, reverse):
+    if key is not None:
+        lista = [t[2] for t in lista]
+    if reverse:
+        lista.reverse()
+    return lista
 
-    Para cada pasada se compara pares adyacentes y se intercambian si están
-    en el orden incorrecto. Después de cada intercambio se imprime el estado
-    de la lista. También se muestra el estado al final de cada pasada.
-    """
-    n = len(arr)
-    print("\n--- Burbuja: inicio ---")
+def burbuja(arr, key=None, reverse=False, observador=None):
+    """Burbuja con frontera del último intercambio: lo que queda tras él ya está en su sitio."""
+    lista = _preparar(arr, key, reverse)
+    obs = _observador(observador, key)
+    limite = len(lista) - 1
+    pasada = 0
+    while limite > 0:
+        pasada += 1
+        if obs:
+            obs(("pasada", pasada, limite - 1), lista)
+        ultimo = 0
+        for j in range(limite):
+            a, b = lista[j], lista[j + 1]
+            if a > b:
+                lista[j], lista[j + 1] = b, a
+                ultimo = j
+                if obs:
+                    obs(("intercambio", j, j + 1, a, b), lista)
+            elif obs:
+                obs(("sin_cambio", j, j + 1, a, b), lista)
+        limite = ultimo
+        if obs:
+            obs(("fin_pasada", pasada, limite), lista)
+    return _terminar(lista, key, reverse)
+
+def insercion(arr, key=None, reverse=False, observador=None):
+    """Inserción con búsqueda binaria de la posición y desplazamiento por slice."""
+    lista = _preparar(arr, key, reverse)
+    obs = _observador(observador, key)
+    for i in range(1, len(lista)):
+        x = lista[i]
+        # bisect_right mantiene la estabilidad: x queda detrás de sus iguales
+        pos = bisect.bisect_right(lista, x, 0, i)
+        if pos == i:
+            if obs:
+                obs(("ya_colocado", i, x), lista)
+            continue
+        lista[pos + 1:i + 1] = lista[pos:i]
+        lista[pos] = x
+        if obs:
+            obs(("insertar", i, pos, x), lista)
+    return _terminar(lista, key, reverse)
+
+def sacudida(arr, key=None, reverse=False, observador=None):
+    """Cocktail shaker: pasadas alternas de ida y vuelta, con fronteras por último intercambio."""
+    lista = _preparar(arr, key, reverse)
+    obs = _observador(observador, key)
+    lo, hi = 0, len(lista) - 1
+    while lo < hi:
+        if obs:
+            obs(("ida", lo, hi), lista)
+        ultimo = lo
+        for j in range(lo, hi):
+            a, b = lista[j], lista[j + 1]
+            if a > b:
+                lista[j], lista[j + 1] = b, a
+                ultimo = j
+                if obs:
+                    obs(("intercambio", j, j + 1, a, b), lista)
+        hi = ultimo
+        if obs:
+            obs(("vuelta", lo, hi), lista)
+        ultimo = hi
+        for j in range(hi, lo, -1):
+            a, b = lista[j - 1], lista[j]
+            if a > b:
+                lista[j - 1], lista[j] = b, a
+                ultimo = j
+                if obs:
+                    obs(("intercambio", j - 1, j, a, b), lista)
+        lo = ultimo
+    return _terminar(lista, key, reverse)
+
+def seleccion(arr, key=None, reverse=False, observador=None):
+    """Selección que busca a la vez el mínimo y el máximo y fija los dos extremos en cada pasada (no estable)."""
+    lista = _preparar(arr, key, reverse)
+    obs = _observador(observador, key)
+    lo, hi = 0, len(lista) - 1
+    while lo < hi:
+        imin = imax = lo
+        for j in range(lo + 1, hi + 1):
+            if lista[j] < lista[imin]:
+                imin = j
+            elif lista[j] > lista[imax]:
+                imax = j
+        if obs:
+            obs(("extremos", lo, hi, imin, imax, lista[imin], lista[imax]), lista)
+        lista[lo], lista[imin] = lista[imin], lista[lo]
+        # si el máximo estaba en lo, el intercambio anterior lo movió a imin
+        if imax == lo:
+            imax = imin
+        lista[hi], lista[imax] = lista[imax], lista[hi]
+        if obs:
+            obs(("fijados", lo, hi), lista)
+        lo += 1
+        hi -= 1
+    return _terminar(lista, key, reverse)
+
+_FORMATOS_PASO = {
+    "pasada": "\nPasada {0} (comprobando índices 0..{1}):",
+    "intercambio": "  Comparando lista[{0}]={2} y lista[{1}]={3} -> intercambio -> {lista}",
+    "sin_cambio": "  Comparando lista[{0}]={2} y lista[{1}]={3} -> sin cambio",
+    "fin_pasada": "Estado al final de la pasada {0}: {lista} (siguiente frontera: {1})",
+    "ya_colocado": "  lista[{0}]={1} ya está en su posición",
+    "insertar": "  lista[{0}]={2} se inserta en la posición {1} (búsqueda binaria) -> {lista}",
+    "ida": "\nIda: índices {0}..{1}",
+    "vuelta": "Vuelta: índices {1}..{0} (estado tras la ida: {lista})",
+    "extremos": "\nTramo {0}..{1}: mínimo lista[{2}]={4}, máximo lista[{3}]={5}",
+    "fijados": "  Fijados los extremos {0} y {1} -> {lista}",
+}
+
+def imprimir_paso(evento, lista):
+    """Observador que imprime cada paso; se puede pasar a cualquiera de las versiones rápidas."""
+    print(_FORMATOS_PASO[evento[0]].format(*evento[1:], lista=lista))
+
+def paso_a_paso(nombre, ordenar, arr: List[int]) -> List[int]:
+    """Ordena arr con ordenar imprimiendo la lista inicial, cada paso y el resultado."""
+    print(f"\n--- {nombre}: inicio ---")
     print("Lista inicial:", arr)
-
-    # Convertir a copia para no modificar la lista original pasada por referencia
-    lista = arr.copy()
-
-    for i in range(n - 1):
-        print(f"\nPasada {i + 1} (comprobando índices 0..{n-2-i}):")
-        swapped = False
-        for j in range(0, n - 1 - i):
-            print(f"  Comparando lista[{j}]={lista[j]} y lista[{j+1}]={lista[j+1]}", end='')
-            if lista[j] > lista[j + 1]:
-                # intercambio
-                lista[j], lista[j + 1] = lista[j + 1], lista[j]
-                swapped = True
-                print(f" -> intercambio -> {lista}")
-            else:
-                print(" -> sin cambio")
-        print(f"Estado al final de la pasada {i + 1}: {lista}")
-        if not swapped:
-            print("No hubo intercambios en esta pasada: la lista ya está ordenada. Se detiene el algoritmo.")
-            break
-
-    print("Burbuja: lista ordenada final:", lista)
+    lista = ordenar(arr, observador=imprimir_paso)
+    print(f"{nombre}: lista ordenada final:", lista)
     return lista
 
-# -----------------------------
-# Ordenamiento Inserción
-# -----------------------------
+def burbuja_verbose(arr: List[int]) -> List[int]:
+    """Ordenamiento burbuja con salida paso a paso."""
+    return paso_a_paso("Burbuja", burbuja, arr)
 
 def insercion_verbose(arr: List[int]) -> List[int]:
-    """Ordenamiento por inserción con salida paso a paso.
-
-    Construye la lista ordenada insertando un elemento a la vez en su
-    posición correcta. Se imprime el proceso de desplazamiento para cada
-    elemento clave.
-    """
-    print("\n--- Inserción: inicio ---")
-    print("Lista inicial:", arr)
-
-    lista = arr.copy()
-    n = len(lista)
-
-    for i in range(1, n):
-        key = lista[i]
-        j = i - 1
-        print(f"\nInsertando elemento en índice {i} (valor={key}) en la sublista ordenada 0..{i-1}:")
-        print(f"  Estado antes: {lista}")
-
-        # desplazar elementos mayores que key a la derecha
-        while j >= 0 and lista[j] > key:
-            print(f"  lista[{j}]={lista[j]} > key={key} -> desplazar lista[{j}] a la posición {j+1}")
-            lista[j + 1] = lista[j]
-            j -= 1
-            print(f"  Estado intermedio: {lista}")
-
-        lista[j + 1] = key
-        print(f"  Colocar key en la posición {j+1}: {lista}")
-
-    print("Inserción: lista ordenada final:", lista)
-    return lista
-
-# -----------------------------
-# Ordenamiento Selección
-# -----------------------------
+    """Ordenamiento por inserción con salida paso a paso."""
+    return paso_a_paso("Inserción", insercion, arr)
 
 def seleccion_verbose(arr: List[int]) -> List[int]:
-    """Ordenamiento por selección con salida paso a paso.
-
-    En cada iteración se busca el elemento mínimo en la parte no ordenada y
-    se intercambia con la primera posición no ordenada. Se muestran las
-    comparaciones y el intercambio cuando ocurre.
-    """
-    print("\n--- Selección: inicio ---")
-    print("Lista inicial:", arr)
-
-    lista = arr.copy()
-    n = len(lista)
-
-    for i in range(n - 1):
-        min_idx = i
-        print(f"\nIteración {i + 1}: buscar mínimo en la sublista índices {i}..{n-1}")
-        for j in range(i + 1, n):
-            print(f"  Comparando lista[{j}]={lista[j]} con lista[{min_idx}]={lista[min_idx]}", end='')
-            if lista[j] < lista[min_idx]:
-                min_idx = j
-                print(f" -> nuevo mínimo en índice {min_idx}")
-            else:
-                print(" -> no cambia")
-
-        # intercambiar el mínimo encontrado con la posición i
-        if min_idx != i:
-            print(f"  Intercambiar lista[{i}]={lista[i]} con lista[{min_idx}]={lista[min_idx]}")
-            lista[i], lista[min_idx] = lista[min_idx], lista[i]
-        else:
-            print(f"  El mínimo ya está en la posición {i} (sin intercambio)")
-
-        print(f"Estado al final de la iteración {i + 1}: {lista}")
-
-    print("Selección: lista ordenada final:", lista)
-    return lista
+    """Ordenamiento por selección con salida paso a paso."""
+    return paso_a_paso("Selección", seleccion, arr)
+
+# opciones 1-3 del menú
+PASO_A_PASO = {
+    '1': ("Burbuja", burbuja),
+    '2': ("Inserción", insercion),
+    '3': ("Selección", seleccion),
+}
+
+ALGORITMOS_RAPIDOS = {
+    "Burbuja": burbuja,
+    "Inserción binaria": insercion,
+    "Sacudida (cocktail)": sacudida,
+    "Selección mín/máx": seleccion,
+}
 
 # -----------------------------
 # Función auxiliar para leer lista desde input
@@ -129,10 +208,76 @@ def leer_lista_desde_input(texto: str) -> List[int]:
         raise ValueError("No se ingresaron números.")
     return [int(p) for p in partes]
 
+def ejecutar_paralelo(lista: List[int]) -> None:
+    """Ordena con el motor paralelo (necesita NumPy) y lo compara con sorted()."""
+    try:
+        from Ordenamiento_Paralelo import ordenar_paralelo
+    except ImportError as e:
+        print("El ordenamiento paralelo no está disponible:", e)
+        return
+    inicio = time.perf_counter()
+    try:
+        resultado = ordenar_paralelo(lista).tolist()
+    except OverflowError:
+        print("El ordenamiento paralelo trabaja con enteros de 64 bits: hay valores fuera de rango.")
+        return
+    t_paralelo = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    referencia = sorted(lista)
+    t_sorted = time.perf_counter() - inicio
+    muestra = resultado if len(resultado) <= 20 else f"{resultado[:20]} ..."
+    print("\nMerge sort paralelo:", muestra)
+    print(f"Tiempo paralelo: {t_paralelo:.6f} s | sorted(): {t_sorted:.6f} s | iguales: {resultado == referencia}")
+
+def ejecutar_enteros(lista: List[int]) -> None:
+    """Ordena con conteo o radix LSD (según el rango de valores) y muestra el método elegido."""
+    from Ordenamiento_Enteros import ordenar_enteros
+
+    inicio = time.perf_counter()
+    try:
+        resultado, metodo = ordenar_enteros(lista)
+    except OverflowError:
+        print("Conteo y radix trabajan con enteros de 64 bits: hay valores fuera de rango.")
+        return
+    segundos = time.perf_counter() - inicio
+    resultado = resultado.tolist()
+    muestra = resultado if len(resultado) <= 20 else f"{resultado[:20]} ..."
+    print(f"\nMétodo elegido: {metodo} ({segundos:.6f} s)")
+    print("Lista ordenada:", muestra)
+
+def ejecutar_externo() -> None:
+    """Pide rutas y presupuesto de memoria y ordena un archivo de enteros en disco."""
+    from Ordenamiento_Externo import ordenar_archivo, MEMORIA
+
+    entrada = input("Archivo de entrada (texto, .i32 o .i64): ").strip()
+    salida = input("Archivo de salida (.txt para texto, otro para binario int64): ").strip()
+    memoria_mb = input(f"Memoria en MB (vacío = {MEMORIA >> 20}): ").strip()
+    try:
+        memoria = int(memoria_mb) << 20 if memoria_mb else MEMORIA
+        formato_salida = "texto" if salida.lower().endswith(".txt") else "int64"
+        inicio = time.perf_counter()
+        tramos = ordenar_archivo(entrada, salida, formato_salida=formato_salida, memoria=memoria)
+    except (ValueError, OSError) as e:
+        print("No se pudo ordenar el archivo:", e)
+        return
+    print(f"Archivo ordenado en {time.perf_counter() - inicio:.3f} s usando {tramos} tramo(s): {salida}")
+
 # -----------------------------
 # Menú principal
 # -----------------------------
 
+def ejecutar_rapidos(lista: List[int]) -> None:
+    """Ejecuta las versiones rápidas sobre la lista y muestra el tiempo de cada una."""
+    muestra = lista if len(lista) <= 20 else f"{lista[:20]} ... ({len(lista)} elementos)"
+    print("\nLista inicial:", muestra)
+    for nombre, ordenar in ALGORITMOS_RAPIDOS.items():
+        inicio = time.perf_counter()
+        resultado = ordenar(lista)
+        segundos = time.perf_counter() - inicio
+        muestra = resultado if len(resultado) <= 20 else f"{resultado[:20]} ..."
+        print(f"{nombre:<22} {segundos:.6f} s -> {muestra}")
+
+
 def menu_principal():
     ejemplo = [34, 12, 5, 66, 1]
 
@@ -143,6 +288,10 @@ def menu_principal():
         print("2) Inserción (paso a paso)")
         print("3) Selección (paso a paso)")
         print("4) Probar los 3 con la lista de ejemplo")
+        print("5) Versiones rápidas (sin salida paso a paso) con tiempos")
+        print("6) Merge sort paralelo (varios procesos, memoria compartida)")
+        print("7) Ordenar un archivo más grande que la memoria (ordenamiento externo)")
+        print("8) Conteo / Radix LSD para enteros (elección automática)")
         print("0) Salir")
 
         opcion = input("Opción: ").strip()
@@ -154,12 +303,15 @@ def menu_principal():
         if opcion == '4':
             lista = ejemplo
             print("Usando lista de ejemplo:", lista)
-            burbuja_verbose(lista)
-            insercion_verbose(lista)
-            seleccion_verbose(lista)
+            for nombre, ordenar in PASO_A_PASO.values():
+                paso_a_paso(nombre, ordenar, lista)
+            continue
+
+        if opcion == '7':
+            ejecutar_externo()
             continue
 
-        if opcion not in {'1', '2', '3'}:
+        if opcion not in {'1', '2', '3', '5', '6', '8'}:
             print("Opción inválida. Intenta otra vez.")
             continue
 
@@ -175,12 +327,15 @@ def menu_principal():
                 print("Entrada inválida:", e)
                 continue
 
-        if opcion == '1':
-            burbuja_verbose(lista)
-        elif opcion == '2':
-            insercion_verbose(lista)
-        elif opcion == '3':
-            seleccion_verbose(lista)
+        if opcion in PASO_A_PASO:
+            nombre, ordenar = PASO_A_PASO[opcion]
+            paso_a_paso(nombre, ordenar, lista)
+        elif opcion == '5':
+            ejecutar_rapidos(lista)
+        elif opcion == '6':
+            ejecutar_paralelo(lista)
+        elif opcion == '8':
+            ejecutar_enteros(lista)
 
 # -----------------------------
 # Ejecución directa
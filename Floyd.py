@@ -1,16 +1,260 @@
-def floyd_warshall(g):
-    dist = [fila[:] for fila in g]
-    n = len(g)
+"""
+Floyd.py
 
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
+Floyd-Warshall (caminos mínimos entre todos los pares) vectorizado con NumPy.
+
+Cada paso k relaja la matriz completa de una vez:
+    dist = min(dist, dist[:, k] + dist[k, :])
+y la matriz 'siguiente' (primer salto de cada camino) se actualiza con la
+misma máscara de mejora. Trabaja en float64 con np.inf para "sin camino", o
+en int64 con INF_ENTERO como centinela si la matriz es entera.
+
+floyd_warshall mantiene la interfaz original (listas con INF = 999999);
+ORBEABSD.floyd_warshall_with_next usa el mismo motor.
+
+Para grafos grandes (10.000+ nodos) floyd_warshall_bloques hace la versión
+por bloques: en cada ronda se recorre paso a paso la cruz formada por las
+filas y columnas del bloque K, guardando la fila k y la columna k de cada
+paso, y con ellas se actualiza el resto de bloques. Esos bloques son
+independientes y se reparten en un pool de hilos (NumPy suelta el GIL en las
+operaciones grandes); la matriz puede vivir en un archivo .npy mapeado en
+memoria si no cabe en RAM. El resultado, 'siguiente' incluida, es idéntico
+al de floyd_warshall_np.
+"""
 
-    return dist
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 INF = 999999
+# centinela para matrices int64: dos centinelas sumados aún caben en int64
+INF_ENTERO = 1 << 61
+
+# -------------------------
+# Conversión de entradas
+# -------------------------
+def matriz_distancias(g, inf=INF, entera=None):
+    """
+    Convierte una matriz de adyacencia (listas o np.ndarray) al formato del motor.
+    Los valores >= inf se toman como "sin arista". Si entera es None se usa
+    int64 cuando todos los pesos son enteros y float64 en otro caso.
+    """
+    D = np.array(g, dtype=np.float64)
+    sin_arista = ~(D < inf)
+    finitos = D[~sin_arista]
+    if entera is None:
+        entera = bool(np.all(finitos == np.round(finitos)))
+    if entera:
+        D = np.where(sin_arista, INF_ENTERO, D).astype(np.int64)
+    else:
+        D[sin_arista] = np.inf
+    np.fill_diagonal(D, np.minimum(np.diagonal(D), 0))
+    return D
+
+def matriz_desde_diccionario(nodes, graph, entera=True):
+    """Matriz de distancias a partir de un grafo {u: {v: peso}}; devuelve (D, idx)."""
+    idx = {v: i for i, v in enumerate(nodes)}
+    n = len(nodes)
+    if entera:
+        D = np.full((n, n), INF_ENTERO, dtype=np.int64)
+    else:
+        D = np.full((n, n), np.inf)
+    np.fill_diagonal(D, 0)
+    for u in nodes:
+        i = idx[u]
+        for v, w in graph.get(u, {}).items():
+            if v in idx:
+                D[i, idx[v]] = min(D[i, idx[v]], w)
+    return D, idx
+
+def _infinito(D):
+    return INF_ENTERO if np.issubdtype(D.dtype, np.integer) else np.inf
+
+# -------------------------
+# Motor
+# -------------------------
+def floyd_warshall_np(D, con_siguiente=False):
+    """
+    Floyd-Warshall sobre una matriz de matriz_distancias / matriz_desde_diccionario.
+    Devuelve dist, o (dist, siguiente) si con_siguiente; siguiente[i, j] es el
+    índice del primer nodo tras i en el camino mínimo a j (-1 si no hay camino).
+    """
+    dist = np.array(D, copy=True)
+    n = dist.shape[0]
+    entera = np.issubdtype(dist.dtype, np.integer)
+    inf = _infinito(dist)
+
+    siguiente = None
+    if con_siguiente:
+        siguiente = np.where(dist < inf, np.arange(n, dtype=np.int32)[None, :], -1).astype(np.int32)
+    # buffers reutilizados en cada paso para no reservar n^2 elementos por k
+    candidato = np.empty_like(dist)
+    mejora = np.empty(dist.shape, dtype=bool) if con_siguiente else None
+    plano = siguiente.reshape(-1) if con_siguiente else None
+    for k in range(n):
+        columna = dist[:, k].copy()
+        np.add(columna[:, None], dist[k, :][None, :], out=candidato)
+        if con_siguiente:
+            np.less(candidato, dist, out=mejora)
+            # las mejoras suelen ser pocas: se actualizan por índice plano,
+            # que es más barato que recorrer toda la matriz con where=
+            mejorados = np.flatnonzero(mejora)
+            if mejorados.size:
+                plano[mejorados] = siguiente[:, k][mejorados // n]
+        np.minimum(dist, candidato, out=dist)
+
+    if entera:
+        # con pesos negativos un centinela puede haber bajado un poco: se restaura
+        sin_camino = dist >= inf // 2
+        dist[sin_camino] = inf
+        if con_siguiente:
+            siguiente[sin_camino] = -1
+    return (dist, siguiente) if con_siguiente else dist
+
+# -------------------------
+# Versión por bloques
+# -------------------------
+BLOQUE = 256
+# filas por banda al copiar o corregir matrices mapeadas en disco
+_BANDA = 1024
+
+def _relajar_bloque(C, A, B, sigC=None, sigA=None):
+    """C = min(C, A[:, k] + B[k, :]) para cada k en orden; A y B pueden ser el propio C."""
+    candidato = np.empty_like(C)
+    mejora = np.empty(C.shape, dtype=bool) if sigC is not None else None
+    for k in range(A.shape[1]):
+        np.add(A[:, k, None], B[k, None, :], out=candidato)
+        if sigC is not None:
+            np.less(candidato, C, out=mejora)
+            filas, cols = np.nonzero(mejora)
+            if filas.size:
+                sigC[filas, cols] = sigA[filas, k]
+        np.minimum(C, candidato, out=C)
+
+def _matriz_trabajo(D, archivo, dtype=None):
+    """Copia D en RAM o, si se indica archivo, en un .npy mapeado en memoria."""
+    dtype = D.dtype if dtype is None else dtype
+    if archivo is None:
+        return np.array(D, dtype=dtype)
+    M = np.lib.format.open_memmap(archivo, mode="w+", dtype=dtype, shape=D.shape)
+    for i in range(0, D.shape[0], _BANDA):
+        M[i:i + _BANDA] = D[i:i + _BANDA]
+    return M
+
+def floyd_warshall_bloques(D, bloque=BLOQUE, hilos=None, con_siguiente=False, archivo=None):
+    """
+    Floyd-Warshall por bloques de tamaño 'bloque' con 'hilos' hilos (por
+    defecto, uno por núcleo). D tiene el formato de matriz_distancias.
+    Si se indica archivo (.npy), dist se guarda ahí mapeada en memoria y
+    'siguiente' en archivo con sufijo .siguiente.npy; D puede ser a su vez
+    un np.memmap. Devuelve lo mismo que floyd_warshall_np.
+    """
+    n = D.shape[0]
+    entera = np.issubdtype(D.dtype, np.integer)
+    inf = _infinito(D)
+    dist = _matriz_trabajo(D, archivo)
+    siguiente = None
+    if con_siguiente:
+        ruta_sig = None if archivo is None else os.path.splitext(archivo)[0] + ".siguiente.npy"
+        if ruta_sig is None:
+            siguiente = np.empty((n, n), dtype=np.int32)
+        else:
+            siguiente = np.lib.format.open_memmap(ruta_sig, mode="w+", dtype=np.int32, shape=(n, n))
+        columnas = np.arange(n, dtype=np.int32)[None, :]
+        for i in range(0, n, _BANDA):
+            siguiente[i:i + _BANDA] = np.where(dist[i:i + _BANDA] < inf, columnas, -1)
+
+    limites = [(i, min(i + bloque, n)) for i in range(0, n, bloque)]
+
+    def cargar(M, I, J):
+        return None if M is None else np.array(M[I[0]:I[1], J[0]:J[1]])
+
+    def guardar(M, I, J, bloque_M):
+        if M is not None:
+            M[I[0]:I[1], J[0]:J[1]] = bloque_M
+
+    todo = (0, n)
+    with ThreadPoolExecutor(hilos or os.cpu_count()) as pool:
+        for K in limites:
+            # fase 1: la cruz (filas y columnas de K) paso a paso, guardando
+            # la fila k y la columna k tal como están en el paso k
+            fila, columna = cargar(dist, K, todo), cargar(dist, todo, K)
+            sig_fila, sig_columna = cargar(siguiente, K, todo), cargar(siguiente, todo, K)
+            fila_k, columna_k = np.empty_like(fila), np.empty_like(columna)
+            sig_columna_k = None if siguiente is None else np.empty_like(sig_columna)
+            for t in range(K[1] - K[0]):
+                fila_k[t] = fila[t]
+                columna_k[:, t] = columna[:, t]
+                if sig_columna is not None:
+                    sig_columna_k[:, t] = sig_columna[:, t]
+                _relajar_bloque(fila, columna_k[K[0]:K[1], t:t + 1], fila_k[t:t + 1], sig_fila,
+                                None if sig_columna is None else sig_columna_k[K[0]:K[1], t:t + 1])
+                _relajar_bloque(columna, columna_k[:, t:t + 1], fila_k[t:t + 1, K[0]:K[1]], sig_columna,
+                                None if sig_columna is None else sig_columna_k[:, t:t + 1])
+            guardar(dist, K, todo, fila)
+            guardar(dist, todo, K, columna)
+            guardar(siguiente, K, todo, sig_fila)
+            guardar(siguiente, todo, K, sig_columna)
+
+            # fase 2: el resto de bloques, independientes entre sí. Con los
+            # valores del paso k (y no los de la cruz ya cerrada) las mejoras y
+            # los primeros saltos son los mismos que en floyd_warshall_np, lo
+            # que evita ciclos en 'siguiente' cuando hay aristas de peso 0.
+            def resto(IJ):
+                I, J = IJ
+                C, sC = cargar(dist, I, J), cargar(siguiente, I, J)
+                _relajar_bloque(C, columna_k[I[0]:I[1]], fila_k[:, J[0]:J[1]], sC,
+                                None if sC is None else sig_columna_k[I[0]:I[1]])
+                guardar(dist, I, J, C)
+                guardar(siguiente, I, J, sC)
+
+            otros = [L for L in limites if L != K]
+            list(pool.map(resto, [(I, J) for I in otros for J in otros]))
+
+    if entera:
+        # mismo ajuste del centinela que en floyd_warshall_np, por bandas
+        for i in range(0, n, _BANDA):
+            sin_camino = dist[i:i + _BANDA] >= inf // 2
+            dist[i:i + _BANDA][sin_camino] = inf
+            if con_siguiente:
+                siguiente[i:i + _BANDA][sin_camino] = -1
+    if archivo is not None:
+        dist.flush()
+        if con_siguiente:
+            siguiente.flush()
+    return (dist, siguiente) if con_siguiente else dist
+
+def hay_ciclo_negativo(dist):
+    return bool((np.diagonal(dist) < 0).any())
+
+# -------------------------
+# Reconstrucción de caminos
+# -------------------------
+def reconstruir_camino(siguiente, i, j):
+    """Lista de índices del camino mínimo de i a j, o None si no hay camino."""
+    if siguiente[i, j] < 0:
+        return None
+    camino = [i]
+    while i != j:
+        i = int(siguiente[i, j])
+        camino.append(i)
+        if len(camino) > siguiente.shape[0]:
+            raise ValueError("Ciclo negativo: el camino no está bien definido.")
+    return camino
+
+def camino_entre(nodes, idx, siguiente, u, v):
+    """Como reconstruir_camino, pero con nombres de nodos."""
+    camino = reconstruir_camino(siguiente, idx[u], idx[v])
+    return None if camino is None else [nodes[i] for i in camino]
+
+def floyd_warshall(g, inf=INF):
+    """Interfaz original: recibe y devuelve listas; las distancias inalcanzables valen inf."""
+    dist = floyd_warshall_np(matriz_distancias(g, inf))
+    resultado = np.where(dist < _infinito(dist), dist, inf)
+    return resultado.tolist()
+
+
 grafo = [
     [0, 3, INF, 5],
     [2, 0, INF, 4],
@@ -18,6 +262,15 @@ grafo = [
     [INF, INF, 2, 0]
 ]
 
-res = floyd_warshall(grafo)
-for fila in res:
-    print(fila)
+if __name__ == "__main__":
+    res = floyd_warshall(grafo)
+    for fila in res:
+        print(fila)
+
+    dist, siguiente = floyd_warshall_np(matriz_distancias(grafo), con_siguiente=True)
+    print("Camino 0 -> 2:", reconstruir_camino(siguiente, 0, 2))
+
+    rng = np.random.default_rng(0)
+    D = matriz_distancias(rng.integers(1, 100, (600, 600)))
+    print("Bloques == vectorizado (600 nodos):",
+          np.array_equal(floyd_warshall_bloques(D), floyd_warshall_np(D)))
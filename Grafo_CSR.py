@@ -0,0 +1,250 @@
+"""
+Grafo_CSR.py
+
+Almacén compacto de grafos en formato CSR compartido por los módulos de
+grafos (ORBEABSD, Dijkstra, Kruskal, Floyd):
+
+- los nombres de los nodos se internan una sola vez y se trabaja con ids
+  enteros 0..n-1 (si los nodos ya son esos enteros no se guarda nombre alguno);
+- las aristas que salen de u son indices[indptr[u]:indptr[u+1]] con pesos
+  pesos[indptr[u]:indptr[u+1]], todo en arrays NumPy tipados (int32 para los
+  índices si caben, float64 o el tipo pedido para los pesos): unos 12 bytes
+  por arista frente a los cientos de un diccionario de diccionarios.
+
+Convertidores: desde_diccionario (ORBEABSD.GRAPH y Dijkstra.grafo),
+desde_lista_aristas (Kruskal.aristas), desde_matriz (Floyd.grafo) y
+desde_arrays (origen/destino/peso ya en arrays). guardar escribe cada array
+con np.save en un directorio y cargar los abre mapeados en memoria; los
+nombres van a un JSON que conserva str, int, float y tuplas de ellos.
+"""
+
+import json
+import os
+
+import numpy as np
+
+# -------------------------
+# Nombres de nodos en JSON
+# -------------------------
+# JSON no tiene tuplas: se guardan como {"tupla": [...]} y se restauran como
+# tuplas, para que los nombres sigan siendo hashables tras cargar.
+def _codificar_nombre(v):
+    if isinstance(v, tuple):
+        return {"tupla": [_codificar_nombre(x) for x in v]}
+    if v is None or isinstance(v, (str, int, float)):
+        return v
+    raise TypeError(f"Nombre de nodo no admitido al guardar: {v!r} ({type(v).__name__}). "
+                    "Usa str, int, float o tuplas de ellos.")
+
+def _decodificar_tupla(d):
+    return tuple(d["tupla"]) if d.keys() == {"tupla"} else d
+
+def nombres_a_json(nombres):
+    return json.dumps([_codificar_nombre(v) for v in nombres], ensure_ascii=False)
+
+def nombres_desde_json(texto):
+    return json.loads(texto, object_hook=_decodificar_tupla)
+
+class GrafoCSR:
+    def __init__(self, indptr, indices, pesos, nombres=None):
+        """Usa los constructores desde_*; nombres=None significa que los nodos son 0..n-1."""
+        self.indptr = indptr
+        self.indices = indices
+        self.pesos = pesos
+        self.nombres = nombres
+        self._ids = None
+
+    # -------------------------
+    # Consultas básicas
+    # -------------------------
+    @property
+    def n(self):
+        return len(self.indptr) - 1
+
+    @property
+    def m(self):
+        return int(self.indptr[-1])
+
+    def __len__(self):
+        return self.n
+
+    def id(self, nombre):
+        if self.nombres is None:
+            return nombre
+        if self._ids is None:
+            self._ids = {v: i for i, v in enumerate(self.nombres)}
+        return self._ids[nombre]
+
+    def nombre(self, i):
+        return i if self.nombres is None else self.nombres[i]
+
+    def vecinos(self, u):
+        """(indices, pesos) de las aristas que salen del id u (vistas, sin copia)."""
+        a, b = self.indptr[u], self.indptr[u + 1]
+        return self.indices[a:b], self.pesos[a:b]
+
+    def grados(self):
+        return np.diff(self.indptr)
+
+    def origenes(self):
+        """Id de origen de cada arista, en el mismo orden que indices."""
+        return np.repeat(np.arange(self.n, dtype=self.indices.dtype), self.grados())
+
+    def memoria_bytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.pesos.nbytes
+
+    # -------------------------
+    # Construcción
+    # -------------------------
+    @classmethod
+    def desde_arrays(cls, n, origen, destino, pesos, dirigido=True, nombres=None, tipo_peso=np.float64):
+        """Construye el CSR a partir de arrays de origen, destino y peso (ids 0..n-1)."""
+        origen = np.asarray(origen, dtype=np.int64)
+        destino = np.asarray(destino, dtype=np.int64)
+        pesos = np.asarray(pesos, dtype=tipo_peso)
+        if not dirigido:
+            origen, destino = np.concatenate([origen, destino]), np.concatenate([destino, origen])
+            pesos = np.concatenate([pesos, pesos])
+        tipo_indice = np.int32 if n < 2**31 else np.int64
+        orden = np.argsort(origen, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origen, minlength=n), out=indptr[1:])
+        return cls(indptr, destino[orden].astype(tipo_indice), pesos[orden], nombres)
+
+    @classmethod
+    def desde_diccionario(cls, grafo, tipo_peso=np.float64):
+        """
+        Desde {nodo: {vecino: peso}} (ORBEABSD.GRAPH) o {nodo: [(vecino, peso), ...]}
+        (Dijkstra.grafo). Los nodos que solo aparecen como vecinos también se internan.
+        """
+        nombres = list(grafo)
+        ids = {v: i for i, v in enumerate(nombres)}
+        origen, destino, pesos = [], [], []
+        for u, ady in grafo.items():
+            iu = ids[u]
+            for v, w in (ady.items() if isinstance(ady, dict) else ady):
+                iv = ids.get(v)
+                if iv is None:
+                    iv = ids[v] = len(nombres)
+                    nombres.append(v)
+                origen.append(iu)
+                destino.append(iv)
+                pesos.append(w)
+        return cls.desde_arrays(len(nombres), origen, destino, pesos, nombres=nombres, tipo_peso=tipo_peso)
+
+    @classmethod
+    def desde_lista_aristas(cls, n, aristas, dirigido=False, tipo_peso=np.float64):
+        """Desde [(u, v, peso), ...] con ids 0..n-1 (Kruskal.aristas); no dirigido por defecto."""
+        # por columnas: los ids pasan directos a int64 (por float64 se perderían los > 2^53)
+        origen, destino, pesos = zip(*aristas) if len(aristas) else ((), (), ())
+        return cls.desde_arrays(n, origen, destino, pesos, dirigido=dirigido, tipo_peso=tipo_peso)
+
+    @classmethod
+    def desde_matriz(cls, M, inf=None, tipo_peso=np.float64):
+        """
+        Desde una matriz de adyacencia densa (Floyd.grafo): cada valor fuera de
+        la diagonal menor que inf es una arista. Por defecto inf = Floyd.INF.
+        """
+        if inf is None:
+            from Floyd import INF as inf
+        A = np.asarray(M, dtype=np.float64)
+        hay = A < inf
+        np.fill_diagonal(hay, False)
+        origen, destino = np.nonzero(hay)
+        return cls.desde_arrays(A.shape[0], origen, destino, A[origen, destino], tipo_peso=tipo_peso)
+
+    # -------------------------
+    # Conversión a los formatos de los otros módulos
+    # -------------------------
+    def a_diccionario(self):
+        """{nombre: [(vecino, peso), ...]}, el formato de Dijkstra.dijkstra."""
+        ind, pes = self.indices.tolist(), self.pesos.tolist()
+        ip = self.indptr.tolist()
+        nombre = self.nombre
+        return {nombre(u): [(nombre(v), w) for v, w in zip(ind[ip[u]:ip[u + 1]], pes[ip[u]:ip[u + 1]])]
+                for u in range(self.n)}
+
+    def aristas(self, no_dirigido=False):
+        """
+        Arrays (origen, destino, peso) de las aristas, p. ej. para Kruskal.
+        Con no_dirigido, de cada par u-v guardado en los dos sentidos queda solo u < v.
+        """
+        origen, destino, pesos = self.origenes(), self.indices, self.pesos
+        if no_dirigido:
+            mascara = origen < destino
+            return origen[mascara], destino[mascara], pesos[mascara]
+        return origen, destino, pesos
+
+    def a_matriz(self, inf=np.inf):
+        """Matriz densa n x n (solo para grafos pequeños), con inf donde no hay arista y 0 en la diagonal."""
+        M = np.full((self.n, self.n), inf, dtype=np.float64)
+        # con aristas repetidas se queda el peso mínimo
+        np.minimum.at(M, (self.origenes(), self.indices), self.pesos)
+        np.fill_diagonal(M, 0)
+        return M
+
+    def transpuesto(self):
+        """Grafo con las aristas invertidas."""
+        return GrafoCSR.desde_arrays(self.n, self.indices, self.origenes(), self.pesos,
+                                     nombres=self.nombres, tipo_peso=self.pesos.dtype)
+
+    # -------------------------
+    # Disco
+    # -------------------------
+    def guardar(self, directorio):
+        """Guarda indptr.npy, indices.npy, pesos.npy y, si hay, nombres.json."""
+        os.makedirs(directorio, exist_ok=True)
+        np.save(os.path.join(directorio, "indptr.npy"), self.indptr)
+        np.save(os.path.join(directorio, "indices.npy"), self.indices)
+        np.save(os.path.join(directorio, "pesos.npy"), self.pesos)
+        if self.nombres is not None:
+            texto = nombres_a_json(self.nombres)
+            with open(os.path.join(directorio, "nombres.json"), "w", encoding="utf-8") as f:
+                f.write(texto)
+
+    @classmethod
+    def cargar(cls, directorio, mapear=True):
+        """Abre un grafo guardado; con mapear los arrays quedan en disco (np.load con mmap_mode='r')."""
+        modo = "r" if mapear else None
+        indptr = np.load(os.path.join(directorio, "indptr.npy"), mmap_mode=modo)
+        indices = np.load(os.path.join(directorio, "indices.npy"), mmap_mode=modo)
+        pesos = np.load(os.path.join(directorio, "pesos.npy"), mmap_mode=modo)
+        nombres = None
+        ruta_nombres = os.path.join(directorio, "nombres.json")
+        if os.path.exists(ruta_nombres):
+            with open(ruta_nombres, encoding="utf-8") as f:
+                nombres = nombres_desde_json(f.read())
+        return cls(indptr, indices, pesos, nombres)
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from Dijkstra import dijkstra_csr, grafo as grafo_dijkstra
+    from Floyd import floyd_warshall_np, grafo as grafo_floyd
+    from ORBEABSD import GRAPH
+
+    g = GrafoCSR.desde_diccionario(GRAPH)
+    dist, _ = dijkstra_csr(g.indptr, g.indices, g.pesos, g.id("CDMX"))
+    print("ORBEABSD desde CDMX:", {g.nombre(i): d for i, d in enumerate(dist)})
+    g = GrafoCSR.desde_diccionario(grafo_dijkstra)
+    print("Dijkstra.grafo:", g.a_diccionario())
+    g = GrafoCSR.desde_matriz(grafo_floyd)
+    print("Floyd.grafo:", floyd_warshall_np(g.a_matriz()).tolist())
+    g = GrafoCSR.desde_lista_aristas(4, [(0, 1, 4), (0, 2, 3), (1, 2, 1), (1, 3, 2), (2, 3, 4)])
+    print("Kruskal.aristas:", [tuple(a) for a in zip(*(x.tolist() for x in g.aristas(no_dirigido=True)))])
+
+    n, m = 1_000_000, 5_000_000
+    rng = np.random.default_rng(0)
+    inicio = time.perf_counter()
+    g = GrafoCSR.desde_arrays(n, rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m) * 100)
+    print(f"{m} aristas: {time.perf_counter() - inicio:.2f} s, {g.memoria_bytes() / 2**20:.0f} MiB "
+          f"({g.memoria_bytes() / m:.1f} bytes por arista)")
+    with tempfile.TemporaryDirectory() as d:
+        g.guardar(d)
+        mapeado = GrafoCSR.cargar(d)
+        inicio = time.perf_counter()
+        dist, _ = dijkstra_csr(mapeado.indptr, mapeado.indices, mapeado.pesos, 0, destino=1)
+        print(f"Dijkstra 0 -> 1 sobre el grafo mapeado: {dist[1]:.2f} en {time.perf_counter() - inicio:.2f} s")
+        del mapeado, dist
@@ -0,0 +1,330 @@
+"""
+Jerarquia_Contraccion.py
+
+Jerarquía de contracción (contraction hierarchy) para responder muchas
+consultas de distancia sobre un grafo de carreteras fijo con la forma de
+ORBEABSD.GRAPH ({nodo: {vecino: peso}}, dirigido o no).
+
+Preproceso:
+1) Los nodos se contraen de menos a más importantes. La importancia es la
+   diferencia de aristas (atajos que habría que añadir menos aristas que
+   desaparecen) más el número de vecinos ya contraídos, y se recalcula de
+   forma perezosa al sacar cada nodo de la cola.
+2) Al contraer v, para cada par u -> v -> w se busca un "testigo": un camino
+   u -> w que no pase por v y no sea más largo (Dijkstra acotado). Si no lo
+   hay se añade el atajo u -> w, recordando v para desempaquetarlo.
+3) Las aristas que salen de cada nodo hacia nodos más importantes forman el
+   grafo "hacia arriba".
+
+Consulta: Dijkstra hacia arriba desde el origen y, sobre las aristas
+invertidas, desde el destino; la distancia es el mínimo de d_ida + d_vuelta
+en los nodos que ven las dos búsquedas.
+
+guardar / cargar escriben la jerarquía en un .npz (arrays CSR), y verificar
+compara las respuestas con Dijkstra.dijkstra en pares al azar.
+"""
+
+import heapq
+import random
+
+import numpy as np
+
+from Dijkstra import INF, dijkstra
+from Grafo_CSR import nombres_a_json, nombres_desde_json
+
+# nodos fijados como máximo en cada búsqueda de testigos; si se agota se
+# añade el atajo (nunca es incorrecto, solo puede sobrar)
+LIMITE_TESTIGOS = 500
+
+class JerarquiaContraccion:
+    def __init__(self, nombres, rango, arriba, arriba_inv, medio):
+        """Usa construir_jerarquia o cargar en lugar de llamar a esto directamente."""
+        self.nombres = list(nombres)
+        self.ids = {v: i for i, v in enumerate(self.nombres)}
+        self.rango = rango
+        self.arriba = arriba          # arriba[u]: [(x, peso)] con rango[x] > rango[u]
+        self.arriba_inv = arriba_inv  # arriba_inv[u]: [(x, peso)] por aristas x -> u
+        self.medio = medio            # {(u, w): v} para cada atajo u -> v -> w
+
+    # -------------------------
+    # Consultas
+    # -------------------------
+    def _buscar(self, s, t):
+        """Devuelve (distancia, nodo de encuentro, pred_ida, pred_vuelta)."""
+        dist = ({s: 0}, {t: 0})
+        pred = ({s: -1}, {t: -1})
+        colas = ([(0, s)], [(0, t)])
+        grafos = (self.arriba, self.arriba_inv)
+        contrarios = (self.arriba_inv, self.arriba)
+        pop, push = heapq.heappop, heapq.heappush
+        mejor, encuentro = (0, s) if s == t else (INF, -1)
+        while colas[0] or colas[1]:
+            for lado in (0, 1):
+                cola = colas[lado]
+                if not cola:
+                    continue
+                d, u = pop(cola)
+                dist_lado, dist_otro = dist[lado], dist[1 - lado]
+                if d > dist_lado[u]:
+                    continue
+                if d >= mejor:
+                    cola.clear()  # este lado ya no puede mejorar la respuesta
+                    continue
+                if u in dist_otro and d + dist_otro[u] < mejor:
+                    mejor, encuentro = d + dist_otro[u], u
+                # "stall on demand": si un nodo más importante ya llega a u
+                # por menos, u no está en ningún camino mínimo de esta búsqueda
+                if any(dist_lado.get(x, INF) + w < d for x, w in contrarios[lado][u]):
+                    continue
+                pred_lado = pred[lado]
+                for x, w in grafos[lado][u]:
+                    nueva = d + w
+                    if nueva < dist_lado.get(x, INF):
+                        dist_lado[x] = nueva
+                        pred_lado[x] = u
+                        push(cola, (nueva, x))
+        return mejor, encuentro, pred[0], pred[1]
+
+    def distancia(self, origen, destino):
+        mejor, _, _, _ = self._buscar(self.ids[origen], self.ids[destino])
+        return mejor
+
+    def _desempaquetar(self, u, w, salida):
+        pila = [(u, w)]
+        while pila:
+            a, b = pila.pop()
+            v = self.medio.get((a, b))
+            if v is None:
+                salida.append(b)
+            else:
+                pila.append((v, b))
+                pila.append((a, v))
+
+    def ruta(self, origen, destino):
+        """Devuelve (distancia, camino con nombres) o (inf, None)."""
+        s, t = self.ids[origen], self.ids[destino]
+        mejor, encuentro, pred_ida, pred_vuelta = self._buscar(s, t)
+        if encuentro < 0:
+            return INF, None
+        # tramo ida (s ... encuentro) y vuelta (encuentro ... t), en aristas de la jerarquía
+        nodos = []
+        x = encuentro
+        while x != -1:
+            nodos.append(x)
+            x = pred_ida[x]
+        nodos.reverse()
+        x = pred_vuelta[encuentro]
+        while x != -1:
+            nodos.append(x)
+            x = pred_vuelta[x]
+        camino = [nodos[0]]
+        for a, b in zip(nodos, nodos[1:]):
+            self._desempaquetar(a, b, camino)
+        return mejor, [self.nombres[i] for i in camino]
+
+    # -------------------------
+    # Disco
+    # -------------------------
+    def guardar(self, ruta):
+        def a_csr(listas):
+            indptr = np.zeros(len(listas) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(l) for l in listas])
+            indices = np.array([x for l in listas for x, _ in l], dtype=np.int64)
+            pesos = np.array([w for l in listas for _, w in l], dtype=np.float64)
+            return indptr, indices, pesos
+
+        ip, ix, pw = a_csr(self.arriba)
+        ipi, ixi, pwi = a_csr(self.arriba_inv)
+        atajos = np.array([(u, w, v) for (u, w), v in self.medio.items()], dtype=np.int64).reshape(-1, 3)
+        np.savez(ruta, nombres=np.array(nombres_a_json(self.nombres)),
+                 rango=np.asarray(self.rango, dtype=np.int64),
+                 arriba_indptr=ip, arriba_indices=ix, arriba_pesos=pw,
+                 inv_indptr=ipi, inv_indices=ixi, inv_pesos=pwi, atajos=atajos)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Carga un .npz de guardar; los nombres de nodos vuelven con su tipo (como en Grafo_CSR)."""
+        with np.load(ruta) as z:
+            def listas(prefijo):
+                ip = z[prefijo + "_indptr"].tolist()
+                ix = z[prefijo + "_indices"].tolist()
+                pw = z[prefijo + "_pesos"].tolist()
+                return [list(zip(ix[ip[u]:ip[u + 1]], pw[ip[u]:ip[u + 1]])) for u in range(len(ip) - 1)]
+
+            medio = {(u, w): v for u, w, v in z["atajos"].tolist()}
+            nombres = nombres_desde_json(str(z["nombres"][()]))
+            return cls(nombres, z["rango"].tolist(), listas("arriba"), listas("inv"), medio)
+
+# -------------------------
+# Preproceso
+# -------------------------
+def _testigos(salida, origen, evitar, objetivos, limite):
+    """Dijkstra acotado desde origen sin pasar por 'evitar'; devuelve las distancias halladas."""
+    dist = {origen: 0}
+    cola = [(0, origen)]
+    pendientes = set(objetivos)
+    fijados = 0
+    while cola and pendientes and fijados < LIMITE_TESTIGOS:
+        d, u = heapq.heappop(cola)
+        if d > dist[u]:
+            continue
+        if d > limite:
+            break
+        pendientes.discard(u)
+        fijados += 1
+        for x, w in salida[u].items():
+            if x == evitar:
+                continue
+            nueva = d + w
+            if nueva < dist.get(x, INF):
+                dist[x] = nueva
+                heapq.heappush(cola, (nueva, x))
+    return dist
+
+def _atajos(v, salida, entrada):
+    """Atajos que exigiría contraer v: lista de (u, w, peso)."""
+    atajos = []
+    for u, w_uv in entrada[v].items():
+        objetivos = {w: w_uv + w_vw for w, w_vw in salida[v].items() if w != u}
+        if not objetivos:
+            continue
+        dist = _testigos(salida, u, v, objetivos, max(objetivos.values()))
+        for w, peso in objetivos.items():
+            if dist.get(w, INF) > peso:
+                atajos.append((u, w, peso))
+    return atajos
+
+def _prioridad(v, salida, entrada, vecinos_contraidos):
+    return len(_atajos(v, salida, entrada)) - len(salida[v]) - len(entrada[v]) + vecinos_contraidos[v]
+
+def construir_jerarquia(grafo):
+    """Construye la jerarquía de un grafo {nodo: {vecino: peso}} (o {nodo: [(vecino, peso)]})."""
+    nombres = list(grafo)
+    ids = {v: i for i, v in enumerate(nombres)}
+    for ady in list(grafo.values()):
+        for v in (ady if isinstance(ady, dict) else dict(ady)):
+            if v not in ids:
+                ids[v] = len(nombres)
+                nombres.append(v)
+    n = len(nombres)
+    salida = [{} for _ in range(n)]
+    entrada = [{} for _ in range(n)]
+    for u_nombre, ady in grafo.items():
+        u = ids[u_nombre]
+        for v_nombre, w in (ady.items() if isinstance(ady, dict) else ady):
+            v = ids[v_nombre]
+            if u != v and w < salida[u].get(v, INF):
+                salida[u][v] = w
+                entrada[v][u] = w
+
+    vecinos_contraidos = [0] * n
+    cola = [(_prioridad(v, salida, entrada, vecinos_contraidos), v) for v in range(n)]
+    heapq.heapify(cola)
+    rango = [-1] * n
+    arriba = [None] * n
+    arriba_inv = [None] * n
+    medio = {}
+    siguiente = 0
+    while cola:
+        _, v = heapq.heappop(cola)
+        if rango[v] >= 0:
+            continue
+        # actualización perezosa: si la prioridad subió, vuelve a la cola
+        p = _prioridad(v, salida, entrada, vecinos_contraidos)
+        if cola and p > cola[0][0]:
+            heapq.heappush(cola, (p, v))
+            continue
+
+        for u, w, peso in _atajos(v, salida, entrada):
+            if peso < salida[u].get(w, INF):
+                salida[u][w] = peso
+                entrada[w][u] = peso
+                medio[(u, w)] = v
+        rango[v] = siguiente
+        siguiente += 1
+        # los vecinos que quedan son todos más importantes que v
+        arriba[v] = list(salida[v].items())
+        arriba_inv[v] = list(entrada[v].items())
+        for w in salida[v]:
+            del entrada[w][v]
+            vecinos_contraidos[w] += 1
+        for u in entrada[v]:
+            del salida[u][v]
+            vecinos_contraidos[u] += 1
+        salida[v] = {}
+        entrada[v] = {}
+    return JerarquiaContraccion(nombres, rango, arriba, arriba_inv, medio)
+
+# -------------------------
+# Verificación
+# -------------------------
+def _como_listas(grafo):
+    return {u: list(ady.items()) if isinstance(ady, dict) else list(ady) for u, ady in grafo.items()}
+
+def _iguales(a, b):
+    return a == b or abs(a - b) <= 1e-9 * max(1.0, abs(b))
+
+def verificar(jerarquia, grafo, pares=200, semilla=0):
+    """
+    Compara distancia y ruta de la jerarquía con Dijkstra.dijkstra en pares
+    al azar; devuelve la lista de discrepancias (vacía si todo coincide).
+    """
+    rnd = random.Random(semilla)
+    listas = _como_listas(grafo)
+    pesos = {}
+    for u, ady in listas.items():
+        for v, w in ady:
+            pesos[(u, v)] = min(w, pesos.get((u, v), INF))
+    nombres = jerarquia.nombres
+    errores = []
+    for _ in range(pares):
+        s, t = rnd.choice(nombres), rnd.choice(nombres)
+        esperado = dijkstra(listas, s).get(t, INF)
+        obtenido, camino = jerarquia.ruta(s, t)
+        if camino is None:
+            largo = INF
+        elif camino[0] != s or camino[-1] != t:
+            largo = None
+        else:
+            largo = sum(pesos[(a, b)] for a, b in zip(camino, camino[1:]))
+        if not (_iguales(obtenido, esperado) and largo is not None and _iguales(largo, esperado)):
+            errores.append((s, t, esperado, obtenido, camino))
+    return errores
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    from ORBEABSD import GRAPH
+
+    ch = construir_jerarquia(GRAPH)
+    print("ORBEABSD CDMX -> Tabasco:", ch.ruta("CDMX", "Tabasco"))
+    print("Discrepancias con Dijkstra (ORBEABSD):", len(verificar(ch, GRAPH, pares=100)))
+
+    # red tipo cuadrícula de carreteras con pesos al azar
+    lado = 60
+    rnd = random.Random(0)
+    red = {(i, j): {} for i in range(lado) for j in range(lado)}
+    for i in range(lado):
+        for j in range(lado):
+            for a, b in ((i + 1, j), (i, j + 1)):
+                if a < lado and b < lado:
+                    w = rnd.randint(10, 100)
+                    red[(i, j)][(a, b)] = w
+                    red[(a, b)][(i, j)] = w
+    inicio = time.perf_counter()
+    ch = construir_jerarquia(red)
+    print(f"Preproceso de {lado * lado} nodos: {time.perf_counter() - inicio:.1f} s, {len(ch.medio)} atajos")
+    print("Discrepancias con Dijkstra (cuadrícula):", len(verificar(ch, red, pares=100)))
+
+    with tempfile.TemporaryDirectory() as d:
+        ruta = os.path.join(d, "jerarquia.npz")
+        ch.guardar(ruta)
+        cargada = JerarquiaContraccion.cargar(ruta)
+    pares = [(rnd.randrange(len(ch.nombres)), rnd.randrange(len(ch.nombres))) for _ in range(10_000)]
+    inicio = time.perf_counter()
+    for s, t in pares:
+        cargada._buscar(s, t)
+    print(f"Consulta media (jerarquía cargada de disco): {(time.perf_counter() - inicio) / len(pares) * 1e6:.0f} us")
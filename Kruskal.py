@@ -1,29 +1,106 @@
+"""
+Kruskal.py
+
+Árbol de expansión mínima con Kruskal sobre un UnionFind (conjuntos
+disjuntos) con:
+- unión por tamaño: el árbol más pequeño cuelga del más grande, así la
+  altura es O(log n);
+- find iterativo con "path halving" (cada nodo visitado pasa a apuntar a su
+  abuelo), sin recursión aunque haya cadenas largas;
+- padres y tamaños en array('i') (4 bytes por nodo; con NumPy se pueden ver
+  como np.ndarray sin copiar);
+- union_many para unir muchas aristas de golpe y el número de componentes
+  siempre al día.
+"""
+
+from array import array
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class UnionFind:
     def __init__(self, n):
-        self.padre = list(range(n))
+        codigo = 'i' if n < 2**31 else 'q'
+        self.padre = array(codigo, range(n))
+        self.tamano = array(codigo, [1]) * n
+        self.componentes = n
 
     def find(self, x):
-        if self.padre[x] != x:
-            self.padre[x] = self.find(self.padre[x])
-        return self.padre[x]
+        padre = self.padre
+        while padre[x] != x:
+            padre[x] = padre[padre[x]]
+            x = padre[x]
+        return x
 
     def union(self, a, b):
         raizA = self.find(a)
         raizB = self.find(b)
-        if raizA != raizB:
-            self.padre[raizB] = raizA
-            return True
-        return False
+        if raizA == raizB:
+            return False
+        if self.tamano[raizA] < self.tamano[raizB]:
+            raizA, raizB = raizB, raizA
+        self.padre[raizB] = raizA
+        self.tamano[raizA] += self.tamano[raizB]
+        self.componentes -= 1
+        return True
+
+    def conectados(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def union_many(self, pares, hasta=1):
+        """
+        Une los pares (u, v, ...) en orden; devuelve un bytearray con 1 en las
+        posiciones de los pares que unieron dos componentes. Se detiene (y el
+        resto queda a 0) en cuanto quedan 'hasta' componentes.
+        """
+        padre, tamano = self.padre, self.tamano
+        unidas = bytearray()
+        componentes = self.componentes
+        for par in pares:
+            if componentes <= hasta:
+                break
+            a, b = par[0], par[1]
+            while padre[a] != a:
+                padre[a] = padre[padre[a]]
+                a = padre[a]
+            while padre[b] != b:
+                padre[b] = padre[padre[b]]
+                b = padre[b]
+            if a == b:
+                unidas.append(0)
+                continue
+            if tamano[a] < tamano[b]:
+                a, b = b, a
+            padre[b] = a
+            tamano[a] += tamano[b]
+            componentes -= 1
+            unidas.append(1)
+        self.componentes = componentes
+        return unidas
+
+    def padres_numpy(self):
+        """Vista np.ndarray del array de padres (sin copia)."""
+        return np.frombuffer(self.padre, dtype=np.int32 if self.padre.typecode == 'i' else np.int64)
+
+    def etiquetas(self):
+        """Raíz de cada nodo; con NumPy se comprime todo el bosque saltando punteros en bloque."""
+        if np is None:
+            return [self.find(x) for x in range(len(self.padre))]
+        p = self.padres_numpy()
+        while True:
+            abuelo = p[p]
+            if np.array_equal(abuelo, p):
+                return p.copy()
+            p[:] = abuelo
 
 def kruskal(n, aristas):
     uf = UnionFind(n)
-    mst = []
-    aristas.sort(key=lambda x: x[2])
-
-    for u, v, w in aristas:
-        if uf.union(u, v):
-            mst.append((u, v, w))
-    return mst
+    aristas.sort(key=itemgetter(2))
+    unidas = uf.union_many(aristas)
+    return [a for a, u in zip(aristas, unidas) if u]
 
 aristas = [
     (0, 1, 4),
@@ -33,4 +110,5 @@ aristas = [
     (2, 3, 4)
 ]
 
-print(kruskal(4, aristas))
+if __name__ == "__main__":
+    print(kruskal(4, aristas))
@@ -0,0 +1,354 @@
+"""
+Motor_Ordenamiento.py
+
+Motor de ordenamiento intercambiable usado por ED5_ADA4.BusquedasApp.
+
+Cada algoritmo tiene dos versiones:
+- una silenciosa, que devuelve la lista ordenada sin generar pasos;
+- un generador de pasos para la animación, que produce deltas compactos
+  (tipo, i, j) en lugar de copias de la lista:
+    ('compare', i, j)        se comparan las posiciones i y j
+    ('swap', i, j)           se intercambian las posiciones i y j
+    ('set', i, valor)        se escribe valor en la posición i
+    ('range', lo, hi)        se empieza a trabajar el tramo lo..hi
+    ('pass_complete', i, None)  la posición i queda fijada
+
+Los generadores trabajan sobre una copia propia: quien consume los pasos
+aplica 'swap' y 'set' sobre su lista para reproducir la ordenación.
+"""
+
+import heapq
+
+# tramos de este tamaño o menos se ordenan por inserción dentro de Quicksort
+UMBRAL_INSERCION = 16
+
+# -------------------------
+# Utilidades comunes
+# -------------------------
+def esta_ordenada(arr):
+    return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+
+def _limite_profundidad(n):
+    return 2 * max(n, 1).bit_length()
+
+# -------------------------
+# Bubble Sort
+# -------------------------
+def ordenar_burbuja(arr):
+    lista = list(arr)
+    n = len(lista)
+    for i in range(n - 1):
+        swapped = False
+        for j in range(0, n - 1 - i):
+            if lista[j] > lista[j + 1]:
+                lista[j], lista[j + 1] = lista[j + 1], lista[j]
+                swapped = True
+        if not swapped:
+            break
+    return lista
+
+def pasos_burbuja(arr):
+    trabajo = list(arr)
+    n = len(trabajo)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            yield ('compare', j, j + 1)
+            if trabajo[j] > trabajo[j + 1]:
+                trabajo[j], trabajo[j + 1] = trabajo[j + 1], trabajo[j]
+                yield ('swap', j, j + 1)
+        yield ('pass_complete', n - i - 1, None)
+
+# -------------------------
+# Merge Sort (ascendente, por mezclas de tramos de ancho 1, 2, 4, ...)
+# -------------------------
+def ordenar_mezcla(arr):
+    origen = list(arr)
+    n = len(origen)
+    destino = [None] * n
+    ancho = 1
+    while ancho < n:
+        for lo in range(0, n, 2 * ancho):
+            mid = min(lo + ancho, n)
+            hi = min(lo + 2 * ancho, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if origen[j] < origen[i]:
+                    destino[k] = origen[j]
+                    j += 1
+                else:
+                    destino[k] = origen[i]
+                    i += 1
+                k += 1
+            destino[k:k + (mid - i)] = origen[i:mid]
+            k += mid - i
+            destino[k:k + (hi - j)] = origen[j:hi]
+        origen, destino = destino, origen
+        ancho *= 2
+    return origen
+
+def pasos_mezcla(arr):
+    trabajo = list(arr)
+    n = len(trabajo)
+    ancho = 1
+    while ancho < n:
+        for lo in range(0, n, 2 * ancho):
+            mid = min(lo + ancho, n)
+            hi = min(lo + 2 * ancho, n)
+            if mid >= hi:
+                continue
+            yield ('range', lo, hi - 1)
+            izquierda = trabajo[lo:mid]
+            derecha = trabajo[mid:hi]
+            i = j = 0
+            k = lo
+            while i < len(izquierda) or j < len(derecha):
+                if j >= len(derecha) or (i < len(izquierda) and not derecha[j] < izquierda[i]):
+                    valor = izquierda[i]
+                    i += 1
+                else:
+                    valor = derecha[j]
+                    j += 1
+                if trabajo[k] != valor:
+                    trabajo[k] = valor
+                    yield ('set', k, valor)
+                k += 1
+        ancho *= 2
+
+# -------------------------
+# Heap Sort
+# -------------------------
+def ordenar_monticulo(arr):
+    monticulo = list(arr)
+    heapq.heapify(monticulo)
+    return [heapq.heappop(monticulo) for _ in range(len(monticulo))]
+
+def _pasos_hundir(trabajo, lo, raiz, fin):
+    """Hunde trabajo[lo+raiz] en el montículo de máximos trabajo[lo..lo+fin-1]."""
+    while True:
+        hijo = 2 * raiz + 1
+        if hijo >= fin:
+            return
+        if hijo + 1 < fin:
+            yield ('compare', lo + hijo, lo + hijo + 1)
+            if trabajo[lo + hijo] < trabajo[lo + hijo + 1]:
+                hijo += 1
+        yield ('compare', lo + raiz, lo + hijo)
+        if not trabajo[lo + raiz] < trabajo[lo + hijo]:
+            return
+        trabajo[lo + raiz], trabajo[lo + hijo] = trabajo[lo + hijo], trabajo[lo + raiz]
+        yield ('swap', lo + raiz, lo + hijo)
+        raiz = hijo
+
+def _pasos_monticulo_rango(trabajo, lo, hi):
+    n = hi - lo + 1
+    for raiz in range(n // 2 - 1, -1, -1):
+        yield from _pasos_hundir(trabajo, lo, raiz, n)
+    for fin in range(n - 1, 0, -1):
+        trabajo[lo], trabajo[lo + fin] = trabajo[lo + fin], trabajo[lo]
+        yield ('swap', lo, lo + fin)
+        yield ('pass_complete', lo + fin, None)
+        yield from _pasos_hundir(trabajo, lo, 0, fin)
+
+def pasos_monticulo(arr):
+    trabajo = list(arr)
+    if len(trabajo) > 1:
+        yield from _pasos_monticulo_rango(trabajo, 0, len(trabajo) - 1)
+
+# -------------------------
+# Quicksort (estilo introsort: mediana de tres, inserción en tramos
+# pequeños y Heap Sort si la recursión se hace demasiado profunda)
+# -------------------------
+def _insercion_rango(a, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        key = a[i]
+        j = i - 1
+        while j >= lo and key < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = key
+
+def _hundir(a, lo, raiz, fin):
+    while True:
+        hijo = 2 * raiz + 1
+        if hijo >= fin:
+            return
+        if hijo + 1 < fin and a[lo + hijo] < a[lo + hijo + 1]:
+            hijo += 1
+        if not a[lo + raiz] < a[lo + hijo]:
+            return
+        a[lo + raiz], a[lo + hijo] = a[lo + hijo], a[lo + raiz]
+        raiz = hijo
+
+def _monticulo_rango(a, lo, hi):
+    n = hi - lo + 1
+    for raiz in range(n // 2 - 1, -1, -1):
+        _hundir(a, lo, raiz, n)
+    for fin in range(n - 1, 0, -1):
+        a[lo], a[lo + fin] = a[lo + fin], a[lo]
+        _hundir(a, lo, 0, fin)
+
+def _particion(a, lo, hi):
+    """Partición de Hoare con pivote mediana de tres; devuelve la posición final del pivote."""
+    mid = (lo + hi) // 2
+    if a[mid] < a[lo]:
+        a[mid], a[lo] = a[lo], a[mid]
+    if a[hi] < a[lo]:
+        a[hi], a[lo] = a[lo], a[hi]
+    if a[hi] < a[mid]:
+        a[hi], a[mid] = a[mid], a[hi]
+    a[lo], a[mid] = a[mid], a[lo]
+    v = a[lo]
+    i, j = lo, hi + 1
+    while True:
+        i += 1
+        while a[i] < v and i < hi:
+            i += 1
+        j -= 1
+        while v < a[j]:
+            j -= 1
+        if i >= j:
+            break
+        a[i], a[j] = a[j], a[i]
+    a[lo], a[j] = a[j], a[lo]
+    return j
+
+def ordenar_rapido(arr):
+    a = list(arr)
+    n = len(a)
+    if n < 2:
+        return a
+    pila = [(0, n - 1, _limite_profundidad(n))]
+    while pila:
+        lo, hi, profundidad = pila.pop()
+        while hi - lo + 1 > UMBRAL_INSERCION:
+            if profundidad == 0:
+                _monticulo_rango(a, lo, hi)
+                break
+            profundidad -= 1
+            p = _particion(a, lo, hi)
+            # se apila el lado mayor y se sigue con el menor: la pila queda en O(log n)
+            if p - lo < hi - p:
+                pila.append((p + 1, hi, profundidad))
+                hi = p - 1
+            else:
+                pila.append((lo, p - 1, profundidad))
+                lo = p + 1
+        else:
+            _insercion_rango(a, lo, hi)
+    return a
+
+def _pasos_insercion_rango(a, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        j = i
+        while j > lo:
+            yield ('compare', j - 1, j)
+            if not a[j] < a[j - 1]:
+                break
+            a[j - 1], a[j] = a[j], a[j - 1]
+            yield ('swap', j - 1, j)
+            j -= 1
+
+def _pasos_particion(a, lo, hi, resultado):
+    mid = (lo + hi) // 2
+    for x, y in ((mid, lo), (hi, lo), (hi, mid)):
+        yield ('compare', x, y)
+        if a[x] < a[y]:
+            a[x], a[y] = a[y], a[x]
+            yield ('swap', x, y)
+    a[lo], a[mid] = a[mid], a[lo]
+    yield ('swap', lo, mid)
+    v = a[lo]
+    i, j = lo, hi + 1
+    while True:
+        i += 1
+        while True:
+            yield ('compare', i, lo)
+            if not (a[i] < v and i < hi):
+                break
+            i += 1
+        j -= 1
+        while True:
+            yield ('compare', lo, j)
+            if not v < a[j]:
+                break
+            j -= 1
+        if i >= j:
+            break
+        a[i], a[j] = a[j], a[i]
+        yield ('swap', i, j)
+    a[lo], a[j] = a[j], a[lo]
+    yield ('swap', lo, j)
+    yield ('pass_complete', j, None)
+    resultado.append(j)
+
+def pasos_rapido(arr):
+    a = list(arr)
+    n = len(a)
+    if n < 2:
+        return
+    pila = [(0, n - 1, _limite_profundidad(n))]
+    while pila:
+        lo, hi, profundidad = pila.pop()
+        while hi - lo + 1 > UMBRAL_INSERCION:
+            yield ('range', lo, hi)
+            if profundidad == 0:
+                yield from _pasos_monticulo_rango(a, lo, hi)
+                break
+            profundidad -= 1
+            resultado = []
+            yield from _pasos_particion(a, lo, hi, resultado)
+            p = resultado[0]
+            if p - lo < hi - p:
+                pila.append((p + 1, hi, profundidad))
+                hi = p - 1
+            else:
+                pila.append((lo, p - 1, profundidad))
+                lo = p + 1
+        else:
+            if hi > lo:
+                yield ('range', lo, hi)
+                yield from _pasos_insercion_rango(a, lo, hi)
+
+# -------------------------
+# Timsort (sorted de Python)
+# -------------------------
+def ordenar_timsort(arr):
+    return sorted(arr)
+
+def pasos_timsort(arr):
+    # Timsort se ejecuta de una vez en C; la traza solo muestra las posiciones que cambian
+    trabajo = list(arr)
+    for k, valor in enumerate(sorted(trabajo)):
+        if trabajo[k] != valor:
+            yield ('set', k, valor)
+
+# -------------------------
+# Registro de algoritmos
+# -------------------------
+# nombre visible -> (versión silenciosa, generador de pasos)
+ALGORITMOS = {
+    "Bubble Sort": (ordenar_burbuja, pasos_burbuja),
+    "Merge Sort": (ordenar_mezcla, pasos_mezcla),
+    "Heap Sort": (ordenar_monticulo, pasos_monticulo),
+    "Quicksort (introsort)": (ordenar_rapido, pasos_rapido),
+    "Timsort (sorted)": (ordenar_timsort, pasos_timsort),
+}
+
+def aplicar_pasos(arr, pasos):
+    """Aplica sobre arr (en sitio) los 'swap' y 'set' de un generador de pasos."""
+    for kind, i, j in pasos:
+        if kind == 'swap':
+            arr[i], arr[j] = arr[j], arr[i]
+        elif kind == 'set':
+            arr[i] = j
+    return arr
+
+
+if __name__ == "__main__":
+    import random
+    datos = [random.randint(0, 99) for _ in range(30)]
+    print("Lista:", datos)
+    for nombre, (ordenar, pasos) in ALGORITMOS.items():
+        resultado = ordenar(datos)
+        animada = aplicar_pasos(list(datos), pasos(datos))
+        print(f"{nombre:<24} ok={resultado == animada == sorted(datos)}")
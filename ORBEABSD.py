@@ -7,7 +7,7 @@ Versión ampliada y corregida:
 - Coordenadas ajustadas para Tabasco, CDMX y Edomex.
 """
 
-import itertools
+import heapq
 import math
 import matplotlib.pyplot as plt
 import networkx as nx
@@ -15,6 +15,9 @@ from PIL import Image
 import urllib.request
 import numpy as np
 
+from Dijkstra import a_estrella, dijkstra_bidireccional, escala_admisible, heuristica_haversine, ruta_dijkstra
+from Floyd import floyd_warshall_np, matriz_desde_diccionario
+
 # --------------------------
 # Definición de estados y grafo
 # --------------------------
@@ -48,81 +51,246 @@ coords = {
 # --------------------------
 INF = 10**9
 
-def cost(u, v):
-    return GRAPH.get(u, {}).get(v, INF)
+def cost(u, v, graph=GRAPH):
+    return graph.get(u, {}).get(v, INF)
+
+# Caminos hamiltonianos: en lugar de probar las n! permutaciones, se avanza
+# solo por aristas que existen (backtracking) con los nodos como índices y
+# los visitados como máscara de bits.
+def _adyacencia(states, graph):
+    idx = {v: i for i, v in enumerate(states)}
+    # vecinos ordenados por coste: las primeras soluciones suelen ser buenas
+    vecinos = [sorted((w, idx[v]) for v, w in graph.get(u, {}).items() if v in idx)
+               for u in states]
+    mascaras = [sum(1 << j for _, j in vs) for vs in vecinos]
+    return vecinos, mascaras
+
+def iterar_caminos_hamiltonianos(states, graph=GRAPH):
+    """Genera (camino, costo) para cada camino hamiltoniano, uno a uno y sin guardarlos."""
+    n = len(states)
+    vecinos, _ = _adyacencia(states, graph)
+    completo = (1 << n) - 1
+    camino = []
+
+    def extender(u, visitados, total):
+        if visitados == completo:
+            yield [states[i] for i in camino], total
+            return
+        for w, v in vecinos[u]:
+            if not visitados & (1 << v):
+                camino.append(v)
+                yield from extender(v, visitados | (1 << v), total + w)
+                camino.pop()
+
+    for inicio in range(n):
+        camino.append(inicio)
+        yield from extender(inicio, 1 << inicio, 0)
+        camino.pop()
 
 def find_hamiltonian_paths(states):
-    results = []
-    for perm in itertools.permutations(states):
-        total = 0
-        valid = True
-        for i in range(len(states)-1):
-            c = cost(perm[i], perm[i+1])
-            if c >= INF:
-                valid = False
-                break
-            total += c
-        if valid:
-            results.append((list(perm), total))
-    return results
-
-def floyd_warshall_with_next(nodes):
-    idx = {v:i for i,v in enumerate(nodes)}
-    n = len(nodes)
-    dist = [[INF]*n for _ in range(n)]
-    nxt = [[None]*n for _ in range(n)]
-    for i,u in enumerate(nodes):
-        dist[i][i] = 0
-        nxt[i][i] = u
-        for v,w in GRAPH.get(u, {}).items():
-            j = idx[v]
-            dist[i][j] = w
-            nxt[i][j] = v
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
-                    nxt[i][j] = nxt[i][k]
+    return list(iterar_caminos_hamiltonianos(states))
+
+def _arbol_minimo(pendientes, vecinos):
+    """Peso del árbol de expansión mínimo (Prim) del subgrafo inducido por 'pendientes'; INF si no es conexo."""
+    inicio = (pendientes & -pendientes).bit_length() - 1
+    dentro = 1 << inicio
+    total = 0
+    cola = [(w, v) for w, v in vecinos[inicio] if pendientes >> v & 1]
+    heapq.heapify(cola)
+    while cola and dentro != pendientes:
+        w, v = heapq.heappop(cola)
+        if dentro >> v & 1:
+            continue
+        dentro |= 1 << v
+        total += w
+        for w2, x in vecinos[v]:
+            if pendientes >> x & 1 and not dentro >> x & 1:
+                heapq.heappush(cola, (w2, x))
+    return total if dentro == pendientes else INF
+
+def mejor_camino_hamiltoniano(states, graph=GRAPH, modo="poda"):
+    """
+    Devuelve (camino, costo) del camino hamiltoniano más barato, o None si no hay.
+    modo="poda": backtracking con ramificación y acotamiento. Lo que falta del
+      camino recorre todos los nodos pendientes, así que cuesta al menos la
+      arista más barata desde el nodo actual hacia ellos más el árbol de
+      expansión mínimo de los pendientes (memorizado por máscara). También se
+      poda si dos pendientes solo tienen un vecino disponible (los dos
+      tendrían que ser el final del camino) y si ya se llegó al mismo nodo
+      con los mismos visitados y menor costo.
+    modo="dp": Held-Karp (tsp_path_minimum) sobre las aristas directas.
+    """
+    n = len(states)
+    if n == 0:
+        return None
+    if modo == "dp":
+        directa = [[0 if u == v else cost(u, v, graph) for v in states] for u in states]
+        costo, ruta = tsp_path_minimum(states, directa)
+        return None if ruta is None else (ruta, costo)
+    if modo != "poda":
+        raise ValueError(f"Modo desconocido: '{modo}'. Usa 'poda' o 'dp'.")
+
+    vecinos, mascaras = _adyacencia(states, graph)
+    completo = (1 << n) - 1
+    mejor = [INF, None]
+    camino = []
+    arboles = {}
+    alcanzados = {}
+
+    def buscar(u, visitados, total):
+        if visitados == completo:
+            if total < mejor[0]:
+                mejor[0], mejor[1] = total, list(camino)
+            return
+        previo = alcanzados.get((visitados, u))
+        if previo is not None and previo <= total:
+            return
+        alcanzados[(visitados, u)] = total
+
+        pendientes = completo & ~visitados
+        arbol = arboles.get(pendientes)
+        if arbol is None:
+            arbol = arboles[pendientes] = _arbol_minimo(pendientes, vecinos)
+        enlace = min((w for w, v in vecinos[u] if pendientes >> v & 1), default=INF)
+        if total + enlace + arbol >= mejor[0]:
+            return
+
+        disponibles = pendientes | (1 << u)
+        extremos = 0
+        resto = pendientes
+        while resto:
+            bit = resto & -resto
+            resto ^= bit
+            if bin(mascaras[bit.bit_length() - 1] & disponibles).count("1") == 1:
+                extremos += 1
+                if extremos > 1:
+                    return
+
+        for w, v in vecinos[u]:
+            if pendientes >> v & 1:
+                camino.append(v)
+                buscar(v, visitados | (1 << v), total + w)
+                camino.pop()
+
+    for inicio in range(n):
+        camino.append(inicio)
+        buscar(inicio, 1 << inicio, 0)
+        camino.pop()
+    if mejor[1] is None:
+        return None
+    return [states[i] for i in mejor[1]], mejor[0]
+
+def floyd_warshall_with_next(nodes, graph=GRAPH):
+    """
+    Distancias mínimas entre todos los pares con el motor vectorizado de Floyd.py.
+    Devuelve (dist, nxt, idx): dist es float64 con np.inf si no hay camino y
+    nxt[i, j] el índice del siguiente nodo (-1 si no hay camino); las rutas se
+    reconstruyen con Floyd.camino_entre(nodes, idx, nxt, u, v).
+    """
+    D, idx = matriz_desde_diccionario(nodes, graph, entera=False)
+    dist, nxt = floyd_warshall_np(D, con_siguiente=True)
     return dist, nxt, idx
 
-def tsp_path_minimum(nodes, dist):
+# Held-Karp por capas de popcount: DP[mask][last] solo depende de máscaras
+# con un bit menos, así que basta con tener vivas la capa actual y la
+# anterior. Las máscaras de cada capa se guardan ordenadas y se localizan con
+# np.searchsorted. Si se pide la ruta, se guarda además el padre de cada
+# estado como uint8 (el último nodo anterior), no como tupla (last, mask).
+TSP_BLOQUE = 1 << 16  # filas por bloque al relajar, acota la memoria temporal
+
+def _popcount(x):
+    x = x - ((x >> 1) & 0x55555555)
+    x = (x & 0x33333333) + ((x >> 2) & 0x33333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F
+    return (x * 0x01010101 & 0xFFFFFFFF) >> 24
+
+def _matriz_costos(dist, n):
+    """Devuelve (matriz, infinito, tipo de almacenamiento) para el DP."""
+    D = np.asarray(dist, dtype=np.float64).reshape(n, n)
+    sin_arista = D >= INF
+    finitos = D[~sin_arista]
+    enteros = finitos.size == 0 or np.all(finitos == np.round(finitos))
+    cota = (n - 1) * (finitos.max() if finitos.size else 0)
+    if enteros and cota < 2**30:
+        # costes enteros: int32 con centinela 2^30; las sumas se hacen en int64
+        inf = 2**30
+        M = np.where(sin_arista, inf, D).astype(np.int64)
+        return M, inf, np.int32
+    M = np.where(sin_arista, np.inf, D)
+    return M, np.inf, np.float64
+
+def tsp_path_minimum(nodes, dist, con_ruta=True):
     n = len(nodes)
-    ALL = 1<<n
-    DP = [[INF]*n for _ in range(ALL)]
-    parent = [[(-1,-1)]*n for _ in range(ALL)]
-    for i in range(n):
-        DP[1<<i][i] = 0
-    for mask in range(ALL):
-        for last in range(n):
-            if DP[mask][last] >= INF: continue
-            for nxt_node in range(n):
-                if mask & (1<<nxt_node): continue
-                newmask = mask | (1<<nxt_node)
-                newcost = DP[mask][last] + dist[last][nxt_node]
-                if newcost < DP[newmask][nxt_node]:
-                    DP[newmask][nxt_node] = newcost
-                    parent[newmask][nxt_node] = (last, mask)
-    full = ALL - 1
-    best_cost = INF
-    best_end = -1
-    for end in range(n):
-        if DP[full][end] < best_cost:
-            best_cost = DP[full][end]
-            best_end = end
-    if best_end == -1:
+    if n == 0:
+        return None, None
+    if n > 32:
+        raise ValueError("Held-Karp admite como máximo 32 nodos.")
+    M, inf, tipo = _matriz_costos(dist, n)
+
+    todas = np.arange(1 << n, dtype=np.uint32)
+    pc = _popcount(todas)
+    del todas
+
+    mascaras = np.array([1 << i for i in range(n)], dtype=np.uint32)
+    DP = np.full((n, n), inf, dtype=tipo)
+    DP[np.arange(n), np.arange(n)] = 0
+    capas = [(mascaras, None)]  # (máscaras de la capa, padres) si se pide la ruta
+
+    for k in range(2, n + 1):
+        nuevas = np.flatnonzero(pc == k).astype(np.uint32)
+        DP_nueva = np.full((nuevas.size, n), inf, dtype=tipo)
+        padres = np.zeros((nuevas.size, n), dtype=np.uint8) if con_ruta else None
+        for j in range(n):
+            filas = np.flatnonzero((nuevas >> np.uint32(j)) & np.uint32(1))
+            previas = np.searchsorted(mascaras, nuevas[filas] ^ np.uint32(1 << j))
+            for ini in range(0, filas.size, TSP_BLOQUE):
+                f = filas[ini:ini + TSP_BLOQUE]
+                cand = DP[previas[ini:ini + TSP_BLOQUE]].astype(M.dtype) + M[:, j]
+                mejor = cand.argmin(axis=1)
+                costo = cand[np.arange(f.size), mejor]
+                DP_nueva[f, j] = np.minimum(costo, inf)
+                if con_ruta:
+                    padres[f, j] = mejor
+        mascaras, DP = nuevas, DP_nueva
+        if con_ruta:
+            capas.append((mascaras, padres))
+    del pc
+
+    # con k = n solo queda la máscara completa
+    best_end = int(DP[0].argmin())
+    best_cost = DP[0, best_end]
+    if best_cost >= inf:
         return None, None
-    route_idx = []
-    cur_mask = full
+    best_cost = int(best_cost) if tipo is np.int32 else float(best_cost)
+    if not con_ruta:
+        return best_cost, None
+
+    route_idx = [best_end]
+    cur_mask = (1 << n) - 1
     cur = best_end
-    while cur != -1:
-        route_idx.append(cur)
-        prev, prev_mask = parent[cur_mask][cur]
+    for k in range(n, 1, -1):
+        mascaras_k, padres_k = capas[k - 1]
+        fila = np.searchsorted(mascaras_k, np.uint32(cur_mask))
+        prev = int(padres_k[fila, cur])
+        cur_mask ^= 1 << cur
         cur = prev
-        cur_mask = prev_mask
+        route_idx.append(cur)
     route_idx.reverse()
     return best_cost, [nodes[i] for i in route_idx]
 
+# Rutas origen -> destino: A* usa la distancia en línea recta desde coords,
+# escalada para que nunca supere el peso de una arista
+def ruta_punto_a_punto(origen, destino, metodo="a_estrella", graph=GRAPH):
+    """Devuelve (costo, ruta, nodos fijados) con "a_estrella", "bidireccional" o "dijkstra"."""
+    if metodo == "a_estrella":
+        h = heuristica_haversine(coords, destino, escala_admisible(graph, coords))
+        return a_estrella(graph, origen, destino, h)
+    if metodo == "bidireccional":
+        return dijkstra_bidireccional(graph, origen, destino)
+    if metodo == "dijkstra":
+        return ruta_dijkstra(graph, origen, destino)
+    raise ValueError(f"Método desconocido: '{metodo}'. Usa 'a_estrella', 'bidireccional' o 'dijkstra'.")
+
 # --------------------------
 # Mostrar resultados
 # --------------------------
@@ -135,11 +303,10 @@ def solve_and_show():
                 print(f"  {u} - {v}: {w} km")
 
     print("\n(a) Recorrido sin repetir:")
-    paths = find_hamiltonian_paths(STATES)
-    if not paths:
+    best = mejor_camino_hamiltoniano(STATES)
+    if best is None:
         print("  No hay camino hamiltoniano directo.")
     else:
-        best = min(paths, key=lambda x:x[1])
         print(f"  Mejor ruta: {' -> '.join(best[0])}")
         print(f"  Costo total: {best[1]} km")
 
@@ -149,6 +316,11 @@ def solve_and_show():
     print(f"  Mejor ruta (orden principal): {' -> '.join(best_route)}")
     print(f"  Costo mínimo total: {best_cost} km")
 
+    print("\n(c) Ruta CDMX -> Tabasco:")
+    for metodo in ("dijkstra", "bidireccional", "a_estrella"):
+        costo, ruta, fijados = ruta_punto_a_punto("CDMX", "Tabasco", metodo)
+        print(f"  {metodo:<14} {costo} km  {' -> '.join(ruta)}  ({fijados} estados fijados)")
+
 # --------------------------
 # Dibuja el grafo sobre el mapa (grande y con posiciones corregidas)
 # --------------------------
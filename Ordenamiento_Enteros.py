@@ -0,0 +1,121 @@
+"""
+Ordenamiento_Enteros.py
+
+Ordenamientos de enteros que no comparan elementos, en tiempo lineal:
+
+1) Conteo (counting sort): cuenta cuántas veces aparece cada valor del rango
+   min..max. Ideal cuando el rango es pequeño comparado con n, como las
+   listas 0..99 de ED5_ADA4 o las calificaciones 50..100 de arreglos.py.
+2) Radix LSD por bytes: 8 pasadas estables de 8 bits sobre enteros de 64
+   bits. Los negativos se ordenan invirtiendo el bit de signo, de modo que
+   el orden sin signo coincide con el orden con signo. Se saltan las
+   pasadas en las que todos los elementos tienen el mismo byte.
+
+ordenar_enteros elige el método según la relación entre rango y n.
+
+Con NumPy se trabaja sobre np.ndarray int64 y se devuelve un np.ndarray;
+sin NumPy se trabaja sobre array('q') y se devuelve un array('q').
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# el conteo se usa si el rango de valores no supera FACTOR_RANGO * n (y
+# tampoco RANGO_MAXIMO, para acotar la memoria de la tabla de conteos)
+FACTOR_RANGO = 4
+RANGO_MAXIMO = 1 << 24
+
+_SIGNO = 1 << 63
+
+# -------------------------
+# Conteo
+# -------------------------
+def ordenamiento_conteo(datos):
+    if np is not None:
+        arr = np.asarray(datos, dtype=np.int64).ravel()
+        if arr.size == 0:
+            return arr.copy()
+        minimo = int(arr.min())
+        conteos = np.bincount(arr - minimo)
+        return np.repeat(np.arange(minimo, minimo + conteos.size, dtype=np.int64), conteos)
+
+    arr = array("q", datos)
+    if not arr:
+        return arr
+    minimo, maximo = min(arr), max(arr)
+    conteos = [0] * (maximo - minimo + 1)
+    for v in arr:
+        conteos[v - minimo] += 1
+    resultado = array("q")
+    for desplazamiento, c in enumerate(conteos):
+        if c:
+            resultado.extend(array("q", [minimo + desplazamiento]) * c)
+    return resultado
+
+# -------------------------
+# Radix LSD por bytes
+# -------------------------
+def radix_lsd(datos):
+    if np is not None:
+        arr = np.asarray(datos, dtype=np.int64).ravel()
+        # invertir el bit de signo: el orden sin signo pasa a ser el orden con signo
+        claves = arr.view(np.uint64) ^ np.uint64(_SIGNO)
+        for desplazamiento in range(0, 64, 8):
+            byte = ((claves >> np.uint64(desplazamiento)) & np.uint64(0xFF)).astype(np.uint8)
+            if byte.size == 0 or (byte == byte[0]).all():
+                continue
+            # argsort estable sobre claves de 8 bits es el reparto por cubetas de una pasada
+            orden = np.argsort(byte, kind="stable")
+            claves = claves[orden]
+        return (claves ^ np.uint64(_SIGNO)).view(np.int64)
+
+    # sumar 2^63 equivale a invertir el bit de signo en complemento a dos
+    claves = [v + _SIGNO for v in array("q", datos)]
+    for desplazamiento in range(0, 64, 8):
+        cubetas = [[] for _ in range(256)]
+        for c in claves:
+            cubetas[(c >> desplazamiento) & 0xFF].append(c)
+        if max(len(b) for b in cubetas) == len(claves):
+            continue
+        claves = [c for b in cubetas for c in b]
+    return array("q", [c - _SIGNO for c in claves])
+
+# -------------------------
+# Selección automática
+# -------------------------
+def elegir_metodo(datos):
+    """Devuelve "conteo" si el rango de valores es pequeño respecto a n y "radix" en otro caso."""
+    n = len(datos)
+    if n == 0:
+        return "conteo"
+    if np is not None:
+        arr = np.asarray(datos)
+        rango = int(arr.max()) - int(arr.min()) + 1
+    else:
+        rango = max(datos) - min(datos) + 1
+    if rango <= min(FACTOR_RANGO * n, RANGO_MAXIMO):
+        return "conteo"
+    return "radix"
+
+def ordenar_enteros(datos):
+    """Ordena enteros de 64 bits con conteo o radix según convenga; devuelve (resultado, método)."""
+    metodo = elegir_metodo(datos)
+    if metodo == "conteo":
+        return ordenamiento_conteo(datos), metodo
+    return radix_lsd(datos), metodo
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    for nombre, datos in [("calificaciones 50..100", [random.randint(50, 100) for _ in range(1_000_000)]),
+                          ("enteros de 64 bits", [random.randint(-2**63, 2**63 - 1) for _ in range(1_000_000)])]:
+        inicio = time.perf_counter()
+        resultado, metodo = ordenar_enteros(datos)
+        segundos = time.perf_counter() - inicio
+        print(f"{nombre:<24} método={metodo:<7} {segundos:.3f} s  correcto={list(resultado) == sorted(datos)}")
@@ -0,0 +1,201 @@
+"""
+Ordenamiento_Externo.py
+
+Ordenamiento externo (merge sort en disco) para archivos de enteros más
+grandes que la memoria disponible.
+
+1) La entrada se lee por bloques con Cargador_Numeros (texto o binario).
+2) Se acumulan enteros hasta llenar el presupuesto de memoria, se ordenan y
+   se vuelcan a un archivo temporal ("tramo") en binario int64 little-endian.
+3) Los tramos se mezclan con heapq.merge leyendo cada uno por bloques. Si hay
+   más tramos que MAX_FUSION se hacen varias pasadas de mezcla.
+4) El resultado se escribe por bloques en binario int64 o en texto (un
+   entero por línea).
+
+La memoria usada queda acotada por el parámetro 'memoria' (en bytes), sea
+cual sea el tamaño del archivo.
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+
+from Cargador_Numeros import iterar_numeros
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# presupuesto de memoria por defecto para los tramos (64 MiB)
+MEMORIA = 64 << 20
+# máximo de tramos que se mezclan a la vez (limita los archivos abiertos)
+MAX_FUSION = 64
+# enteros que se leen o escriben de golpe en cada archivo durante la mezcla
+BLOQUE_FUSION = 1 << 14
+
+# bytes por entero mientras se ordena un tramo en memoria: con NumPy se
+# ordena el propio buffer int64; sin NumPy sorted() crea enteros de Python
+# (~28 bytes) más el puntero de la lista (8 bytes)
+_BYTES_POR_ENTERO = 8 if np is not None else 8 + 36
+
+# -------------------------
+# Archivos de tramos (int64 little-endian)
+# -------------------------
+def _a_little_endian(nums):
+    if sys.byteorder == "big":
+        nums = array("q", nums)
+        nums.byteswap()
+    return nums
+
+def _escribir_tramo(nums, directorio):
+    fd, ruta = tempfile.mkstemp(suffix=".i64", dir=directorio)
+    with os.fdopen(fd, "wb") as f:
+        _a_little_endian(nums).tofile(f)
+    return ruta
+
+def _leer_tramo(ruta, bloque=BLOQUE_FUSION):
+    """Produce los enteros de un tramo leyéndolo por bloques."""
+    with open(ruta, "rb") as f:
+        while True:
+            datos = f.read(bloque * 8)
+            if not datos:
+                return
+            nums = array("q")
+            nums.frombytes(datos)
+            if sys.byteorder == "big":
+                nums.byteswap()
+            yield from nums
+
+def _ordenar_buffer(nums):
+    if np is not None:
+        # se ordena en sitio el propio buffer del array, sin copias
+        vista = np.frombuffer(nums, dtype=np.int64)
+        vista.sort()
+        del vista
+        return nums
+    return array("q", sorted(nums))
+
+# -------------------------
+# Fases del algoritmo
+# -------------------------
+def generar_tramos(ruta, formato=None, memoria=MEMORIA, directorio=None):
+    """Lee la entrada por bloques y devuelve la lista de archivos de tramos ordenados."""
+    if memoria <= 0:
+        raise ValueError(f"El presupuesto de memoria debe ser mayor que 0 (se pidieron {memoria} bytes).")
+    # la mitad del presupuesto para el tramo y el resto para el bloque de lectura y la ordenación
+    capacidad = max(1, memoria // (2 * _BYTES_POR_ENTERO))
+    tam_bloque = max(1 << 12, min(capacidad * 8, 1 << 22))
+    tramos = []
+    buffer = array("q")
+    try:
+        for bloque in iterar_numeros(ruta, formato, tam_bloque):
+            inicio = 0
+            while inicio < len(bloque):
+                hueco = capacidad - len(buffer)
+                buffer.extend(bloque[inicio:inicio + hueco])
+                inicio += hueco
+                if len(buffer) >= capacidad:
+                    tramos.append(_escribir_tramo(_ordenar_buffer(buffer), directorio))
+                    buffer = array("q")
+        if buffer:
+            tramos.append(_escribir_tramo(_ordenar_buffer(buffer), directorio))
+    except BaseException:
+        _borrar(tramos)
+        raise
+    return tramos
+
+def _escribir_salida(valores, ruta, formato_salida):
+    if formato_salida == "int64":
+        with open(ruta, "wb") as f:
+            bloque = array("q")
+            for v in valores:
+                bloque.append(v)
+                if len(bloque) >= BLOQUE_FUSION:
+                    _a_little_endian(bloque).tofile(f)
+                    bloque = array("q")
+            _a_little_endian(bloque).tofile(f)
+    elif formato_salida == "texto":
+        with open(ruta, "w", encoding="ascii") as f:
+            lineas = []
+            for v in valores:
+                lineas.append(str(v))
+                if len(lineas) >= BLOQUE_FUSION:
+                    f.write("\n".join(lineas) + "\n")
+                    lineas = []
+            if lineas:
+                f.write("\n".join(lineas) + "\n")
+    else:
+        raise ValueError(f"Formato de salida desconocido: '{formato_salida}'. Usa 'texto' o 'int64'.")
+
+def _borrar(rutas):
+    for r in rutas:
+        try:
+            os.remove(r)
+        except OSError:
+            pass
+
+def fusionar_tramos(tramos, salida, formato_salida="int64", max_fusion=MAX_FUSION, directorio=None):
+    """Mezcla los tramos en el archivo de salida (en varias pasadas si hay demasiados) y los borra."""
+    try:
+        while len(tramos) > max_fusion:
+            siguientes = []
+            try:
+                for i in range(0, len(tramos), max_fusion):
+                    grupo = tramos[i:i + max_fusion]
+                    fd, ruta = tempfile.mkstemp(suffix=".i64", dir=directorio)
+                    os.close(fd)
+                    siguientes.append(ruta)
+                    _escribir_salida(heapq.merge(*[_leer_tramo(t) for t in grupo]), ruta, "int64")
+                    _borrar(grupo)
+            except BaseException:
+                # los tramos de esta pasada los borra el finally; aquí los de la siguiente
+                _borrar(siguientes)
+                raise
+            tramos = siguientes
+        _escribir_salida(heapq.merge(*[_leer_tramo(t) for t in tramos]), salida, formato_salida)
+    finally:
+        _borrar(tramos)
+
+def ordenar_archivo(entrada, salida, formato=None, formato_salida="int64",
+                    memoria=MEMORIA, max_fusion=MAX_FUSION, directorio=None):
+    """
+    Ordena los enteros del archivo 'entrada' y escribe el resultado en 'salida'.
+    formato: formato de la entrada ("texto", "int32", "int64" o None para deducirlo).
+    formato_salida: "int64" (binario little-endian) o "texto" (un entero por línea).
+    memoria: presupuesto en bytes para los tramos en memoria.
+    directorio: dónde crear los archivos temporales (por defecto, el del sistema).
+    Devuelve el número de tramos generados.
+    """
+    tramos = generar_tramos(entrada, formato, memoria, directorio)
+    n_tramos = len(tramos)
+    fusionar_tramos(tramos, salida, formato_salida, max_fusion, directorio)
+    return n_tramos
+
+
+def _leer_tamano(texto):
+    """Convierte '64M', '1G', '512K' o un número en bytes."""
+    multiplicadores = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    texto = texto.strip().upper()
+    if texto and texto[-1] in multiplicadores:
+        return int(float(texto[:-1]) * multiplicadores[texto[-1]])
+    return int(texto)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ordenamiento externo de un archivo de enteros.")
+    parser.add_argument("entrada")
+    parser.add_argument("salida")
+    parser.add_argument("--formato", choices=["texto", "int32", "int64"], help="formato de la entrada")
+    parser.add_argument("--formato-salida", choices=["texto", "int64"], default="int64")
+    parser.add_argument("--memoria", default="64M", help="presupuesto de memoria, p. ej. 256M o 2G")
+    parser.add_argument("--temporal", help="directorio para los tramos temporales")
+    args = parser.parse_args()
+
+    n = ordenar_archivo(args.entrada, args.salida, args.formato, args.formato_salida,
+                        _leer_tamano(args.memoria), directorio=args.temporal)
+    print(f"Ordenado con {n} tramo(s) -> {args.salida}")
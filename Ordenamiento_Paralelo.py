@@ -0,0 +1,112 @@
+"""
+Ordenamiento_Paralelo.py
+
+Merge sort híbrido y paralelo para listas grandes de enteros (int64).
+
+1) Los datos se copian una sola vez a un bloque de memoria compartida
+   (multiprocessing.shared_memory), así los procesos no reciben ni devuelven
+   los datos por pickle: solo el nombre del bloque y los límites del tramo.
+2) Cada proceso de un ProcessPoolExecutor ordena su tramo en sitio.
+3) Los tramos ordenados se mezclan por parejas en rondas sucesivas, también
+   en paralelo, hasta que queda uno solo.
+4) Los tramos diminutos (y las listas diminutas enteras) se ordenan por
+   inserción; las listas que no compensan el coste de arrancar procesos se
+   ordenan en el propio proceso.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ED5_Ordenamiento import insercion
+
+# hasta este tamaño se usa inserción
+UMBRAL_INSERCION = 32
+# por debajo de este tamaño no compensa arrancar procesos
+UMBRAL_PARALELO = 1 << 20
+
+# -------------------------
+# Trabajo de cada proceso
+# -------------------------
+def _ordenar_tramo(nombre, n, inicio, fin, tipo):
+    """
+    Ordena en sitio arr[inicio:fin] del bloque compartido 'nombre'.
+    Con tipo="stable" NumPy usa Timsort, que detecta que el tramo está
+    formado por dos secuencias ya ordenadas y las mezcla en tiempo lineal.
+    Los tramos de hasta UMBRAL_INSERCION elementos se ordenan por inserción.
+    """
+    shm = shared_memory.SharedMemory(name=nombre)
+    try:
+        arr = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+        if fin - inicio <= UMBRAL_INSERCION:
+            arr[inicio:fin] = insercion(arr[inicio:fin].tolist())
+        else:
+            arr[inicio:fin].sort(kind=tipo)
+        # la vista debe soltarse antes de cerrar el bloque
+        del arr
+    finally:
+        shm.close()
+
+# -------------------------
+# Motor
+# -------------------------
+def _limites(n, partes):
+    paso = -(-n // partes)
+    return [(i, min(i + paso, n)) for i in range(0, n, paso)]
+
+def ordenar_paralelo(datos, procesos=None, umbral_paralelo=UMBRAL_PARALELO):
+    """
+    Devuelve un np.ndarray int64 con los datos ordenados.
+    procesos: número de procesos (por defecto, todos los núcleos).
+    """
+    arr = np.asarray(datos, dtype=np.int64).ravel()
+    n = arr.size
+    if n <= UMBRAL_INSERCION:
+        return np.array(insercion(arr.tolist()), dtype=np.int64)
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or n < umbral_paralelo:
+        return np.sort(arr)
+
+    shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    try:
+        compartido = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+        compartido[:] = arr
+        tramos = _limites(n, procesos)
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            # fase 1: cada proceso ordena un tramo
+            list(ejecutor.map(_ordenar_tramo, *zip(*[(shm.name, n, a, b, "quicksort") for a, b in tramos])))
+            # fase 2: mezcla por parejas de tramos adyacentes, en rondas
+            while len(tramos) > 1:
+                parejas = [(tramos[i][0], tramos[i + 1][1]) for i in range(0, len(tramos) - 1, 2)]
+                sueltos = [tramos[-1]] if len(tramos) % 2 else []
+                list(ejecutor.map(_ordenar_tramo, *zip(*[(shm.name, n, a, b, "stable") for a, b in parejas])))
+                tramos = parejas + sueltos
+        resultado = compartido.copy()
+        del compartido
+    finally:
+        shm.close()
+        shm.unlink()
+    return resultado
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    rng = np.random.default_rng(0)
+    datos = rng.integers(-2**62, 2**62, size=n, dtype=np.int64)
+
+    inicio = time.perf_counter()
+    referencia = np.sort(datos)
+    t_np = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resultado = ordenar_paralelo(datos, umbral_paralelo=0)
+    t_par = time.perf_counter() - inicio
+
+    print(f"n={n}, procesos={os.cpu_count()}")
+    print(f"np.sort (1 núcleo):  {t_np:.3f} s")
+    print(f"ordenar_paralelo:    {t_par:.3f} s  correcto={np.array_equal(resultado, referencia)}")
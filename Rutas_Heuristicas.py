@@ -0,0 +1,361 @@
+"""
+Rutas_Heuristicas.py
+
+Rutas aproximadas para muchos puntos (cientos o miles), donde los métodos
+exactos de ORBEABSD (caminos hamiltonianos y Held-Karp) ya no terminan.
+
+Trabaja sobre una matriz de distancias completa, por ejemplo la que devuelve
+ORBEABSD.floyd_warshall_with_next, y busca un recorrido que visite todos los
+nodos (camino abierto, igual que tsp_path_minimum):
+
+1) Construcción: vecino más cercano y un Christofides simplificado (árbol de
+   expansión mínimo + emparejamiento voraz de los nodos de grado impar +
+   recorrido euleriano con atajos).
+2) Mejora local: 2-opt y Or-opt (mover tramos de 1 a 3 nodos) usando listas
+   de vecinos cercanos y bits "no mirar" (solo se revisan los nodos cuyo
+   entorno cambió).
+3) Mientras quede tiempo, perturbaciones "double bridge" seguidas de mejora
+   local, conservando la mejor ruta encontrada.
+
+Para tratar el camino abierto como un ciclo se añade un nodo ficticio a
+distancia 0 de todos; al cortar el ciclo por él queda el camino.
+
+La matriz debe ser simétrica (2-opt y Or-opt invierten tramos de la ruta).
+Si el grafo no es conexo no hay ruta y se devuelve (None, None), igual que
+tsp_path_minimum.
+"""
+
+import random
+import time
+from collections import deque
+
+import numpy as np
+
+EPS = 1e-9
+# mismo centinela que ORBEABSD: valores >= INF (o np.inf) son "sin camino"
+INF = 10**9
+
+# -------------------------
+# Utilidades
+# -------------------------
+def _matriz_extendida(dist):
+    """Matriz (n+1)x(n+1) con el nodo ficticio n a distancia 0 de todos y "sin camino" = INF."""
+    D = np.asarray(dist, dtype=np.float64)
+    n = D.shape[0]
+    E = np.zeros((n + 1, n + 1))
+    E[:n, :n] = np.where(D < INF, D, INF)
+    return E
+
+def _listas_vecinos(E, k):
+    n = E.shape[0]
+    k = min(k, n - 1)
+    M = E.copy()
+    np.fill_diagonal(M, np.inf)
+    cercanos = np.argpartition(M, k - 1, axis=1)[:, :k]
+    filas = np.arange(n)[:, None]
+    orden = np.argsort(M[filas, cercanos], axis=1)
+    return cercanos[filas, orden].tolist()
+
+def costo_ciclo(tour, d):
+    return sum(d[tour[i - 1]][tour[i]] for i in range(len(tour)))
+
+# -------------------------
+# Construcción
+# -------------------------
+def vecino_mas_cercano(E, inicio=0):
+    n = E.shape[0]
+    visitado = np.zeros(n, dtype=bool)
+    tour = [inicio]
+    visitado[inicio] = True
+    actual = inicio
+    for _ in range(n - 1):
+        fila = np.where(visitado, np.inf, E[actual])
+        actual = int(fila.argmin())
+        visitado[actual] = True
+        tour.append(actual)
+    return tour
+
+def _arbol_minimo(E):
+    """Prim en O(n^2) vectorizado; devuelve la lista de aristas (u, v)."""
+    n = E.shape[0]
+    dentro = np.zeros(n, dtype=bool)
+    dentro[0] = True
+    mejor = E[0].copy()
+    padre = np.zeros(n, dtype=np.int64)
+    aristas = []
+    for _ in range(n - 1):
+        candidatos = np.where(dentro, np.inf, mejor)
+        v = int(candidatos.argmin())
+        aristas.append((int(padre[v]), v))
+        dentro[v] = True
+        mas_cerca = E[v] < mejor
+        mejor = np.where(mas_cerca, E[v], mejor)
+        padre = np.where(mas_cerca, v, padre)
+    return aristas
+
+def christofides_simplificado(E):
+    n = E.shape[0]
+    aristas = _arbol_minimo(E)
+    grado = np.zeros(n, dtype=np.int64)
+    for u, v in aristas:
+        grado[u] += 1
+        grado[v] += 1
+    impares = np.flatnonzero(grado % 2)
+    # emparejamiento voraz por distancia creciente (Christofides usa el óptimo)
+    sub = E[np.ix_(impares, impares)]
+    iu, ju = np.triu_indices(impares.size, k=1)
+    libre = np.ones(impares.size, dtype=bool)
+    pendientes = impares.size
+    for t in np.argsort(sub[iu, ju], kind="stable").tolist():
+        if not pendientes:
+            break
+        a, b = iu[t], ju[t]
+        if libre[a] and libre[b]:
+            libre[a] = libre[b] = False
+            pendientes -= 2
+            aristas.append((int(impares[a]), int(impares[b])))
+
+    # recorrido euleriano (Hierholzer) y atajos sobre nodos repetidos
+    adyacentes = [[] for _ in range(n)]
+    for idx, (u, v) in enumerate(aristas):
+        adyacentes[u].append((v, idx))
+        adyacentes[v].append((u, idx))
+    usada = [False] * len(aristas)
+    pila, euler = [0], []
+    while pila:
+        u = pila[-1]
+        while adyacentes[u] and usada[adyacentes[u][-1][1]]:
+            adyacentes[u].pop()
+        if adyacentes[u]:
+            v, idx = adyacentes[u].pop()
+            usada[idx] = True
+            pila.append(v)
+        else:
+            euler.append(pila.pop())
+    visto = [False] * n
+    tour = []
+    for u in euler:
+        if not visto[u]:
+            visto[u] = True
+            tour.append(u)
+    return tour
+
+# -------------------------
+# Mejora local: 2-opt y Or-opt
+# -------------------------
+def _invertir(tour, pos, i, j):
+    """Invierte el tramo cíclico de posiciones i..j (o su complementario, si es más corto)."""
+    n = len(tour)
+    largo = (j - i) % n + 1
+    if 2 * largo > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        largo = n - largo
+    for _ in range(largo // 2):
+        a, b = tour[i], tour[j]
+        tour[i], tour[j] = b, a
+        pos[b], pos[a] = i, j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+def _mover_tramo(tour, pos, i, largo, despues_de, invertido):
+    """Saca el tramo de 'largo' nodos que empieza en la posición i y lo pone tras el nodo despues_de."""
+    rotado = tour[i:] + tour[:i]
+    tramo, resto = rotado[:largo], rotado[largo:]
+    if invertido:
+        tramo.reverse()
+
+    k = resto.index(despues_de) + 1
+    tour[:] = resto[:k] + tramo + resto[k:]
+    for p, c in enumerate(tour):
+        pos[c] = p
+
+def _dos_opt(a, tour, pos, d, vecinos):
+    """Intenta una mejora 2-opt con a como extremo; devuelve los nodos afectados o None."""
+    n = len(tour)
+    i = pos[a]
+    for sentido in (1, -1):
+        b = tour[(i + sentido) % n]
+        d_ab = d[a][b]
+        for c in vecinos[a]:
+            d_ac = d[a][c]
+            if d_ac >= d_ab:
+                break
+            j = pos[c]
+            e = tour[(j + sentido) % n]
+            if e == a or c == b:
+                continue
+            delta = d_ac + d[b][e] - d_ab - d[c][e]
+            if delta < -EPS:
+                if sentido == 1:
+                    _invertir(tour, pos, (i + 1) % n, j)
+                else:
+                    _invertir(tour, pos, i, (j - 1) % n)
+                return (a, b, c, e)
+    return None
+
+def _or_opt(a, tour, pos, d, vecinos):
+    """Intenta mover un tramo de 1 a 3 nodos que empieza en a junto a uno de sus vecinos cercanos."""
+    n = len(tour)
+    i = pos[a]
+    p = tour[(i - 1) % n]
+    for largo in (1, 2, 3):
+        if n < largo + 3:
+            break
+        e = tour[(i + largo - 1) % n]
+        f = tour[(i + largo) % n]
+        ganancia = d[p][a] + d[e][f] - d[p][f]
+        if ganancia <= EPS:
+            continue
+        for c in vecinos[a]:
+            if d[a][c] >= ganancia:
+                break
+            if (pos[c] - i) % n < largo:
+                continue
+            # a junto a c por detrás: c - a ... e - g
+            g = tour[(pos[c] + 1) % n]
+            if g != a:
+                delta = d[c][a] + d[e][g] - d[c][g] - ganancia
+                if delta < -EPS:
+                    _mover_tramo(tour, pos, i, largo, c, False)
+                    return (p, a, e, f, c, g)
+            # a junto a c por delante: h - e ... a - c
+            h = tour[(pos[c] - 1) % n]
+            if (pos[h] - i) % n >= largo:
+                delta = d[h][e] + d[a][c] - d[h][c] - ganancia
+                if delta < -EPS:
+                    _mover_tramo(tour, pos, i, largo, h, True)
+                    return (p, a, e, f, c, h)
+    return None
+
+def busqueda_local(tour, d, vecinos, limite=None, activos=None):
+    """Aplica 2-opt y Or-opt hasta que no haya mejoras (o se acabe el tiempo). Modifica tour."""
+    n = len(tour)
+    pos = [0] * n
+    for p, c in enumerate(tour):
+        pos[c] = p
+    cola = deque(tour if activos is None else activos)
+    en_cola = [False] * n
+    for c in cola:
+        en_cola[c] = True
+    pasos = 0
+    while cola:
+        pasos += 1
+        if limite is not None and pasos % 256 == 0 and time.perf_counter() > limite:
+            break
+        a = cola.popleft()
+        en_cola[a] = False
+        afectados = _dos_opt(a, tour, pos, d, vecinos) or _or_opt(a, tour, pos, d, vecinos)
+        if afectados:
+            for c in afectados:
+                if not en_cola[c]:
+                    en_cola[c] = True
+                    cola.append(c)
+    return tour
+
+def _double_bridge(tour, rnd):
+    n = len(tour)
+    a, b, c = sorted(rnd.sample(range(1, n), 3))
+    nuevo = tour[:a] + tour[b:c] + tour[a:b] + tour[c:]
+    return nuevo, [tour[a - 1], tour[a], tour[b - 1], tour[b], tour[c - 1], tour[c % n]]
+
+# -------------------------
+# API
+# -------------------------
+def ruta_heuristica(nodes, dist, tiempo_max=1.0, construccion="mejor", vecinos_k=10, semilla=0):
+    """
+    Devuelve (costo, ruta) de un camino que visita todos los nodos, o
+    (None, None) si no lo hay porque el grafo no es conexo.
+    dist: matriz n x n simétrica (listas o np.ndarray); INF o np.inf representa "sin camino".
+    tiempo_max: presupuesto en segundos; al agotarse se devuelve la mejor ruta hallada.
+    construccion: "vecino", "christofides" o "mejor" (ambas y se queda con la mejor).
+    """
+    n = len(nodes)
+    if n == 0:
+        return None, None
+    if n == 1:
+        return 0, [nodes[0]]
+    limite = time.perf_counter() + tiempo_max
+    rnd = random.Random(semilla)
+    E = _matriz_extendida(dist)
+    if not np.allclose(E, E.T, rtol=1e-12, atol=0):
+        raise ValueError("La matriz de distancias debe ser simétrica: 2-opt y Or-opt invierten tramos de la ruta.")
+    ficticio = n
+    d = E.tolist()
+    vecinos = _listas_vecinos(E, vecinos_k)
+
+    candidatos = []
+    if construccion in ("vecino", "mejor"):
+        candidatos.append(vecino_mas_cercano(E, ficticio))
+    if construccion in ("christofides", "mejor"):
+        # el nodo ficticio convertiría el árbol en una estrella: se construye
+        # el ciclo sin él y se inserta en su arista más larga
+        ciclo = christofides_simplificado(E[:n, :n])
+        k = max(range(n), key=lambda t: d[ciclo[t - 1]][ciclo[t]])
+        candidatos.append(ciclo[k:] + ciclo[:k] + [ficticio])
+    if not candidatos:
+        raise ValueError(f"Construcción desconocida: '{construccion}'. Usa 'vecino', 'christofides' o 'mejor'.")
+
+    mejor, mejor_costo = None, float("inf")
+    for tour in candidatos:
+        busqueda_local(tour, d, vecinos, limite)
+        c = costo_ciclo(tour, d)
+        if c < mejor_costo:
+            mejor, mejor_costo = tour, c
+
+    # búsqueda local iterada mientras quede tiempo
+    if n >= 8:
+        while time.perf_counter() < limite:
+            tour, tocados = _double_bridge(mejor, rnd)
+            busqueda_local(tour, d, vecinos, limite, activos=tocados)
+            c = costo_ciclo(tour, d)
+            if c < mejor_costo - EPS:
+                mejor, mejor_costo = tour, c
+
+    k = mejor.index(ficticio)
+    camino = mejor[k + 1:] + mejor[:k]
+    D = np.asarray(dist)
+    tramos = [D[camino[t]][camino[t + 1]] for t in range(n - 1)]
+    if not all(w < INF for w in tramos):
+        return None, None
+    costo = sum(tramos)
+    costo = int(costo) if np.issubdtype(D.dtype, np.integer) or float(costo).is_integer() else float(costo)
+    return costo, [nodes[i] for i in camino]
+
+def comparar_con_exacto(nodes, dist, **opciones):
+    """
+    Ejecuta la heurística y el Held-Karp exacto (ORBEABSD.tsp_path_minimum)
+    y devuelve un diccionario con ambos costos y la diferencia relativa (%).
+    Solo tiene sentido en instancias pequeñas (unos 20 nodos como máximo).
+    """
+    from ORBEABSD import tsp_path_minimum
+
+    costo_h, ruta_h = ruta_heuristica(nodes, dist, **opciones)
+    costo_e, ruta_e = tsp_path_minimum(nodes, dist)
+    gap = 100.0 * (costo_h - costo_e) / costo_e if costo_e else 0.0
+    return {"heuristica": costo_h, "ruta_heuristica": ruta_h,
+            "exacto": costo_e, "ruta_exacta": ruta_e, "gap_pct": gap}
+
+
+if __name__ == "__main__":
+    from ORBEABSD import STATES, floyd_warshall_with_next
+
+    dist, _, _ = floyd_warshall_with_next(STATES)
+    r = comparar_con_exacto(STATES, dist, tiempo_max=0.2)
+    print("Estados de ORBEABSD:")
+    print(f"  heurística: {r['heuristica']} km  {' -> '.join(r['ruta_heuristica'])}")
+    print(f"  exacto:     {r['exacto']} km  {' -> '.join(r['ruta_exacta'])}")
+    print(f"  gap: {r['gap_pct']:.2f}%")
+
+    rng = np.random.default_rng(0)
+    for n in (12, 16):
+        puntos = rng.random((n, 2)) * 1000
+        D = np.rint(np.hypot(*(puntos[:, None, :] - puntos[None, :, :]).transpose(2, 0, 1))).astype(np.int64)
+        r = comparar_con_exacto(list(range(n)), D, tiempo_max=0.2)
+        print(f"Aleatorio n={n}: heurística={r['heuristica']} exacto={r['exacto']} gap={r['gap_pct']:.2f}%")
+
+    n = 1000
+    puntos = rng.random((n, 2)) * 1000
+    D = np.hypot(*(puntos[:, None, :] - puntos[None, :, :]).transpose(2, 0, 1))
+    inicio = time.perf_counter()
+    costo, ruta = ruta_heuristica(list(range(n)), D, tiempo_max=0.8)
+    print(f"Aleatorio n={n}: costo={costo:.1f} en {time.perf_counter() - inicio:.2f} s")
@@ -1,21 +1,214 @@
-def warshall(A):
-    n = len(A)
-    R = [fila[:] for fila in A]
+"""
+Warshall.py
 
-    for k in range(n):
-        for i in range(n):
-            for j in range(n):
-                R[i][j] = R[i][j] or (R[i][k] and R[k][j])
+Cierre transitivo (matriz de alcanzabilidad) con filas empaquetadas en bits.
+
+Cada fila i se guarda como un bitset (bit j = 1 si hay camino de i a j), de
+modo que el paso k de Warshall queda en "a toda fila con el bit k encendido
+se le hace OR con la fila k":
+- cierre_bits: filas como enteros de Python (OR de enteros grandes en C);
+- cierre_numpy: filas como np.uint64, con el OR de todas las filas de un
+  paso k en una sola operación;
+- cierre_por_componentes: Tarjan agrupa las componentes fuertemente conexas
+  y el cierre se calcula sobre el DAG de componentes en orden topológico
+  inverso, O(m * n / 64). Es el modo para grafos grandes y dispersos (grafos
+  de dependencias de decenas de miles de nodos).
+
+warshall mantiene la interfaz original (matriz 0/1 en listas).
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# -------------------------
+# Conversión
+# -------------------------
+def matriz_a_bits(A):
+    """Cada fila 0/1 de A como un entero con el bit j encendido si A[i][j]."""
+    filas = []
+    for fila in A:
+        bits = 0
+        for j, x in enumerate(fila):
+            if x:
+                bits |= 1 << j
+        filas.append(bits)
+    return filas
 
+def bits_a_matriz(filas, n):
+    return [[(b >> j) & 1 for j in range(n)] for b in filas]
+
+def sucesores_desde_matriz(A):
+    return [[j for j, x in enumerate(fila) if x] for fila in A]
+
+def alcanzable(filas, i, j):
+    """True si j es alcanzable desde i según el cierre 'filas' (enteros o np.uint64)."""
+    if np is not None and isinstance(filas, np.ndarray):
+        return bool((int(filas[i, j >> 6]) >> (j & 63)) & 1)
+    return bool((filas[i] >> j) & 1)
+
+# -------------------------
+# Warshall con bitsets
+# -------------------------
+def cierre_bits(filas):
+    """Warshall sobre filas en enteros de Python; devuelve una lista nueva."""
+    R = list(filas)
+    for k in range(len(R)):
+        bit = 1 << k
+        fila_k = R[k]
+        for i, fila in enumerate(R):
+            if fila & bit:
+                R[i] = fila | fila_k
     return R
 
-# 1 = camino, 0 = no camino
-matriz = [
-    [1, 1, 0],
-    [0, 1, 1],
-    [0, 0, 1]
-]
+def empaquetar(A):
+    """Matriz booleana n x n a np.uint64 de forma (n, ceil(n/64)); bit j de la fila i = A[i][j]."""
+    M = np.asarray(A, dtype=bool)
+    n = M.shape[0]
+    palabras = (n + 63) // 64
+    relleno = np.zeros((n, palabras * 64), dtype=bool)
+    relleno[:, :n] = M
+    return np.packbits(relleno, axis=1, bitorder="little").view(np.dtype("<u8"))
+
+def desempaquetar(R, n):
+    return np.unpackbits(R.view(np.uint8), axis=1, bitorder="little")[:, :n]
+
+def cierre_numpy(A):
+    """Warshall con filas np.uint64; acepta una matriz 0/1 o una ya empaquetada."""
+    R = np.array(A, copy=True) if getattr(A, "dtype", None) == np.dtype("<u8") else empaquetar(A)
+    n = R.shape[0]
+    uno = np.uint64(1)
+    for k in range(n):
+        palabra, bit = divmod(k, 64)
+        filas = np.flatnonzero((R[:, palabra] >> np.uint64(bit)) & uno)
+        if filas.size:
+            R[filas] |= R[k]
+    return R
+
+# -------------------------
+# Componentes fuertemente conexas (Tarjan) y cierre sobre el DAG
+# -------------------------
+def componentes_fuertes(sucesores):
+    """
+    Tarjan iterativo. Devuelve (comp, componentes): comp[v] es el número de
+    componente de v y componentes la lista de miembros de cada una, en orden
+    topológico inverso (una componente aparece después de todas las que alcanza).
+    """
+    n = len(sucesores)
+    indice = [-1] * n
+    bajo = [0] * n
+    en_pila = [False] * n
+    pila = []
+    comp = [-1] * n
+    componentes = []
+    contador = 0
+    for s in range(n):
+        if indice[s] != -1:
+            continue
+        indice[s] = bajo[s] = contador
+        contador += 1
+        pila.append(s)
+        en_pila[s] = True
+        llamadas = [(s, iter(sucesores[s]))]
+        while llamadas:
+            v, it = llamadas[-1]
+            bajo_v = bajo[v]
+            for w in it:
+                if indice[w] == -1:
+                    indice[w] = bajo[w] = contador
+                    contador += 1
+                    pila.append(w)
+                    en_pila[w] = True
+                    llamadas.append((w, iter(sucesores[w])))
+                    break
+                if en_pila[w] and indice[w] < bajo_v:
+                    bajo_v = indice[w]
+            else:
+                bajo[v] = bajo_v
+                llamadas.pop()
+                if llamadas:
+                    u = llamadas[-1][0]
+                    if bajo_v < bajo[u]:
+                        bajo[u] = bajo_v
+                if bajo_v == indice[v]:
+                    miembros = []
+                    while True:
+                        w = pila.pop()
+                        en_pila[w] = False
+                        comp[w] = len(componentes)
+                        miembros.append(w)
+                        if w == v:
+                            break
+                    componentes.append(miembros)
+                continue
+            bajo[v] = bajo_v
+    return comp, componentes
+
+def cierre_por_componentes(sucesores):
+    """
+    Cierre transitivo de un grafo dado por listas de sucesores (índices).
+    Devuelve una lista de enteros (bitsets), uno por nodo; los nodos de una
+    misma componente comparten el mismo objeto.
+    """
+    comp, componentes = componentes_fuertes(sucesores)
+    # hacia[c]: nodos de c más todo lo que alcanza c (lo que gana quien llega a c)
+    hacia = []
+    alcance = []
+    for c, miembros in enumerate(componentes):
+        propios = 0
+        for v in miembros:
+            propios |= 1 << v
+        r = 0
+        for v in miembros:
+            for w in sucesores[v]:
+                cw = comp[w]
+                r |= propios if cw == c else hacia[cw]
+        alcance.append(r)
+        hacia.append(propios | r)
+    return [alcance[comp[v]] for v in range(len(sucesores))]
+
+# -------------------------
+# Interfaz original
+# -------------------------
+def warshall(A, modo="bits"):
+    """
+    Cierre transitivo de la matriz 0/1 A; devuelve una matriz 0/1 en listas.
+    modo: "bits" (enteros de Python), "numpy" (np.uint64) o "componentes" (Tarjan).
+    """
+    n = len(A)
+    if modo == "bits":
+        return bits_a_matriz(cierre_bits(matriz_a_bits(A)), n)
+    if modo == "numpy":
+        return desempaquetar(cierre_numpy(A), n).tolist()
+    if modo == "componentes":
+        return bits_a_matriz(cierre_por_componentes(sucesores_desde_matriz(A)), n)
+    raise ValueError(f"Modo desconocido: '{modo}'. Usa 'bits', 'numpy' o 'componentes'.")
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # 1 = camino, 0 = no camino
+    matriz = [
+        [1, 1, 0],
+        [0, 1, 1],
+        [0, 0, 1]
+    ]
+
+    res = warshall(matriz)
+    for fila in res:
+        print(fila)
 
-res = warshall(matriz)
-for fila in res:
-    print(fila)
+    # grafo de dependencias grande: mayormente acíclico, con algunos ciclos
+    n = 50_000
+    rnd = random.Random(0)
+    sucesores = [[rnd.randrange(v + 1, n) for _ in range(3)] if v < n - 1 else [] for v in range(n)]
+    for _ in range(200):
+        v = rnd.randrange(n)
+        sucesores[v].append(rnd.randrange(n))
+    inicio = time.perf_counter()
+    cierre = cierre_por_componentes(sucesores)
+    print(f"Cierre de {n} nodos por componentes: {time.perf_counter() - inicio:.2f} s, "
+          f"el nodo 0 alcanza {bin(cierre[0]).count('1')} nodos")
@@ -0,0 +1,48 @@
+"""
+Pruebas de Floyd.py: la versión por bloques debe dar las mismas distancias
+y los mismos caminos que floyd_warshall_np, también con aristas de peso 0.
+
+    python -m pytest test_floyd.py
+"""
+
+import numpy as np
+import pytest
+
+from Floyd import INF, floyd_warshall_bloques, floyd_warshall_np, matriz_distancias, reconstruir_camino
+
+def _longitud(D, camino):
+    return sum(D[a, b] for a, b in zip(camino, camino[1:]))
+
+def _comparar_caminos(D, bloque, hilos):
+    dist, sig = floyd_warshall_np(D, con_siguiente=True)
+    dist_b, sig_b = floyd_warshall_bloques(D, bloque=bloque, hilos=hilos, con_siguiente=True)
+    assert np.array_equal(dist, dist_b)
+    n = D.shape[0]
+    for i in range(n):
+        for j in range(n):
+            camino = reconstruir_camino(sig_b, i, j)
+            assert camino == reconstruir_camino(sig, i, j)
+            if camino is not None:
+                assert _longitud(D, camino) == dist_b[i, j]
+
+def test_aristas_de_peso_cero():
+    # con estos pesos la versión por bloques dejaba el ciclo 1 -> 4 -> 1 en 'siguiente'
+    g = [[0, 1, 2, 1, INF, INF],
+         [INF, 0, INF, INF, 0, 0],
+         [0, 2, 0, INF, 0, 0],
+         [INF, INF, 0, 0, 1, INF],
+         [2, 0, 0, INF, 0, INF],
+         [0, INF, INF, 0, INF, 0]]
+    D = matriz_distancias(g, entera=True)
+    _, sig = floyd_warshall_bloques(D, bloque=2, hilos=1, con_siguiente=True)
+    assert reconstruir_camino(sig, 1, 3) == [1, 5, 3]
+    _comparar_caminos(D, bloque=2, hilos=1)
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_bloques_igual_que_vectorizado(semilla):
+    rng = np.random.default_rng(semilla)
+    n = int(rng.integers(5, 40))
+    W = rng.integers(0, 4, (n, n)).astype(np.float64)
+    W[rng.random((n, n)) < 0.5] = INF
+    D = matriz_distancias(W, entera=bool(semilla % 2))
+    _comparar_caminos(D, bloque=int(rng.integers(1, n + 1)), hilos=2)
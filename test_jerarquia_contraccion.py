@@ -0,0 +1,74 @@
+"""
+Pruebas de Jerarquia_Contraccion.py: las distancias y rutas de la jerarquía
+deben coincidir con Dijkstra.dijkstra, también tras guardar y cargar.
+
+    python -m pytest test_jerarquia_contraccion.py
+"""
+
+import random
+
+import pytest
+
+from Dijkstra import INF, dijkstra
+from Jerarquia_Contraccion import JerarquiaContraccion, construir_jerarquia, verificar
+from ORBEABSD import GRAPH
+
+def _cuadricula(lado, semilla=0, dirigida=False):
+    """Red de carreteras en cuadrícula con nodos (fila, columna) y pesos al azar."""
+    rnd = random.Random(semilla)
+    red = {(i, j): {} for i in range(lado) for j in range(lado)}
+    for i in range(lado):
+        for j in range(lado):
+            for a, b in ((i + 1, j), (i, j + 1)):
+                if a < lado and b < lado:
+                    red[(i, j)][(a, b)] = rnd.randint(10, 100)
+                    red[(a, b)][(i, j)] = rnd.randint(10, 100) if dirigida else red[(i, j)][(a, b)]
+    return red
+
+def _enteros(red):
+    """La misma red con nodos numerados 0..n-1."""
+    ids = {v: i for i, v in enumerate(red)}
+    return {ids[u]: {ids[v]: w for v, w in ady.items()} for u, ady in red.items()}
+
+GRAFOS = {
+    "orbeabsd": GRAPH,
+    "cuadricula": _cuadricula(15),
+    "cuadricula_dirigida": _cuadricula(15, semilla=1, dirigida=True),
+    "cuadricula_enteros": _enteros(_cuadricula(12, semilla=2)),
+}
+
+def _distancias_iguales(jerarquia, grafo, pares, semilla):
+    rnd = random.Random(semilla)
+    nodos = list(grafo)
+    listas = {u: list(ady.items()) for u, ady in grafo.items()}
+    for _ in range(pares):
+        s, t = rnd.choice(nodos), rnd.choice(nodos)
+        assert jerarquia.distancia(s, t) == pytest.approx(dijkstra(listas, s).get(t, INF)), (s, t)
+
+@pytest.fixture(scope="module", params=list(GRAFOS))
+def caso(request):
+    grafo = GRAFOS[request.param]
+    return grafo, construir_jerarquia(grafo)
+
+def test_distancias_como_dijkstra(caso):
+    grafo, ch = caso
+    _distancias_iguales(ch, grafo, pares=200, semilla=0)
+
+def test_rutas_como_dijkstra(caso):
+    grafo, ch = caso
+    assert verificar(ch, grafo, pares=100, semilla=1) == []
+
+def test_guardar_y_cargar(caso, tmp_path):
+    grafo, ch = caso
+    ruta = tmp_path / "jerarquia.npz"
+    ch.guardar(ruta)
+    cargada = JerarquiaContraccion.cargar(ruta)
+    assert cargada.nombres == ch.nombres
+    _distancias_iguales(cargada, grafo, pares=200, semilla=2)
+    assert verificar(cargada, grafo, pares=50, semilla=3) == []
+
+def test_sin_camino():
+    ch = construir_jerarquia({"a": {"b": 1}, "b": {}, "c": {}})
+    assert ch.distancia("b", "a") == INF
+    assert ch.ruta("a", "c") == (INF, None)
+    assert ch.ruta("a", "b") == (1, ["a", "b"])